@@ -28,8 +28,13 @@ from .interface.transaction import Transaction
 from .interface.result import Result
 from .interface.relationship import Relationship
 from .interface.node import Node
-from .interface.exceptions import QueryFailed
+from .interface.exceptions import QueryFailed, SessionLimitReached, PoolAcquireTimeout
 from .empty import EmptyResult
+from .coalescer import WriteCoalescer
+from .cache import QueryCache, QueryCacheStats
+from .singleflight import SingleFlight, SingleFlightStats
+from .metrics import Metrics, InMemoryMetrics
+from .tracing import Tracer, InMemoryTracer
 from .config import Config
 
 try:
@@ -44,6 +49,18 @@ except ImportError:
     pass
 
 
+try:
+    from . import asyncneo4j  # noqa: F401
+except ImportError:
+    pass
+
+
+try:
+    from . import asyncagensgraph  # noqa: F401
+except ImportError:
+    pass
+
+
 __all__ = [
     'Driver',
     'Session',
@@ -52,6 +69,17 @@ __all__ = [
     'Relationship',
     'Node',
     'EmptyResult',
+    'WriteCoalescer',
+    'QueryCache',
+    'QueryCacheStats',
+    'SingleFlight',
+    'SingleFlightStats',
+    'Metrics',
+    'InMemoryMetrics',
+    'Tracer',
+    'InMemoryTracer',
     'QueryFailed',
+    'SessionLimitReached',
+    'PoolAcquireTimeout',
     'Config'
 ]
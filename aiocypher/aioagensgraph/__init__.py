@@ -32,3 +32,17 @@ except ImportError:
     pass
 else:
     __all__.append('Driver')
+
+try:
+    from .bulk import BulkVertex, BulkEdge, BulkLoadStats  # noqa: F401
+except ImportError:
+    pass
+else:
+    __all__.extend(['BulkVertex', 'BulkEdge', 'BulkLoadStats'])
+
+try:
+    from .pool import PoolSettings, PoolStats  # noqa: F401
+except ImportError:
+    pass
+else:
+    __all__.extend(['PoolSettings', 'PoolStats'])
@@ -0,0 +1,226 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import io
+import json
+from functools import partial
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, List, Mapping, NamedTuple, Set, Tuple, TypeVar,
+    Union
+)
+
+import psycopg2
+from psycopg2 import sql
+
+from ..internal.agensgraph import CREATE_GRAPH, SET_GRAPH_PATH
+
+
+__all__ = [
+    "DEFAULT_BULK_BATCH_SIZE",
+    "BulkVertex",
+    "BulkEdge",
+    "BulkLoadStats",
+    "bulk_load"
+]
+
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+DEFAULT_BULK_BATCH_SIZE = 10000
+
+
+class BulkVertex (NamedTuple):
+    label: str
+    properties: Mapping[str, Any]
+
+
+class BulkEdge (NamedTuple):
+    """An edge to be loaded. Its endpoints are given as (label, value) pairs, and are matched to the vertex with
+    that label whose key property has that value.
+    """
+    label: str
+    start: Tuple[str, Any]
+    end: Tuple[str, Any]
+    properties: Mapping[str, Any] = {}
+
+
+class BulkLoadStats (NamedTuple):
+    vertices: int
+    edges: int
+
+
+async def _batches(items: Union[AsyncIterable[T], Iterable[T]], batch_size: int) -> AsyncIterator[List[T]]:
+    batch: List[T] = []
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    else:
+        for item in items:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def _copy_text(value: Any) -> str:
+    # json.dumps escapes all control characters, so only backslashes need escaping for COPY's text format
+    return json.dumps(value).replace('\\', '\\\\')
+
+
+def _key_text(value: Any) -> str:
+    # The form of the value which the ->> operator produces
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def _group_by_label(items: Iterable[T], label: Callable[[T], str]) -> Dict[str, List[T]]:
+    groups: Dict[str, List[T]] = {}
+    for item in items:
+        groups.setdefault(label(item), []).append(item)
+    return groups
+
+
+class _Loader (object):
+    """Runs on a worker thread, on a synchronous psycopg2 connection, because aiopg does not support COPY.
+    Everything is done in a single transaction.
+    """
+    def __init__(self, connection: 'psycopg2.extensions.connection', graph: str, key: str):
+        self._connection = connection
+        self._graph = graph
+        self._key = key
+        self._labels: Set[Tuple[str, str]] = set()
+        self._indexed: Set[str] = set()
+
+        with self._connection.cursor() as cursor:
+            cursor.execute(sql.SQL(CREATE_GRAPH).format(sql.Identifier(graph)))
+            cursor.execute(sql.SQL(SET_GRAPH_PATH).format(sql.Identifier(graph)))
+
+    def _table(self, label: str) -> sql.Composable:
+        return sql.SQL("{}.{}").format(sql.Identifier(self._graph), sql.Identifier(label))
+
+    def _create_label(self, cursor: 'psycopg2.extensions.cursor', kind: str, label: str) -> None:
+        if (kind, label) not in self._labels:
+            cursor.execute(sql.SQL(f"CREATE {kind} IF NOT EXISTS {{}}").format(sql.Identifier(label)))
+            self._labels.add((kind, label))
+
+    def copy_vertices(self, vertices: List[BulkVertex]) -> int:
+        with self._connection.cursor() as cursor:
+            for (label, group) in _group_by_label(vertices, lambda v: v.label).items():
+                self._create_label(cursor, "VLABEL", label)
+                data = io.StringIO("".join(_copy_text(v.properties) + "\n" for v in group))
+                statement = sql.SQL("COPY {} (properties) FROM STDIN").format(self._table(label))
+                cursor.copy_expert(statement.as_string(cursor), data)
+        return len(vertices)
+
+    def _index(self, cursor: 'psycopg2.extensions.cursor', label: str) -> None:
+        """Indexes the key property of a vertex label, so that looking up endpoints does not scan every vertex of
+        the label for each batch of edges. Done once all of the vertices have been loaded, and then analysed so that
+        the planner knows how many there are.
+        """
+        if label in self._indexed:
+            return
+        cursor.execute(
+            sql.SQL("CREATE INDEX IF NOT EXISTS {} ON {} ((properties->>{}))")
+            .format(sql.Identifier(f"{label}_{self._key}_bulk_key"), self._table(label), sql.Literal(self._key)))
+        cursor.execute(sql.SQL("ANALYZE {}").format(self._table(label)))
+        self._indexed.add(label)
+
+    def _resolve(
+        self,
+        cursor: 'psycopg2.extensions.cursor',
+        endpoints: Set[Tuple[str, Any]]
+    ) -> Dict[Tuple[str, str], str]:
+        """Looks up the ids of a batch of endpoints, with one indexed query per label."""
+        ids: Dict[Tuple[str, str], str] = {}
+        for (label, group) in _group_by_label(endpoints, lambda e: e[0]).items():
+            self._index(cursor, label)
+            cursor.execute(
+                sql.SQL("SELECT properties->>%(key)s, id::text FROM {} WHERE properties->>%(key)s = ANY(%(values)s)")
+                .format(self._table(label)),
+                {'key': self._key, 'values': [_key_text(value) for (_, value) in group]})
+            for (value, id_) in cursor.fetchall():
+                ids[(label, value)] = id_
+        return ids
+
+    def copy_edges(self, edges: List[BulkEdge]) -> int:
+        with self._connection.cursor() as cursor:
+            ids = self._resolve(cursor, {e.start for e in edges} | {e.end for e in edges})
+
+            def __id(endpoint: Tuple[str, Any]) -> str:
+                try:
+                    return ids[(endpoint[0], _key_text(endpoint[1]))]
+                except KeyError:
+                    raise ValueError(f"No {endpoint[0]} vertex has {self._key} = {endpoint[1]!r}") from None
+
+            for (label, group) in _group_by_label(edges, lambda e: e.label).items():
+                self._create_label(cursor, "ELABEL", label)
+                data = io.StringIO("".join(
+                    f"{__id(e.start)}\t{__id(e.end)}\t{_copy_text(e.properties)}\n" for e in group))
+                statement = sql.SQL('COPY {} (start, "end", properties) FROM STDIN').format(self._table(label))
+                cursor.copy_expert(statement.as_string(cursor), data)
+        return len(edges)
+
+
+async def bulk_load(
+    dsn: str,
+    graph: str,
+    vertices: Union[AsyncIterable[BulkVertex], Iterable[BulkVertex]] = (),
+    edges: Union[AsyncIterable[BulkEdge], Iterable[BulkEdge]] = (),
+    key: str = "id",
+    batch_size: int = DEFAULT_BULK_BATCH_SIZE
+) -> BulkLoadStats:
+    """Loads vertices and then edges into a graph using COPY ... FROM STDIN, in a single transaction on a
+    connection of its own.
+
+    The inputs are read batch_size at a time, so they can be larger than memory. The endpoints of each batch of
+    edges are looked up together, by the value of their key property, and must already exist when that batch is
+    loaded. To make those lookups cheap, an index on the key property of each vertex label which edges refer to is
+    created, named <label>_<key>_bulk_key, and left in place afterwards.
+
+    :returns: The numbers of vertices and edges loaded
+    """
+    loop = asyncio.get_running_loop()
+
+    async def __run(f: Callable[..., R], *args) -> R:
+        return await loop.run_in_executor(None, partial(f, *args))
+
+    connection = await __run(psycopg2.connect, dsn)
+    try:
+        loader = await __run(_Loader, connection, graph, key)
+        vertex_count = 0
+        async for vertex_batch in _batches(vertices, batch_size):
+            vertex_count += await __run(loader.copy_vertices, vertex_batch)
+        edge_count = 0
+        async for edge_batch in _batches(edges, batch_size):
+            edge_count += await __run(loader.copy_edges, edge_batch)
+        await __run(connection.commit)
+    except BaseException:
+        try:
+            await __run(connection.rollback)
+        except Exception:
+            pass
+        raise
+    finally:
+        await __run(connection.close)
+    return BulkLoadStats(vertex_count, edge_count)
@@ -17,43 +17,73 @@
 
 from ..interface.driver import Driver as AbstractDriver
 
-from typing import Tuple, AsyncContextManager, Optional
+from typing import Tuple, AsyncContextManager, AsyncIterable, Iterable, Optional, Union, Dict
 
 from urllib.parse import urlparse
 import re
 
 import aiopg
 import agensgraph as ag  # noqa: F401
+from psycopg2.extensions import make_dsn
 
 from async_exit_stack import AsyncExitStack
 
 from .session import Session
+from .statements import StatementStats
+from .bulk import BulkVertex, BulkEdge, BulkLoadStats, DEFAULT_BULK_BATCH_SIZE, bulk_load
+from .state import DriverState
+from .pool import PoolSettings, PoolStats, pool_settings
 from ..config import Config
+from ..internal.postgres import with_statement_timeout
+from ..metrics import Metrics
 
 
 def is_agensgraph_address(config: Config) -> bool:
     address = config.address
-    return bool(re.match(r'^postgresql(\+.+)?$', urlparse(address).scheme))
+    scheme = urlparse(address).scheme
+    # The scheme "postgresql+psycopg" is handled by the asyncagensgraph Driver instead
+    return bool(re.match(r'^postgresql(\+.+)?$', scheme)) and scheme != 'postgresql+psycopg'
 
 
-def _construct_dsn(address: str, auth: Tuple[str, str]) -> str:
+def _construct_dsn(
+    address: str,
+    auth: Tuple[str, str],
+    settings: PoolSettings = PoolSettings(),
+    options: Dict[str, str] = {}
+) -> str:
     addr = urlparse(address)
     hostname = addr.hostname or '127.0.0.1'
     port = addr.port or '5432'
-    return f"host={hostname} user={auth[0]} password={auth[1]} port={port}"
+    options = with_statement_timeout(options, settings.statement_timeout)
+    return make_dsn(
+        host=hostname, user=auth[0], password=auth[1], port=port, dbname=settings.dbname, **options)
 
 
 @AbstractDriver.register_concrete(is_agensgraph_address)
 class Driver (AbstractDriver):
     """This class encapsulates an agensgraph db driver
+
+    If statement_cache_size is greater than 0 then every query run through Transaction.run is PREPAREd on the
+    connection which runs it, and subsequently EXECUTEd, with up to that many statements kept prepared on each
+    pooled connection. This is off by default since every prepared statement holds resources on the server.
+
+    The connection pool is configured by the fields of PoolSettings (minsize, maxsize, recycle, acquire_timeout,
+    statement_timeout and dbname), which can be given either as keyword arguments or in the query string of the
+    address, eg. postgresql://localhost:5432/dbname?maxsize=20&statement_timeout=5000. Keyword arguments take
+    precedence, and any other options in the query string are passed on to libpq.
     """
     def __init__(self,
-                 config: Config):
+                 config: Config,
+                 statement_cache_size: int = 0,
+                 **kwargs):
         super().__init__(config)
         self._exit_stack = AsyncExitStack()
         self._pool: Optional[aiopg.Pool] = None
 
-        self.dsn = _construct_dsn(self._address, self._auth)
+        (self.pool_settings, options) = pool_settings(self._address, **kwargs)
+        self._state = DriverState(statement_cache_size, acquire_timeout=self.pool_settings.acquire_timeout)
+
+        self.dsn = _construct_dsn(self._address, self._auth, self.pool_settings, options)
 
     def database_type(self) -> str:
         return "agensgraph"
@@ -63,12 +93,23 @@ class Driver (AbstractDriver):
         return self
 
     async def __aexit__(self, e_t, e_v, e_tb) -> Optional[bool]:
+        self._pool = None
         return await self._exit_stack.__aexit__(e_t, e_v, e_tb)
 
+    async def close(self) -> None:
+        """Closes the connection pool. Awaiting the driver again will open a new one.
+        """
+        self._pool = None
+        await self._exit_stack.aclose()
+
     def __await__(self):
         async def __inner():
             if self._pool is None:
-                self._pool = await self._exit_stack.enter_async_context(aiopg.create_pool(self.dsn))
+                self._pool = await self._exit_stack.enter_async_context(aiopg.create_pool(
+                    self.dsn,
+                    minsize=self.pool_settings.minsize,
+                    maxsize=self.pool_settings.maxsize,
+                    pool_recycle=self.pool_settings.recycle))
             return self._pool
         return __inner().__await__()
 
@@ -80,4 +121,45 @@ class Driver (AbstractDriver):
         without one is not supported.
         """
         assert (self._pool is not None)
-        return Session(self._pool, **kwargs)
+        return self._wrap_session(Session(self._pool, self._state, **kwargs), kwargs)
+
+    def enable_metrics(self, metrics: Optional[Metrics] = None) -> Metrics:
+        self._state.metrics = super().enable_metrics(metrics)
+        return self._state.metrics
+
+    def pool_stats(self) -> PoolStats:
+        """Returns the current size of the connection pool, how many of its connections are free, how many
+        sessions are waiting for one to be returned, a histogram of how long sessions have waited for connections,
+        and how many gave up waiting.
+        """
+        return PoolStats(
+            size=self._pool.size if self._pool is not None else 0,
+            free=self._pool.freesize if self._pool is not None else 0,
+            waiters=self._state.waiters,
+            acquire_latency=self._state.acquire_latency.snapshot(),
+            acquire_timeouts=self._state.acquire_timeouts)
+
+    def statement_stats(self) -> Dict[str, StatementStats]:
+        """Returns the numbers of hits and misses in the prepared statement caches for each of the queries most
+        recently run, at most STATEMENT_STATS_SIZE of them.
+        """
+        return self._state.statement_stats()
+
+    async def bulk_load(
+        self,
+        graph: str,
+        vertices: Union[AsyncIterable[BulkVertex], Iterable[BulkVertex]] = (),
+        edges: Union[AsyncIterable[BulkEdge], Iterable[BulkEdge]] = (),
+        key: str = "id",
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE
+    ) -> BulkLoadStats:
+        """Loads vertices and then edges into a graph with COPY ... FROM STDIN, which is far faster than running
+        a CREATE for each of them.
+
+        The load is done in a single transaction on a separate synchronous connection, driven from the event
+        loop's default executor, since aiopg does not support COPY. The endpoints of edges are given as
+        (label, value) pairs, matched against the key property of the vertices with that label.
+
+        :returns: The numbers of vertices and edges loaded
+        """
+        return await bulk_load(self.dsn, graph, vertices, edges, key=key, batch_size=batch_size)
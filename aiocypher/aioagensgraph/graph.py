@@ -17,41 +17,118 @@
 
 from ..interface.graph import Graph as AbstractGraph
 
-from typing import Set, Any, Awaitable, List, Dict, Optional
+from typing import Set, Any, Awaitable, AsyncIterator, List, Dict, Tuple, Optional
+
+import asyncio
 
 from .node import Node
+from .relationship import Relationship
+
+
+def _is_vertex(value: Any) -> bool:
+    return isinstance(value, dict) and (value.get('type') == 'vertex' or 'vid' in value)
+
+
+def _is_edge(value: Any) -> bool:
+    return isinstance(value, dict) and (value.get('type') == 'edge' or 'eid' in value)
+
+
+def _add_row(row: Tuple[Any, ...], nodes: Dict[Any, Node], edges: Dict[Any, Dict[str, Any]]) -> None:
+    for value in row:
+        _add_value(value, nodes, edges)
+
 
-Relationship = Any
+def _add_value(value: Any, nodes: Dict[Any, Node], edges: Dict[Any, Dict[str, Any]]) -> None:
+    if _is_vertex(value):
+        if value['vid'] not in nodes:
+            nodes[value['vid']] = Node(value)
+    elif _is_edge(value):
+        edges.setdefault(value.get('eid', str(value)), value)
+    elif isinstance(value, dict) and value.get('type') == 'path':
+        for vertex in value.get('vertices', []):
+            _add_value(vertex, nodes, edges)
+        for edge in value.get('edges', []):
+            _add_value(edge, nodes, edges)
+    elif isinstance(value, list):
+        for v in value:
+            _add_value(v, nodes, edges)
 
 
-class Graph (AbstractGraph[Optional[List[Dict[str, str]]]]):
+class Graph (AbstractGraph[Optional[List[Tuple[Any, ...]]]]):
     """A conceptual wrapper for a query which will return a Graph.
+
+    Either coroutine, which returns all the rows of the result, or rows, an asynchronous iterator over them,
+    should be provided. In the latter case the graph is built incrementally as the rows are read and the rows
+    themselves are not kept, so awaiting this object returns None.
+
+    Vertices and edges are collected from every column of every row, including those inside paths and
+    arrays of edges, in a single pass. The endpoints of edges are then looked up by vid, and any which were
+    not themselves returned by the query are represented by Nodes which contain only their vid.
     """
     def __init__(
         self,
-        coroutine: Awaitable[List[Dict[str, str]]]
+        coroutine: Optional[Awaitable[List[Tuple[Any, ...]]]] = None,
+        rows: Optional[AsyncIterator[Tuple[Any, ...]]] = None
     ):
-        self._coroutine: Optional[Awaitable[List[Dict[str, str]]]] = coroutine
-        self._result: Optional[List[Dict[str, str]]] = None
+        self._coroutine = coroutine
+        self._rows = rows
+        self._future: Optional['asyncio.Future[Optional[List[Tuple[Any, ...]]]]'] = None
+        self._nodes: Optional[Dict[Any, Node]] = None
+        self._edges: Dict[Any, Dict[str, Any]] = {}
+        self._placeholders: Dict[Any, Node] = {}
+        self._relationships: Optional[Set[Relationship]] = None
 
     def __await__(self):
         async def __inner():
-            if self._result is None and self._coroutine is not None:
-                c = self._coroutine
-                self._coroutine = None
-                self._result = await c
-            return self._result
+            # Every awaiter shares the one execution, including its failure, and cancelling one of them leaves it
+            # running for the rest
+            if self._future is None:
+                self._future = asyncio.ensure_future(self._fetch())
+            return await asyncio.shield(self._future)
         return __inner().__await__()
 
+    async def _fetch(self) -> Optional[List[Tuple[Any, ...]]]:
+        if self._coroutine is not None:
+            return await self._coroutine
+        nodes: Dict[Any, Node] = {}
+        edges: Dict[Any, Dict[str, Any]] = {}
+        if self._rows is not None:
+            async for row in self._rows:
+                _add_row(row, nodes, edges)
+        # Only published once every row has been read, so that nothing sees a partial graph
+        (self._nodes, self._edges) = (nodes, edges)
+        return None
+
+    async def _build(self) -> Dict[Any, Node]:
+        data = await self
+        if self._nodes is None:
+            nodes: Dict[Any, Node] = {}
+            for row in data or []:
+                _add_row(row, nodes, self._edges)
+            self._nodes = nodes
+        return self._nodes
+
+    def _node(self, vid: Any) -> Node:
+        assert self._nodes is not None
+        node = self._nodes.get(vid)
+        if node is None:
+            node = self._placeholders.setdefault(vid, Node({'vid': vid}))
+        return node
+
     @property
     async def nodes(self) -> Set[Node]:
         """This property is a Coroutine, which is weird, but better matches the neo4j interface.
         """
-        data = await self
-        return {Node(n) for (n,) in data if 'vid' in n}
+        return set((await self._build()).values())
 
     @property
     async def relationships(self) -> Set[Relationship]:
         """This property is a Coroutine, which is weird, but better matches the neo4j interface.
         """
-        return set()
+        await self._build()
+        if self._relationships is None:
+            self._relationships = {
+                Relationship(edge, self._node(edge.get('source_vid')), self._node(edge.get('destination_vid')))
+                for edge in self._edges.values()
+            }
+        return set(self._relationships)
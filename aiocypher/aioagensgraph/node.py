@@ -17,16 +17,63 @@
 
 from ..interface.node import Node as AbstractNode
 
-from typing import Dict, Union
+from typing import Any, Dict, Iterator, Mapping, Optional, Set, Union
 
 
-class Node (AbstractNode, Dict[str, Union[str, int]]):
-    def __init__(self, data: Dict[str, Union[str, int]]):
-        if 'vid' in data:
-            self._hash = hash(data['vid'])
-        else:
-            self._hash = hash(str(data))
-        super().__init__({key: value for (key, value) in data.items()})
+_VERTEX_KEYS = frozenset(('type', 'label', 'vid'))
 
-    def __hash__(self):
-        return self._hash
+
+class Node (AbstractNode):
+    """A vertex returned by agensgraph.
+
+    This is a read only Mapping over the dictionary produced by the agensgraph package, which is kept rather than
+    copied, so it includes the type, label and vid of the vertex as well as its properties. The properties alone
+    are available as the properties attribute, which is only built when it is first used.
+
+    Nodes with a vid are equal if their vids are, and hash on it. This includes the placeholders which a Graph makes
+    for the endpoints of edges whose vertices were not returned by the query, so a placeholder is equal to the Node
+    of the same vertex. A Node without a vid, such as one made from a dictionary which is not a decoded vertex, is
+    only equal to itself.
+    """
+    __slots__ = ('vid', 'label', '_data', '_properties')
+
+    def __init__(self, data: Mapping[str, Any]):
+        self._data = data
+        self.vid: Optional[str] = data.get('vid')
+        self.label: Optional[str] = data.get('label')
+        self._properties: Optional[Dict[str, Union[str, int]]] = None
+
+    @property
+    def labels(self) -> Set[str]:
+        return {self.label} if self.label else set()
+
+    @property
+    def properties(self) -> Dict[str, Union[str, int]]:
+        if self._properties is None:
+            self._properties = {key: value for (key, value) in self._data.items() if key not in _VERTEX_KEYS}
+        return self._properties
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __hash__(self) -> int:
+        return hash(self.vid) if self.vid is not None else id(self)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Node):
+            return self is other or (self.vid is not None and self.vid == other.vid)
+        elif isinstance(other, Mapping):
+            return dict(self._data) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Node({self._data!r})"
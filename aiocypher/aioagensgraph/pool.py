@@ -0,0 +1,97 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+from urllib.parse import urlparse, parse_qsl
+
+from ..internal.stats import HistogramSnapshot
+
+__all__ = [
+    "PoolSettings",
+    "PoolStats",
+    "pool_settings"
+]
+
+
+class PoolSettings (NamedTuple):
+    """The settings for the aiopg connection pool of a Driver.
+
+    :param minsize: The number of connections the pool keeps open
+    :param maxsize: The most connections the pool will open
+    :param recycle: Connections older than this many seconds are closed when released, or -1 to keep them
+    :param acquire_timeout: The longest in seconds that opening a session will wait for a connection before
+                            PoolAcquireTimeout is raised, or None
+    :param statement_timeout: The longest in milliseconds that the server will allow any statement to run, or None
+                              for the server's default
+    :param dbname: The database to connect to, or None for the server's default
+    """
+    minsize: int = 1
+    maxsize: int = 10
+    recycle: float = -1.0
+    acquire_timeout: Optional[float] = None
+    statement_timeout: Optional[int] = None
+    dbname: Optional[str] = None
+
+
+class PoolStats (NamedTuple):
+    """waiters is the number of sessions waiting because no connection is free. acquire_latency measures the
+    acquires which succeeded, and acquire_timeouts counts those which timed out.
+    """
+    size: int
+    free: int
+    waiters: int
+    acquire_latency: HistogramSnapshot
+    acquire_timeouts: int = 0
+
+
+_CONVERSIONS = {
+    'minsize': int,
+    'maxsize': int,
+    'recycle': float,
+    'acquire_timeout': float,
+    'statement_timeout': int,
+    'dbname': str
+}
+
+
+def pool_settings(address: str, **kwargs) -> Tuple[PoolSettings, Dict[str, str]]:
+    """Works out the pool settings from the address and the keyword arguments given to the Driver. The latter take
+    precedence. The database name can also be given as the path of the address, eg. postgresql://host/dbname.
+
+    Any other options in the query string of the address are returned separately, to be passed on to libpq, eg.
+    postgresql://host/dbname?maxsize=20&sslmode=require
+
+    :returns: A pair of the settings and the other options
+    """
+    addr = urlparse(address)
+    values: Dict[str, Any] = {}
+    options: Dict[str, str] = {}
+
+    if addr.path.strip('/'):
+        values['dbname'] = addr.path.strip('/')
+    for (key, value) in parse_qsl(addr.query):
+        if key in _CONVERSIONS:
+            values[key] = _CONVERSIONS[key](value)
+        else:
+            options[key] = value
+
+    for (key, value) in kwargs.items():
+        if key not in _CONVERSIONS:
+            raise TypeError(f"Unexpected keyword argument {key!r}")
+        values[key] = value
+
+    return (PoolSettings(**values), options)
@@ -19,6 +19,8 @@ from ..interface.record import Record as AbstractRecord
 
 from typing import Optional, Awaitable, Dict, Union
 
+import asyncio
+
 from .node import Node
 
 
@@ -33,17 +35,16 @@ class Record (AbstractRecord[Optional[Dict[str, str]]]):
         self,
         coroutine: Awaitable[Optional[Dict[str, str]]]
     ):
-        self._coroutine: Optional[Awaitable[Optional[Dict[str, str]]]] = coroutine
-        self._result: Optional[Dict[str, str]] = None
+        self._coroutine = coroutine
+        self._future: Optional['asyncio.Future[Optional[Dict[str, str]]]'] = None
 
     def __await__(self):
         async def __inner():
-            if self._result is None and self._coroutine is not None:
-                c = self._coroutine
-                self._coroutine = None
-                self._result = await c
-
-            return self._result
+            # Every awaiter shares the one execution, including its failure, and cancelling one of them leaves it
+            # running for the rest
+            if self._future is None:
+                self._future = asyncio.ensure_future(self._coroutine)
+            return await asyncio.shield(self._future)
         return __inner().__await__()
 
     async def value(self) -> Optional[Node]:
@@ -70,4 +71,4 @@ class Record (AbstractRecord[Optional[Dict[str, str]]]):
 
         label = result['label']
 
-        return {label: Node(result)}
+        return {label: dict(result)}
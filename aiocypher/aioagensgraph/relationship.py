@@ -0,0 +1,40 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from ..interface.relationship import Relationship as AbstractRelationship
+
+from typing import Dict, Union
+
+from .node import Node
+
+
+class Relationship (Dict[str, Union[str, int]], AbstractRelationship):
+    """An edge returned by agensgraph. This is the dictionary produced by the agensgraph package, with the label
+    of the edge also available as type, and its endpoints as start_node and end_node.
+    """
+    def __init__(self, data: Dict[str, Union[str, int]], start_node: Node, end_node: Node):
+        super().__init__(data)
+        self.type = str(data.get('label', ''))
+        self.start_node = start_node
+        self.end_node = end_node
+        if 'eid' in data:
+            self._hash = hash(data['eid'])
+        else:
+            self._hash = hash(str(data))
+
+    def __hash__(self):
+        return self._hash
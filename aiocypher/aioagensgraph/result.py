@@ -15,27 +15,21 @@
 # limitations under the License.
 #
 
-from ..interface.result import Result as AbstractResult
+from ..interface.result import Result as AbstractResult, DEFAULT_BATCH_SIZE, DEFAULT_MAX_BUFFERED_BATCHES
 from ..interface.exceptions import QueryFailed
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, AsyncIterator, Optional
+from itertools import count
 
 import aiopg
 
-import re
-
 from .record import Record
 from .graph import Graph
+from .statements import StatementCache
+from ..internal.postgres import convert_cypher_parameters_to_postgres, rows_to_dicts
 
 
-def convert_cypher_parameters_to_postgres(query: str, params: Dict[str, str]) -> str:
-    q = str(query)
-    for key in params:
-        # Replace entries of the form $name with %(name)s
-        # (Ignoring instances of $$)
-        q = re.sub(r'(?<!\$)\$' + key + r'(?!\w)', r'%(' + key + ')s', q)
-
-    return q
+_cursor_names = (f"aiocypher_cursor_{n}" for n in count())
 
 
 class Result (AbstractResult[Any]):
@@ -46,14 +40,31 @@ class Result (AbstractResult[Any]):
     in which it was created.
 
     A better way to use this object is to use the 'data()', single()' or 'graph()' methods.
+
+    Iterating over it asynchronously, or building a graph incrementally, uses a server side cursor so that the
+    rows are never all held in memory at once.
     """
     def __init__(self, cursor: aiopg.Cursor, *args, **kwargs):
         self._cursor = cursor
         self._args = args
         self._kwargs = kwargs
+        self._statements: Optional[StatementCache] = None
+
+    def _prepared_with(self, statements: Optional[StatementCache]) -> 'Result':
+        """Sets the cache of prepared statements to execute the query through, if any."""
+        self._statements = statements
+        return self
 
     def __await__(self):
         async def __inner():
+            if self._statements is not None:
+                try:
+                    await self._statements.execute(self._cursor, self._args[0], self._kwargs)
+                except Exception as e:
+                    raise QueryFailed(self._args[0], self._kwargs) from e
+                else:
+                    return self._cursor
+
             query = convert_cypher_parameters_to_postgres(self._args[0], self._kwargs)
             try:
                 await self._cursor.execute(query, parameters=self._kwargs)
@@ -74,11 +85,17 @@ class Result (AbstractResult[Any]):
             return result[0] if result else None
         return Record(__inner())
 
-    def graph(self) -> Graph:
+    def graph(self, incremental: bool = False) -> Graph:
         """Returns an Graph object
 
         Useful if the wrapped query is expected to return multiple results.
+
+        :param incremental: If True the rows are streamed from a server side cursor and discarded once they have
+                            been added to the graph, so awaiting the Graph returns None rather than the rows
         """
+        if incremental:
+            return Graph(rows=self.stream())
+
         async def __inner():
             await self
             result = await self._cursor.fetchall()
@@ -87,5 +104,48 @@ class Result (AbstractResult[Any]):
 
     async def data(self) -> List[Dict[str, Any]]:
         """Deserialises the data in this result as a list of dictionaries and returns it.
+
+        Each dictionary is keyed on the column names of the result, and any vertices or edges are replaced by
+        dictionaries of their properties and any paths by lists of those. Unlike neo4j, edges do not include
+        the properties of their endpoints.
+        """
+        cursor = await self
+        rows = await cursor.fetchall()
+        if cursor.description is None:
+            return []
+        return rows_to_dicts(cursor.description, rows)
+
+    async def stream(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_buffered_batches: int = DEFAULT_MAX_BUFFERED_BATCHES
+    ) -> AsyncIterator[Tuple[Any, ...]]:
+        """Returns an asynchronous iterator over the rows of this result.
+
+        The query is run through a server side cursor (DECLARE ... CURSOR FOR), and the rows are fetched from it
+        batch_size at a time, so only one batch is held in memory. Only one batch is ever read ahead, so
+        max_buffered_batches has no effect.
+
+        The cursor lasts only as long as the transaction, so the rows must be consumed within it.
         """
-        return []
+        query = convert_cypher_parameters_to_postgres(self._args[0], self._kwargs)
+        name = next(_cursor_names)
+        async with self._cursor.connection.cursor() as cursor:
+            try:
+                await cursor.execute(f"DECLARE {name} NO SCROLL CURSOR FOR {query}", parameters=self._kwargs)
+            except Exception as e:
+                raise QueryFailed(query, self._kwargs) from e
+            try:
+                while True:
+                    await cursor.execute(f"FETCH FORWARD {int(batch_size)} FROM {name}")
+                    rows = await cursor.fetchall()
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield row
+            finally:
+                try:
+                    await cursor.execute(f"CLOSE {name}")
+                except Exception:
+                    # The transaction has already failed, which will have closed the cursor
+                    pass
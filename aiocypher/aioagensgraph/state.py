@@ -0,0 +1,82 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from weakref import WeakKeyDictionary
+
+import aiopg
+from psycopg2 import sql
+from async_exit_stack import AsyncExitStack
+
+from ..interface.exceptions import PoolAcquireTimeout
+from ..internal.agensgraph import AgensGraphDriverState, CREATE_GRAPH, SET_GRAPH_PATH
+from .statements import StatementCache, StatementStats
+
+
+class DriverState (AgensGraphDriverState):
+    """State shared by all the sessions of a single Driver, used to avoid repeating setup statements on every
+    transaction. See AgensGraphDriverState for what it remembers and measures.
+
+    If statement_cache_size is greater than 0 then each connection also gets a StatementCache of that size.
+    """
+    def __init__(self, statement_cache_size: int = 0, acquire_timeout: Optional[float] = None) -> None:
+        super().__init__(acquire_timeout=acquire_timeout)
+        self._statement_cache_size = statement_cache_size
+        self._statement_caches: 'WeakKeyDictionary[aiopg.Connection, StatementCache]' = WeakKeyDictionary()
+        self._statement_counters: 'OrderedDict[str, List[int]]' = OrderedDict()
+
+    def statements(self, connection: aiopg.Connection) -> Optional[StatementCache]:
+        """The cache of prepared statements for a connection, or None if statements are not being prepared."""
+        if self._statement_cache_size <= 0:
+            return None
+        cache = self._statement_caches.get(connection)
+        if cache is None:
+            cache = StatementCache(
+                self._statement_cache_size, self._statement_counters, graph=self._graph_paths.get(connection))
+            self._statement_caches[connection] = cache
+        return cache
+
+    def statement_stats(self) -> Dict[str, StatementStats]:
+        """The numbers of times each query was found already prepared on its connection, or had to be."""
+        return {query: StatementStats(*counter) for (query, counter) in self._statement_counters.items()}
+
+    async def _acquire(self, pool: aiopg.Pool, exit_stack: AsyncExitStack) -> aiopg.Connection:
+        try:
+            return await asyncio.wait_for(exit_stack.enter_async_context(pool.acquire()), self._acquire_timeout)
+        except asyncio.TimeoutError:
+            raise PoolAcquireTimeout(pool.maxsize or 0, self._acquire_timeout or 0.0) from None
+
+    @staticmethod
+    def _exhausted(pool: aiopg.Pool) -> bool:
+        # aiopg opens another connection rather than waiting if the pool is not yet at its maxsize, 0 being unlimited
+        maxsize = pool.maxsize or 0
+        return pool.freesize == 0 and maxsize > 0 and pool.size >= maxsize
+
+    async def use_graph(self, connection: aiopg.Connection, graph: str) -> None:
+        await super().use_graph(connection, graph)
+        # Statements prepared on the connection are still planned against the previous graph_path
+        cache = self._statement_caches.get(connection)
+        if cache is not None:
+            cache.graph = graph
+
+    async def _set_graph_path(self, connection: aiopg.Connection, graph: str, create: bool) -> None:
+        async with connection.cursor() as cursor:
+            if create:
+                await cursor.execute(sql.SQL(CREATE_GRAPH).format(sql.Identifier(graph)))
+            await cursor.execute(sql.SQL(SET_GRAPH_PATH).format(sql.Identifier(graph)))
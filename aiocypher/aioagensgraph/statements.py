@@ -0,0 +1,119 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import count
+from typing import Any, FrozenSet, List, Mapping, NamedTuple, Optional, Tuple
+
+import aiopg
+
+from ..internal.cypher import substitute_parameters
+
+
+__all__ = [
+    "STATEMENT_STATS_SIZE",
+    "StatementStats",
+    "StatementCache"
+]
+
+
+# The most queries which statement stats are kept for, those least recently run are forgotten first
+STATEMENT_STATS_SIZE = 1024
+
+
+class StatementStats (NamedTuple):
+    hits: int
+    misses: int
+
+
+_statement_names = (f"aiocypher_statement_{n}" for n in count())
+
+
+@lru_cache(maxsize=1024)
+def _positional(query: str, names: FrozenSet[str]) -> Tuple[str, Tuple[str, ...]]:
+    """Rewrites the $name parameters of a query which appear in names as $1, $2, ..., in order of first
+    appearance, as PREPARE requires. Returns the rewritten query and the names in positional order.
+    """
+    order: List[str] = []
+
+    def __position(name: str) -> Any:
+        if name not in names:
+            return None
+        if name not in order:
+            order.append(name)
+        return f"${order.index(name) + 1}"
+
+    return (substitute_parameters(query, __position), tuple(order))
+
+
+class StatementCache (object):
+    """The statements prepared on a single connection, at most max_size of them. When another is needed the one
+    least recently used is deallocated.
+
+    A statement is planned against the graph_path of the connection when it is prepared, so statements are cached
+    per graph, and graph must be kept up to date with the connection's graph_path.
+
+    The counters are shared between all the caches of a Driver, and keyed on the cypher query. Only the
+    STATEMENT_STATS_SIZE queries most recently run are counted.
+    """
+    def __init__(self, max_size: int, counters: 'OrderedDict[str, List[int]]', graph: Optional[str] = None):
+        self._max_size = max_size
+        self._counters = counters
+        self._prepared: 'OrderedDict[Tuple[Optional[str], str], str]' = OrderedDict()
+        self.graph = graph
+
+    def _counter(self, query: str) -> List[int]:
+        counter = self._counters.get(query)
+        if counter is None:
+            counter = self._counters[query] = [0, 0]
+            if len(self._counters) > STATEMENT_STATS_SIZE:
+                self._counters.popitem(last=False)
+        else:
+            self._counters.move_to_end(query)
+        return counter
+
+    async def execute(self, cursor: aiopg.Cursor, query: str, parameters: Mapping[str, Any]) -> None:
+        """Executes a cypher query on the cursor, preparing it first if this connection has not already done so.
+        """
+        (statement, order) = _positional(query, frozenset(parameters))
+        counter = self._counter(query)
+        key = (self.graph, statement)
+
+        name = self._prepared.get(key)
+        if name is not None:
+            counter[0] += 1
+            self._prepared.move_to_end(key)
+        else:
+            counter[1] += 1
+            if len(self._prepared) >= self._max_size:
+                # Only forgotten once deallocated, so that a statement which failed to be is not leaked
+                (oldest, old) = next(iter(self._prepared.items()))
+                await cursor.execute(f"DEALLOCATE {old}")
+                del self._prepared[oldest]
+            name = next(_statement_names)
+            await cursor.execute(f"PREPARE {name} AS {statement}")
+            self._prepared[key] = name
+
+        if order:
+            arguments = ", ".join(f"%({key})s" for key in order)
+            await cursor.execute(f"EXECUTE {name} ({arguments})", parameters=parameters)
+        else:
+            await cursor.execute(f"EXECUTE {name}")
+
+    def __len__(self) -> int:
+        return len(self._prepared)
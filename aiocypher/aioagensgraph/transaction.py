@@ -16,13 +16,18 @@
 #
 
 from ..interface.transaction import Transaction as AbstractTransaction
+from ..interface.exceptions import QueryFailed
+from ..internal.postgres import begin_statement
+from ..internal.batch import DEFAULT_CHUNK_SIZE, ROWS_PARAMETER, chunked
 
-from typing import Optional
+from typing import Optional, Iterable, Mapping, Any
 
 import aiopg
+from psycopg2.extras import Json
 from async_exit_stack import AsyncExitStack
 
-from .result import Result
+from .result import Result, convert_cypher_parameters_to_postgres
+from .state import DriverState
 
 
 class Transaction (AbstractTransaction):
@@ -31,21 +36,32 @@ class Transaction (AbstractTransaction):
 
     Should always be used as an Async Context Manager. Using any of its methods outside of
     the context may lead to undefined behaviour.
+
+    Creating the graph and setting the graph_path are only done the first time they are needed on each
+    connection, so beginning a transaction is usually a single statement.
     """
-    def __init__(self, connection: aiopg.Connection, database: str):
+    def __init__(
+        self,
+        connection: aiopg.Connection,
+        database: str,
+        state: Optional[DriverState] = None,
+        read_only: bool = False,
+        isolation: Optional[str] = None
+    ):
+        self._begin = begin_statement(read_only, isolation)
         self._exit_stack = AsyncExitStack()
         self._connection = connection
         self._dbname = database
+        self._state = state if state is not None else DriverState()
+        self._statements = self._state.statements(connection)
         self._cursor: Optional[aiopg.Cursor] = None
 
     def __await__(self):
         async def __inner():
             if self._cursor is None:
+                await self._state.use_graph(self._connection, self._dbname)
                 self._cursor = await self._exit_stack.enter_async_context(self._connection.cursor())
-                await self._cursor.execute(f"CREATE GRAPH IF NOT EXISTS {self._dbname}")
-                await self._cursor.execute(f"SET graph_path = {self._dbname}")
-                await self._cursor.execute("BEGIN")
-                await self._cursor.execute("SET TRANSACTION ISOLATION LEVEL SERIALIZABLE")
+                await self._cursor.execute(self._begin)
             return self._cursor
         return __inner().__await__()
 
@@ -72,5 +88,36 @@ class Transaction (AbstractTransaction):
         """This is the main routine for this class.
 
         :returns: a Result object
+        :raises RuntimeError: if the transaction has not been begun
+        """
+        if self._cursor is None:
+            raise RuntimeError("Cannot run a query unless the transaction has begun")
+        return Result(self._cursor, *args, **kwargs)._prepared_with(self._statements)
+
+    async def run_batch(
+        self,
+        query: str,
+        rows: Iterable[Mapping[str, Any]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **params
+    ) -> int:
+        """Runs a write query once for every entry in rows, as a series of "UNWIND $rows AS row ..." statements
+        each covering up to chunk_size rows.
+
+        The statement is translated once, and each chunk is sent to the server as a single jsonb parameter.
+
+        :returns: The number of rows
         """
-        return Result(self._cursor, *args, **kwargs)
+        cursor = await self
+        statement = (
+            f"UNWIND %({ROWS_PARAMETER})s::jsonb AS row\n" +
+            convert_cypher_parameters_to_postgres(query, params))
+        count = 0
+        for chunk in chunked(rows, chunk_size):
+            parameters = dict(params, **{ROWS_PARAMETER: Json(chunk)})
+            try:
+                await cursor.execute(statement, parameters=parameters)
+            except Exception as e:
+                raise QueryFailed(statement, parameters) from e
+            count += len(chunk)
+        return count
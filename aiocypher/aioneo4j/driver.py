@@ -17,12 +17,14 @@
 
 from ..interface.driver import Driver as AbstractDriver
 from .session import Session
+from .pool import SessionPool
+from .threads import IOThreadPool
 from ..config import Config
+from ..metrics import Metrics
 
 import asyncio
 import time
-from typing import Optional, Callable, TypeVar, AsyncContextManager
-from functools import wraps
+from typing import Optional, Callable, AsyncContextManager, Any
 
 import neo4j
 from neo4j.exceptions import ServiceUnavailable
@@ -31,34 +33,63 @@ from async_generator import asynccontextmanager
 from urllib.parse import urlparse
 import re
 
-T = TypeVar('T')
-
-
-def _wrapped_in_executor(f: Callable[..., T]) -> Callable[..., 'asyncio.Future[T]']:
-    @wraps(f)
-    def wrapper(*args, **kwargs):
-        loop = asyncio.get_running_loop()
-        return loop.run_in_executor(
-            None,
-            lambda: f(*args, **kwargs))
-
-    return wrapper
-
 
 def is_neo4j_address(config: Config) -> bool:
     address = config.address
-    return any(re.match(regex, urlparse(address).scheme) for regex in (r'^neo4j(\+.+)?$', r'^bolt(\+.+)?$'))
+    scheme = urlparse(address).scheme
+    # Schemes ending "+async" are handled by the asyncneo4j Driver instead
+    return (
+        any(re.match(regex, scheme) for regex in (r'^neo4j(\+.+)?$', r'^bolt(\+.+)?$')) and
+        not scheme.endswith('+async'))
 
 
 @AbstractDriver.register_concrete(is_neo4j_address)
 class Driver (AbstractDriver):
     """This class encapsulates the neo4j.Driver object, it's interface is similar but
     limited to what has been implemented yet.
+
+    Each open Session needs an IO thread of its own. These come from an IOThreadPool belonging to the driver
+    rather than the event loop's default executor, and at most max_sessions may be open at once. Any more wait
+    for one to close, for at most session_acquire_timeout seconds if it is set, after which SessionLimitReached
+    is raised.
+
+    By default every Session opens its own neo4j.Session on a new IO thread, and closes both when it is
+    finished with. If session_pool_max_size is set then instead up to that many Sessions are kept open in a
+    SessionPool, and handed out again to later callers asking for a session with the same arguments.
+
+    :param max_sessions: The maximum number of Sessions, pooled or otherwise, which may be open at once
+    :param session_acquire_timeout: How long to wait for a Session when max_sessions are already open, or None
+                                    to wait indefinitely
+    :param session_pool_max_size: The maximum number of pooled sessions, or 0 to disable pooling
+    :param session_pool_min_size: The number of idle pooled sessions which are never closed for being idle
+    :param session_pool_idle_timeout: The number of seconds an idle pooled session is kept open for
+    :param session_pool_health_check: An optional callable run on the IO thread with the neo4j.Session before
+                                      a pooled session which has been idle for a while is reused. It should
+                                      raise an exception if the session is unusable.
+    :param session_pool_health_check_after: The number of seconds a session must have been idle before it is
+                                            checked
     """
     def __init__(self,
-                 config: Config):
+                 config: Config,
+                 max_sessions: int = 32,
+                 session_acquire_timeout: Optional[float] = None,
+                 session_pool_max_size: int = 0,
+                 session_pool_min_size: int = 0,
+                 session_pool_idle_timeout: float = 60.0,
+                 session_pool_health_check: Optional[Callable[[neo4j.Session], Any]] = None,
+                 session_pool_health_check_after: float = 30.0):
         super().__init__(config)
         self._sync_driver: Optional['asyncio.Future[neo4j.Driver]'] = None
+        self.io_threads = IOThreadPool(max_sessions=max_sessions, acquire_timeout=session_acquire_timeout)
+        self.session_pool: Optional[SessionPool] = None
+        if session_pool_max_size > 0:
+            self.session_pool = SessionPool(
+                lambda **kwargs: Session(self.sync_driver, self.io_threads, metrics=self._metrics, **kwargs),
+                min_size=session_pool_min_size,
+                max_size=session_pool_max_size,
+                idle_timeout=session_pool_idle_timeout,
+                health_check=session_pool_health_check,
+                health_check_after=session_pool_health_check_after)
 
     def database_type(self) -> str:
         return "neo4j"
@@ -67,7 +98,6 @@ class Driver (AbstractDriver):
     def sync_driver(self) -> 'asyncio.Future[neo4j.Driver]':
         """This property is an asyncio Future wrapping the underlying neo4j.Driver object.
         """
-        @_wrapped_in_executor
         def __create_sync_driver(address, auth, max_retries=20):
             backoff = 0
             while True:
@@ -80,22 +110,30 @@ class Driver (AbstractDriver):
                     time.sleep(backoff)
 
         if self._sync_driver is None:
-            self._sync_driver = __create_sync_driver(
+            self._sync_driver = self.io_threads.run(
+                __create_sync_driver,
                 self._address,
-                auth=self._auth)
+                self._auth)
 
         return self._sync_driver
 
     def __await__(self):
         return self.sync_driver.__await__()
 
+    def enable_metrics(self, metrics: Optional[Metrics] = None) -> Metrics:
+        self.io_threads.metrics = super().enable_metrics(metrics)
+        return self.io_threads.metrics
+
     async def close(self) -> None:
         """This coroutine should be awaited when the driver is no longer needed.
         """
+        if self.session_pool is not None:
+            await self.session_pool.close()
         if self._sync_driver is not None:
             sync_driver = await self._sync_driver
-            await _wrapped_in_executor(sync_driver.close)()
+            await self.io_threads.run(sync_driver.close)
             self._sync_driver = None
+        self.io_threads.shutdown()
 
     def session(self, **kwargs) -> AsyncContextManager[Session]:
         """This method is used to create a aioneo4j.Session object, which can be used as an
@@ -106,8 +144,18 @@ class Driver (AbstractDriver):
         """
         @asynccontextmanager
         async def __inner(sync_driver: 'asyncio.Future[neo4j.Driver]'):
-            session = Session(sync_driver, **kwargs)
+            session = Session(sync_driver, self.io_threads, metrics=self._metrics, **kwargs)
             async with session:
                 yield session
 
-        return __inner(self.sync_driver)
+        @asynccontextmanager
+        async def __pooled(session_pool: SessionPool):
+            session = await session_pool.acquire(**kwargs)
+            try:
+                yield session
+            finally:
+                await session_pool.release(session)
+
+        if self.session_pool is not None:
+            return self._wrap_session(__pooled(self.session_pool), kwargs)
+        return self._wrap_session(__inner(self.sync_driver), kwargs)
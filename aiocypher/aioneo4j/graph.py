@@ -17,12 +17,11 @@
 
 from ..interface.graph import Graph as AbstractGraph
 
-from typing import TypeVar, Callable, Awaitable, Set
-
-import neo4j
+from typing import Optional, Awaitable, Set
 
+import asyncio
 
-R = TypeVar('R')
+import neo4j
 
 
 class Graph (AbstractGraph[neo4j.graph.Graph]):
@@ -36,29 +35,34 @@ class Graph (AbstractGraph[neo4j.graph.Graph]):
     """
     def __init__(
         self,
-        execute: Callable[[Callable[[neo4j.Transaction], neo4j.graph.Graph]], Awaitable[neo4j.graph.Graph]],
-        func: Callable[[neo4j.Transaction], neo4j.graph.Graph]
+        coroutine: Awaitable[neo4j.graph.Graph]
     ):
-        self._func = func
-        self._execute = execute
+        self._coroutine = coroutine
+        self._future: Optional['asyncio.Future[neo4j.graph.Graph]'] = None
 
     def __await__(self):
-        return self._execute(self._func).__await__()
+        async def __inner():
+            # Every awaiter shares the one execution, including its failure, and cancelling one of them leaves it
+            # running for the rest
+            if self._future is None:
+                self._future = asyncio.ensure_future(self._coroutine)
+            return await asyncio.shield(self._future)
+        return __inner().__await__()
 
     @property
-    async def nodes(self) -> Set[neo4j.graph.Node]:
+    async def nodes(self) -> Set[neo4j.graph.Node]:  # type: ignore[override]
         """This property is a Coroutine, which is weird, but better matches the neo4j interface.
 
         When awaited this property will execute the query and return you a Set[neo4j.graph.Node]
         containing all of the nodes which the query matched.
         """
-        return await self._execute(lambda tx: set(self._func(tx).nodes))
+        return set((await self).nodes)
 
     @property
-    async def relationships(self) -> Set[neo4j.graph.Relationship]:
+    async def relationships(self) -> Set[neo4j.graph.Relationship]:  # type: ignore[override]
         """This property is a Coroutine, which is weird, but better matches the neo4j interface.
 
         When awaited this property will execute the query and return you a Set[neo4j.graph.Relationship]
         containing all of the relationships which the query matched.
         """
-        return await self._execute(lambda tx: set(self._func(tx).relationships))
+        return set((await self).relationships)
@@ -0,0 +1,251 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import time
+from typing import Optional, Callable, Dict, List, Tuple, Hashable, NamedTuple, Any
+
+import neo4j
+
+from .session import Session
+
+
+class SessionPoolStats (NamedTuple):
+    size: int
+    idle: int
+    hits: int
+    misses: int
+    waits: int
+    creations: int
+
+
+class _IdleSession (NamedTuple):
+    session: Session
+    since: float
+
+
+def _pool_key(kwargs: Dict[str, Any]) -> Optional[Hashable]:
+    key = tuple(sorted(kwargs.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class SessionPool (object):
+    """A bounded pool of open aioneo4j.Session objects, each with its IO thread already running and its
+    neo4j.Session already open. Sessions are only ever handed out again to callers which ask for them with
+    the same keyword arguments.
+
+    Should not be created directly, but via the session pool options of aioneo4j.Driver.
+
+    :param factory: A callable which makes a new, unopened, Session from the session keyword arguments
+    :param min_size: The number of idle sessions which are kept open however long they have been idle
+    :param max_size: The maximum number of sessions, in use or idle, which may be open at once
+    :param idle_timeout: The number of seconds an idle session is kept open for
+    :param health_check: An optional callable which is run on the IO thread with the neo4j.Session before an
+                         idle session is handed out, and which should raise an exception if it is unusable
+    :param health_check_after: The number of seconds a session must have been idle for before it is checked
+    """
+    def __init__(
+        self,
+        factory: Callable[..., Session],
+        min_size: int = 0,
+        max_size: int = 10,
+        idle_timeout: float = 60.0,
+        health_check: Optional[Callable[[neo4j.Session], Any]] = None,
+        health_check_after: float = 30.0
+    ):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError(f"Invalid session pool size limits: min_size={min_size}, max_size={max_size}")
+
+        self._factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check = health_check
+        self.health_check_after = health_check_after
+
+        self._idle: Dict[Optional[Hashable], List[_IdleSession]] = {}
+        # The key and the generation of every open session, whether idle or in use
+        self._keys: Dict[Session, Tuple[Optional[Hashable], int]] = {}
+        self._generation = 0
+        self._available: Optional[asyncio.Condition] = None
+        self._prune_handle: Optional[asyncio.TimerHandle] = None
+        self._closing: List['asyncio.Future[Any]'] = []
+
+        self._hits = 0
+        self._misses = 0
+        self._waits = 0
+        self._creations = 0
+
+    @property
+    def size(self) -> int:
+        return len(self._keys)
+
+    @property
+    def idle(self) -> int:
+        return sum(len(sessions) for sessions in self._idle.values())
+
+    def stats(self) -> SessionPoolStats:
+        return SessionPoolStats(
+            size=self.size,
+            idle=self.idle,
+            hits=self._hits,
+            misses=self._misses,
+            waits=self._waits,
+            creations=self._creations)
+
+    async def acquire(self, **kwargs) -> Session:
+        """Returns an open Session, which must be handed back with release() once it is finished with.
+        """
+        if self._available is None:
+            self._available = asyncio.Condition()
+
+        key = _pool_key(kwargs)
+        waited = False
+        while True:
+            idle: Optional[_IdleSession] = None
+            async with self._available:
+                while True:
+                    idle = self.__take_idle(key)
+                    if idle is not None:
+                        break
+
+                    if self.size >= self.max_size:
+                        self.__evict_idle_other_than(key)
+
+                    if self.size < self.max_size:
+                        # Reserve the place in the pool before releasing the lock to open the session
+                        session = self._factory(**kwargs)
+                        self._keys[session] = (key, self._generation)
+                        self._misses += 1
+                        break
+
+                    if not waited:
+                        self._waits += 1
+                        waited = True
+                    await self._available.wait()
+
+            if idle is None:
+                break
+            # The session has been taken out of the idle list, so it still holds its place in the pool whilst it is
+            # checked without the lock, and a slow check holds up no one else
+            if await self.__is_healthy(idle):
+                self._hits += 1
+                return idle.session
+            self.__close_in_background(idle.session)
+
+        try:
+            await session.__aenter__()
+        except BaseException:
+            self._keys.pop(session, None)
+            await self.__notify()
+            raise
+        self._creations += 1
+        return session
+
+    async def release(self, session: Session) -> None:
+        """Hands a session back to the pool once it is no longer in use.
+        """
+        (key, generation) = self._keys.get(session, (None, -1))
+        if (
+            generation != self._generation or key is None or
+            not session._is_open() or session._transaction is not None
+        ):
+            await self.__discard(session)
+            return
+
+        self._idle.setdefault(key, []).append(_IdleSession(session, time.monotonic()))
+        self.__schedule_prune()
+        await self.__notify()
+
+    async def close(self) -> None:
+        """Closes every idle session. Sessions which are in use are closed when they are released.
+
+        The pool can still be used afterwards, in which case new sessions will be opened.
+        """
+        self._generation += 1
+        if self._prune_handle is not None:
+            self._prune_handle.cancel()
+            self._prune_handle = None
+        idle = [entry.session for sessions in self._idle.values() for entry in sessions]
+        self._idle = {}
+        for session in idle:
+            await self.__discard(session)
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+    def __take_idle(self, key: Optional[Hashable]) -> Optional[_IdleSession]:
+        sessions = self._idle.get(key, [])
+        while sessions:
+            idle = sessions.pop()
+            if idle.session._is_open():
+                return idle
+            self.__close_in_background(idle.session)
+        return None
+
+    async def __is_healthy(self, idle: _IdleSession) -> bool:
+        if self.health_check is not None and time.monotonic() - idle.since >= self.health_check_after:
+            try:
+                await idle.session._execute(self.health_check)
+            except Exception:
+                return False
+        return True
+
+    def __evict_idle_other_than(self, key: Optional[Hashable]) -> None:
+        """Makes room for a session with different arguments by closing the longest idle session"""
+        candidates = [(sessions[0].since, k) for (k, sessions) in self._idle.items() if k != key and sessions]
+        if candidates:
+            (_, k) = min(candidates)
+            self.__close_in_background(self._idle[k].pop(0).session)
+
+    def __schedule_prune(self) -> None:
+        if self._prune_handle is None and self.idle_timeout is not None:
+            self._prune_handle = asyncio.get_running_loop().call_later(self.idle_timeout, self.__prune)
+
+    def __prune(self) -> None:
+        self._prune_handle = None
+        now = time.monotonic()
+        for sessions in self._idle.values():
+            while sessions and self.idle > self.min_size and now - sessions[0].since >= self.idle_timeout:
+                self.__close_in_background(sessions.pop(0).session)
+        if self.idle > self.min_size:
+            self.__schedule_prune()
+
+    def __close_in_background(self, session: Session) -> None:
+        """Closes a session without waiting for its IO thread to finish. This is safe to call whilst holding
+        the lock on the condition variable, since the waiters are only notified once the lock can be taken.
+        """
+        self._keys.pop(session, None)
+        task = asyncio.ensure_future(self.__discard(session))
+        self._closing.append(task)
+        task.add_done_callback(self._closing.remove)
+
+    async def __discard(self, session: Session) -> None:
+        self._keys.pop(session, None)
+        try:
+            await session.__aexit__(None, None, None)
+        except Exception:
+            pass
+        await self.__notify()
+
+    async def __notify(self) -> None:
+        if self._available is not None:
+            async with self._available:
+                self._available.notify()
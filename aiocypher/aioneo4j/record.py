@@ -17,35 +17,39 @@
 
 from ..interface.record import Record as AbstractRecord
 
-from typing import Optional, TypeVar, Callable, Awaitable, Dict, cast, Union
-
-import neo4j
+from typing import Optional, Awaitable, Dict, Union, Any
 
+import asyncio
 
-R = TypeVar('R')
+import neo4j
 
 
-class Record (AbstractRecord[neo4j.Record]):
+class Record (AbstractRecord[Optional[neo4j.Record]]):
     """A conceptual wrapper for a neo4j query which will return a neo4j.Record object.
 
-    To execute the query and return the underlying object await this object. But the
-    returned neo4j.Record is unlikely to be very useful outside of the context managers
-    in which it was created.
+    To execute the query and return the underlying object await this object. The neo4j.Record
+    has already been read from the server by then, so it is safe to use it outside of the context
+    managers in which it was created.
 
     A better way to use this object is to use the 'value()' coroutine.
     """
     def __init__(
         self,
-        execute: Callable[[Callable[[neo4j.Transaction], neo4j.Record]], Awaitable[neo4j.Record]],
-        func: Callable[[neo4j.Transaction], neo4j.Record]
+        coroutine: Awaitable[Optional[neo4j.Record]]
     ):
-        self._func = func
-        self._execute = execute
+        self._coroutine = coroutine
+        self._future: Optional['asyncio.Future[Optional[neo4j.Record]]'] = None
 
     def __await__(self):
-        return self._execute(self._func).__await__()
-
-    async def value(self) -> Optional[neo4j.graph.Node]:
+        async def __inner():
+            # Every awaiter shares the one execution, including its failure, and cancelling one of them leaves it
+            # running for the rest
+            if self._future is None:
+                self._future = asyncio.ensure_future(self._coroutine)
+            return await asyncio.shield(self._future)
+        return __inner().__await__()
+
+    async def value(self) -> Any:
         """When awaited this coroutine executes the query and returns the underlying neo4j.graph.Node object
         which is contained inside this Record.
 
@@ -53,23 +57,17 @@ class Record (AbstractRecord[neo4j.Record]):
 
         :returns: A neo4j.graph.Node
         """
-        def __inner(tx) -> Optional[neo4j.graph.Node]:
-            record = self._func(tx)
-            if record is not None:
-                return record.value()
-            else:
-                return None
-
-        return await self._execute(__inner)
+        record = await self
+        if record is not None:
+            return record.value()
+        else:
+            return None
 
     async def data(self) -> Optional[Dict[str, Dict[str, Union[str, int]]]]:
         """Deserialises the data in this result as dictionary and returns it.
         """
-        def __inner(tx) -> Optional[Dict[str, Union[str, int]]]:
-            record = self._func(tx)
-            if record is not None:
-                return record.data()
-            else:
-                return None
-
-        return cast(Optional[Dict[str, Dict[str, Union[str, int]]]], await self._execute(__inner))
+        record = await self
+        if record is not None:
+            return record.data()
+        else:
+            return None
@@ -15,9 +15,12 @@
 # limitations under the License.
 #
 
-from ..interface.result import Result as AbstractResult
+from ..interface.result import Result as AbstractResult, DEFAULT_BATCH_SIZE, DEFAULT_MAX_BUFFERED_BATCHES
 
-from typing import TypeVar, Callable, Awaitable, List, Dict, cast, Any
+import asyncio
+import threading
+import warnings
+from typing import Optional, Callable, Awaitable, AsyncIterator, List, Dict, Any, NamedTuple
 
 import neo4j
 
@@ -25,7 +28,29 @@ from .record import Record
 from .graph import Graph
 
 
-R = TypeVar('R')
+class _Materialised (NamedTuple):
+    result: neo4j.Result
+    records: Optional[List[neo4j.Record]]
+    graph: Optional[neo4j.graph.Graph]
+    summary: neo4j.ResultSummary
+
+
+def _materialise(result: neo4j.Result, keep_records: bool = True) -> _Materialised:
+    """Run on the IO thread to read everything from a result in one pass.
+
+    Asking for the graph first buffers every record, hydrating the graph as it does so, and the buffered records
+    can then still be iterated. If the records are not wanted they are iterated over and dropped as they arrive
+    instead, which still hydrates the graph but never holds more than one fetch worth of records.
+    """
+    if keep_records:
+        graph = result.graph()
+        records: Optional[List[neo4j.Record]] = list(result)
+    else:
+        for _ in result:
+            pass
+        graph = result.graph()
+        records = None
+    return _Materialised(result, records, graph, result.consume())
 
 
 class Result (AbstractResult[neo4j.Result]):
@@ -36,33 +61,146 @@ class Result (AbstractResult[neo4j.Result]):
     in which it was created.
 
     A better way to use this object is to use the 'single()' or 'graph()' methods.
+
+    The query is sent to the server the first time that this object (or some derivative thereof) is
+    awaited, and never more than once. All the records are read at that point, and the data, graph
+    and summary are all derived from them.
     """
     def __init__(
         self,
-        execute: Callable[[Callable[[neo4j.Transaction], R]], Awaitable[R]],
+        execute: Callable[[Callable[[neo4j.Transaction], Any]], Awaitable[Any]],
         func: Callable[[neo4j.Transaction], neo4j.Result]
     ):
         self._func = func
         self._execute = execute
+        self._materialised: Optional['asyncio.Future[_Materialised]'] = None
+
+    async def _materialise(self, keep_records: bool = True) -> _Materialised:
+        if self._materialised is None:
+            self._materialised = asyncio.ensure_future(
+                self._execute(lambda tx: _materialise(self._func(tx), keep_records=keep_records)))
+        # Shielded so that one cancelled caller does not fail every other caller waiting on the same result
+        return await asyncio.shield(self._materialised)
+
+    async def _records(self) -> List[neo4j.Record]:
+        records = (await self._materialise()).records
+        if records is None:
+            raise RuntimeError("The records of this result were discarded when it was streamed or its graph was built "
+                               "incrementally")
+        return records
+
+    async def _graph(self, keep_records: bool = True) -> neo4j.graph.Graph:
+        graph = (await self._materialise(keep_records=keep_records)).graph
+        if graph is None:
+            raise RuntimeError("The graph of this result was discarded when it was streamed and the stream was "
+                               "abandoned")
+        return graph
 
     def __await__(self):
-        return self._execute(self._func).__await__()
+        async def __inner():
+            return (await self._materialise()).result
+        return __inner().__await__()
 
     def single(self) -> Record:
         """Returns an aioneo4j.Record object, which is an Awaitable[neo4j.Record]
 
         Useful if the wrapped query is expected to return a single result.
         """
-        return Record(self._execute, lambda tx: self._func(tx).single())
-
-    def graph(self) -> Graph:
+        async def __inner() -> Optional[neo4j.Record]:
+            records = await self._records()
+            if len(records) > 1:
+                warnings.warn("Expected a result with a single record, but this result contains at least one more")
+            return records[0] if records else None
+        return Record(__inner())
+
+    def graph(self, incremental: bool = False) -> Graph:
         """Returns an aioneo4j.graph.Graph object which is an Awaitable[neo4j.graph.Graph]
 
         Useful if the wrapped query is expected to return multiple results.
+
+        :param incremental: If True, and the query has not already been run, then the nodes and relationships
+                            are collected as the records stream in and the records themselves are dropped,
+                            which roughly halves peak memory use for large results. The records are then no
+                            longer available to single() or data().
         """
-        return Graph(self._execute, lambda tx: self._func(tx).graph())
+        async def __inner() -> neo4j.graph.Graph:
+            return await self._graph(keep_records=not incremental)
+        return Graph(__inner())
 
     async def data(self) -> List[Dict[str, Any]]:
         """Deserialises the data in this result as a list of dictionaries and returns it.
         """
-        return cast(List[Dict[str, Any]], await self._execute(lambda tx: self._func(tx).data()))
+        return [record.data() for record in await self._records()]
+
+    async def consume(self) -> neo4j.ResultSummary:
+        """Returns the neo4j.ResultSummary for this result.
+        """
+        return (await self._materialise()).summary
+
+    async def stream(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_buffered_batches: int = DEFAULT_MAX_BUFFERED_BATCHES
+    ) -> AsyncIterator[neo4j.Record]:
+        """Returns an asynchronous iterator over the neo4j.Record objects in this result.
+
+        If the query has not yet been run then the records are handed from the IO thread to the event loop in
+        batches as they arrive, and are not retained afterwards, so single() and data() cannot be used on this
+        Result once it has been streamed, nor graph() if iteration was abandoned before the end, since building the
+        graph would mean reading every remaining record. The IO thread is paused whenever max_buffered_batches
+        batches are waiting to be consumed, so no other query can be run on the same Session until iteration has
+        finished or been abandoned.
+
+        :param batch_size: The number of records to hand from the IO thread to the event loop at once
+        :param max_buffered_batches: The maximum number of batches that the IO thread may read ahead
+        """
+        if self._materialised is not None:
+            for record in await self._records():
+                yield record
+            return
+
+        loop = asyncio.get_running_loop()
+        batches: 'asyncio.Queue[Optional[List[neo4j.Record]]]' = asyncio.Queue()
+        credits = threading.Semaphore(max_buffered_batches)
+        abandoned = threading.Event()
+
+        def __produce(tx: neo4j.Transaction) -> _Materialised:
+            try:
+                result = self._func(tx)
+                batch: List[neo4j.Record] = []
+                for record in result:
+                    batch.append(record)
+                    if len(batch) >= batch_size:
+                        credits.acquire()
+                        if abandoned.is_set():
+                            break
+                        loop.call_soon_threadsafe(batches.put_nowait, batch)
+                        batch = []
+                else:
+                    if batch:
+                        loop.call_soon_threadsafe(batches.put_nowait, batch)
+                    # Every record has been read, so the graph is complete and asking for it buffers nothing
+                    return _Materialised(result, None, result.graph(), result.consume())
+                # The stream was abandoned. Asking for the graph would buffer every record not yet read, so there is
+                # none, and consuming the result discards those records without reading them
+                return _Materialised(result, None, None, result.consume())
+            finally:
+                loop.call_soon_threadsafe(batches.put_nowait, None)
+
+        execution = asyncio.ensure_future(self._execute(__produce))
+        execution.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._materialised = execution
+
+        try:
+            while True:
+                batch = await batches.get()
+                if batch is None:
+                    break
+                credits.release()
+                for record in batch:
+                    yield record
+            await asyncio.shield(execution)
+        finally:
+            if not execution.done():
+                abandoned.set()
+                credits.release()
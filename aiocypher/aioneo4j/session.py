@@ -15,22 +15,43 @@
 # limitations under the License.
 #
 
-from ..interface.session import Session as AbstractSession
+from ..interface.session import Session as AbstractSession, READ_COMMITTED
 
 import asyncio
+import contextvars
+import threading
 import time
-from typing import Optional, TypeVar, Callable, AsyncContextManager, Tuple, Any, cast
-from queue import Empty, Full
+from typing import Optional, TypeVar, Callable, AsyncContextManager, Tuple, List, Any, cast
+from queue import SimpleQueue, Empty
 
 import neo4j
-import janus
 from async_generator import asynccontextmanager
 
 from .transaction import Transaction
+from .threads import IOThreadPool
+from ..metrics import Metrics, QUEUE_WAIT
 
 
 R = TypeVar('R')
 
+_Command = Tuple[Callable[[neo4j.Session], Any], 'asyncio.Future[Any]']
+_Response = Tuple['asyncio.Future[Any]', Any, Optional[BaseException]]
+
+
+def _resolve(future: 'asyncio.Future[Any]', r: Any, e: Optional[BaseException]) -> None:
+    # The awaiting coroutine may have been cancelled whilst the command was running
+    if future.done():
+        return
+    if e is not None:
+        future.set_exception(e)
+    else:
+        future.set_result(r)
+
+
+def _resolve_all(responses: List[_Response]) -> None:
+    for (future, r, e) in responses:
+        _resolve(future, r, e)
+
 
 class Session (AbstractSession):
     """This object encapsulates a neo4j.Session object. It should not be initialised directly, but
@@ -42,59 +63,122 @@ class Session (AbstractSession):
 
     Each Session object maintains its own connection thread for performing IO. A Session object is
     the only supported way to interact with the neo4j database.
+
+    The IO thread blocks on its command queue when idle, and is woken as soon as a command is
+    submitted. Responses are handed back to the event loop via loop.call_soon_threadsafe.
+
+    If pipelined is True then commands are not submitted one at a time. Instead all of the commands issued
+    during one iteration of the event loop (eg. several Results of the same transaction awaited together with
+    asyncio.gather) are handed to the IO thread as a single batch and run back to back, and all of their
+    responses are returned to the event loop together. Each command still succeeds or fails individually.
+
+    The IO thread is taken from io_threads, which is the IOThreadPool belonging to the Driver. If it is None
+    then the event loop's default executor is used instead.
+
+    If metrics is set then the time each command waits before the IO thread starts running it is reported to it.
+
+    Each command runs on the IO thread in a copy of the context it was issued from, so context variables, such as
+    the current span of a tracer, are the same there as in the coroutine which awaited it.
     """
-    def __init__(self, sync_driver: 'asyncio.Future[neo4j.Driver]', **kwargs):
+    def __init__(
+        self,
+        sync_driver: 'asyncio.Future[neo4j.Driver]',
+        io_threads: Optional[IOThreadPool] = None,
+        pipelined: bool = False,
+        metrics: Optional[Metrics] = None,
+        **kwargs
+    ):
         self.sync_driver = sync_driver
+        self.__io_threads = io_threads
+        self.__pipelined = pipelined
+        self.__metrics = metrics
+        self.__pipeline: List[_Command] = []
         self.__thread: Optional['asyncio.Future[None]'] = None
-        self.__die = False
 
         self.__kwargs = kwargs
 
         if "database" in self.__kwargs and self.__kwargs['database'] is None:
             self.__kwargs['database'] = neo4j.DEFAULT_DATABASE
 
-        self._command_queue: janus.Queue[Callable[[neo4j.Transaction], Any]] = janus.Queue(maxsize=1)
-        self._response_queue: janus.Queue[Tuple[Any, Optional[BaseException]]] = janus.Queue(maxsize=1)
+        # Commands are submitted in batches, and None is used as a sentinel to tell the IO thread to shut down
+        self._command_queue: 'SimpleQueue[Optional[List[_Command]]]' = SimpleQueue()
+        self.__lock = threading.Lock()
+        self.__open = False
+        self.__error: Optional[BaseException] = None
 
         self._transaction: Optional[Transaction] = None
 
     async def __aenter__(self) -> 'Session':
-        self.__die = False
         loop = asyncio.get_running_loop()
-        self.__thread = cast(
-            'asyncio.Future[None]',
-            loop.run_in_executor(None, self._thread_main, await self.sync_driver))
+        sync_driver = await self.sync_driver
+        with self.__lock:
+            self.__open = True
+            self.__error = None
+        try:
+            if self.__io_threads is not None:
+                self.__thread = await self.__io_threads.start_session_thread(self._thread_main, sync_driver, loop)
+            else:
+                self.__thread = cast(
+                    'asyncio.Future[None]',
+                    loop.run_in_executor(None, self._thread_main, sync_driver, loop))
+        except BaseException:
+            with self.__lock:
+                self.__open = False
+            raise
         return self
 
     async def __aexit__(self, *args) -> bool:
-        self.__die = True
+        self.__submit_pipeline()
+        with self.__lock:
+            if self.__open:
+                self.__open = False
+                self._command_queue.put(None)
         if self.__thread is not None:
-            await self.__thread
+            thread = self.__thread
+            self.__thread = None
+            await thread
         return False
 
-    def _thread_main(self, sync_driver: neo4j.Driver) -> None:
-        with sync_driver.session(**self.__kwargs) as session:
-            while not self.__die:
-                try:
-                    cmd = self._command_queue.sync_q.get(block=False)
-                except Empty:
-                    time.sleep(0.01)
-                    continue
+    def _is_open(self) -> bool:
+        """True if the IO thread is running and able to accept commands."""
+        with self.__lock:
+            return self.__open and self.__error is None and self.__thread is not None and not self.__thread.done()
 
-                try:
-                    (r, e) = (cmd(session), None)
-                except BaseException as ex:
-                    (r, e) = (None, ex)
-
-                while not self.__die:
-                    try:
-                        self._response_queue.sync_q.put((r, e), block=False)
-                    except Full:
-                        time.sleep(0.01)
-                        continue
-                    else:
+    def _thread_main(self, sync_driver: neo4j.Driver, loop: asyncio.AbstractEventLoop) -> None:
+        try:
+            with sync_driver.session(**self.__kwargs) as session:
+                while True:
+                    commands = self._command_queue.get()
+                    if commands is None:
                         break
 
+                    responses: List[_Response] = []
+                    for (cmd, future) in commands:
+                        try:
+                            responses.append((future, cmd(session), None))
+                        except BaseException as e:
+                            responses.append((future, None, e))
+
+                    loop.call_soon_threadsafe(_resolve_all, responses)
+        except BaseException as e:
+            self.__fail_pending(loop, e)
+            raise
+
+    def __fail_pending(self, loop: asyncio.AbstractEventLoop, e: BaseException) -> None:
+        """Called on the IO thread if the underlying session could not be opened or has failed. Any commands
+        which were waiting for it are failed with the same exception, as are any submitted later.
+        """
+        with self.__lock:
+            self.__error = e
+            while True:
+                try:
+                    commands = self._command_queue.get_nowait()
+                except Empty:
+                    break
+                if commands is not None:
+                    responses: List[_Response] = [(future, None, e) for (_, future) in commands]
+                    loop.call_soon_threadsafe(_resolve_all, responses)
+
     async def _execute(self, f: Callable[[neo4j.Session], R]) -> R:
         """Although not strictly part of the public interface this coroutine
         may occasionally be useful when doing things not yet supported by
@@ -108,27 +192,97 @@ class Session (AbstractSession):
         :returns: The return value of f
         :raises: Any exception raised by f
         """
-        await self._command_queue.async_q.put(f)
-        (r, e) = await self._response_queue.async_q.get()
-        if e is not None:
-            raise e
-        return r
+        loop = asyncio.get_running_loop()
+        future: 'asyncio.Future[R]' = loop.create_future()
+        if self.__metrics is not None:
+            f = self.__timed(f, self.__metrics)
+        f = self.__in_context(f, contextvars.copy_context())
+        with self.__lock:
+            if self.__error is not None:
+                raise self.__error
+            if not self.__open:
+                raise RuntimeError("Session is not open")
+            if not self.__pipelined:
+                self._command_queue.put([(f, future)])
+            else:
+                if not self.__pipeline:
+                    loop.call_soon(self.__submit_pipeline)
+                self.__pipeline.append((f, future))
+        return await future
+
+    @staticmethod
+    def __timed(f: Callable[[neo4j.Session], R], metrics: Metrics) -> Callable[[neo4j.Session], R]:
+        submitted = time.perf_counter()
+
+        def __inner(session: neo4j.Session) -> R:
+            metrics.observe(QUEUE_WAIT, time.perf_counter() - submitted)
+            return f(session)
+        return __inner
+
+    @staticmethod
+    def __in_context(f: Callable[[neo4j.Session], R], context: contextvars.Context) -> Callable[[neo4j.Session], R]:
+        def __inner(session: neo4j.Session) -> R:
+            return context.run(f, session)
+        return __inner
+
+    def __submit_pipeline(self) -> None:
+        """Hands all of the commands issued since the last call to the IO thread as a single batch."""
+        with self.__lock:
+            (commands, self.__pipeline) = (self.__pipeline, [])
+            if not commands:
+                return
+            if self.__error is not None or not self.__open:
+                e = self.__error if self.__error is not None else RuntimeError("Session is not open")
+                _resolve_all([(future, None, e) for (_, future) in commands])
+            else:
+                self._command_queue.put(commands)
+
+    def _open_read_session(self, session: neo4j.Session) -> neo4j.Session:
+        """Called on the IO thread to open a second neo4j session for a read only transaction. It is given the
+        bookmarks of the main session so that it sees everything that has been written through this one.
+        """
+        bookmarks: Any
+        if hasattr(session, 'last_bookmarks'):
+            bookmarks = session.last_bookmarks()
+        else:
+            bookmark = session.last_bookmark()
+            bookmarks = [bookmark] if bookmark is not None else []
+        kwargs = dict(self.__kwargs, default_access_mode=neo4j.READ_ACCESS, bookmarks=bookmarks)
+        return self.sync_driver.result().session(**kwargs)
 
-    def begin_transaction(self) -> AsyncContextManager[Transaction]:
+    def begin_transaction(
+        self,
+        read_only: bool = False,
+        isolation: Optional[str] = None
+    ) -> AsyncContextManager[Transaction]:
         """This is the main method for interacting with the Session. It
         creates a new Transaction which is then represented by an Async Context Manager
         yielding an aioneo4j.Transaction object.
+
+        neo4j sessions have a fixed access mode, so unless this session was opened with
+        default_access_mode=neo4j.READ_ACCESS a read only transaction is run in a separate neo4j session
+        which is closed when the transaction ends.
+
+        :param read_only: If True the transaction uses READ_ACCESS, and so may be routed to a read replica
+        :param isolation: Only None or READ COMMITTED, which is what neo4j provides
         """
+        if isolation is not None and isolation.upper() != READ_COMMITTED:
+            raise ValueError(f"Unsupported isolation level {isolation!r}, neo4j only provides {READ_COMMITTED}")
+
+        open_session: Optional[Callable[[neo4j.Session], neo4j.Session]] = None
+        if read_only and self.__kwargs.get('default_access_mode', neo4j.WRITE_ACCESS) != neo4j.READ_ACCESS:
+            open_session = self._open_read_session
+
         @asynccontextmanager
         async def __inner():
             if self._transaction is not None:
                 raise neo4j.exceptions.TransactionError()
 
-            self._transaction = Transaction(self._execute)
-
-            async with self._transaction:
-                yield self._transaction
-
-            self._transaction = None
+            self._transaction = Transaction(self._execute, open_session)
+            try:
+                async with self._transaction:
+                    yield self._transaction
+            finally:
+                self._transaction = None
 
         return __inner()
@@ -0,0 +1,107 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from ..interface.exceptions import SessionLimitReached
+from ..metrics import Metrics, IO_THREADS
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Callable, TypeVar, Any, cast
+
+
+R = TypeVar('R')
+
+
+class IOThreadPool (object):
+    """The threads used by an aioneo4j.Driver and its Sessions, kept apart from the event loop's default
+    executor so that long running session threads cannot starve other users of it.
+
+    Each open Session occupies one thread for as long as it is open, and at most max_sessions may be open at
+    once. One further thread is kept for short jobs such as creating and closing the neo4j.Driver.
+
+    :param max_sessions: The maximum number of Sessions which may be open at once
+    :param acquire_timeout: How long a new Session will wait for another to close when max_sessions are already
+                            open before SessionLimitReached is raised, or None to wait indefinitely
+    :param metrics: If set the number of threads occupied by sessions is reported to it
+    """
+    def __init__(self,
+                 max_sessions: int = 32,
+                 acquire_timeout: Optional[float] = None,
+                 metrics: Optional[Metrics] = None):
+        if max_sessions < 1:
+            raise ValueError(f"max_sessions must be at least 1, not {max_sessions}")
+        self.max_sessions = max_sessions
+        self.acquire_timeout = acquire_timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._open_sessions = 0
+        self.metrics = metrics
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_sessions + 1,
+                thread_name_prefix="aioneo4j")
+        return self._executor
+
+    @property
+    def open_sessions(self) -> int:
+        return self._open_sessions
+
+    def run(self, f: Callable[..., R], *args) -> 'asyncio.Future[R]':
+        """Runs a short job on one of the threads."""
+        return cast('asyncio.Future[R]', asyncio.get_running_loop().run_in_executor(self.executor, f, *args))
+
+    async def start_session_thread(self, f: Callable[..., None], *args) -> 'asyncio.Future[None]':
+        """Waits until a session may be opened and then runs f on one of the threads. The permission to open a
+        session is returned when f returns.
+
+        :raises SessionLimitReached: if no session could be opened before acquire_timeout
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_sessions)
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.acquire_timeout)
+        except asyncio.TimeoutError:
+            raise SessionLimitReached(self.max_sessions, cast(float, self.acquire_timeout)) from None
+
+        try:
+            thread = self.run(f, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        self._open_sessions += 1
+        self.__report()
+        thread.add_done_callback(self.__session_thread_done)
+        return thread
+
+    def __session_thread_done(self, _: Any) -> None:
+        self._open_sessions -= 1
+        self.__report()
+        if self._slots is not None:
+            self._slots.release()
+
+    def __report(self) -> None:
+        if self.metrics is not None:
+            self.metrics.set_gauge(IO_THREADS, self._open_sessions)
+
+    def shutdown(self) -> None:
+        """Stops accepting new jobs. Threads which are already running are left to finish."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -16,8 +16,11 @@
 #
 
 from ..interface.transaction import Transaction as AbstractTransaction
+from ..internal.batch import DEFAULT_CHUNK_SIZE, ROWS_PARAMETER, unwind_query, chunked
 
-from typing import Optional, TypeVar, Callable, Awaitable
+import asyncio
+from functools import partial
+from typing import Optional, TypeVar, Callable, Awaitable, Iterable, Mapping, Dict, List, Any
 
 import neo4j
 
@@ -32,18 +35,49 @@ class Transaction (AbstractTransaction):
 
     Should always be used as an Async Context Manager. Using any of its methods outside of
     the context may lead to undefined behaviour.
+
+    If open_session is provided then it is called on the IO thread with the session's neo4j.Session, and the
+    transaction is begun on the neo4j.Session it returns instead. That session is closed when the transaction
+    ends.
     """
-    def __init__(self, session_execute: Callable[[Callable[[neo4j.Session], R]], Awaitable[R]]):
+    def __init__(
+        self,
+        session_execute: Callable[[Callable[[neo4j.Session], Any]], Awaitable[Any]],
+        open_session: Optional[Callable[[neo4j.Session], neo4j.Session]] = None
+    ):
         self._session_execute = session_execute
+        self._open_session = open_session
+        self._sync_session: Optional[neo4j.Session] = None
         self._sync_transaction: Optional[neo4j.Transaction] = None
 
+    def __begin(self, session: neo4j.Session) -> neo4j.Transaction:
+        if self._open_session is None:
+            return session.begin_transaction().__enter__()
+        self._sync_session = self._open_session(session)
+        try:
+            return self._sync_session.begin_transaction().__enter__()
+        except BaseException:
+            self.__close_session()
+            raise
+
+    def __end(self, *args) -> Any:
+        try:
+            return self._sync_transaction.__exit__(*args)  # type: ignore
+        finally:
+            self.__close_session()
+
+    def __close_session(self) -> None:
+        if self._sync_session is not None:
+            (session, self._sync_session) = (self._sync_session, None)
+            session.close()
+
     async def __aenter__(self) -> "Transaction":
-        self._sync_transaction = await self._session_execute(lambda session: session.begin_transaction().__enter__())
+        self._sync_transaction = await self._session_execute(self.__begin)
         return self
 
     async def __aexit__(self, *args):
         if self._sync_transaction is not None:
-            return await self._session_execute(lambda session: self._sync_transaction.__exit__(*args))
+            return await self._session_execute(lambda session: self.__end(*args))
         else:
             return False
 
@@ -73,3 +107,43 @@ class Transaction (AbstractTransaction):
         :returns: an aioneo4j.Result object, which is a subclass of Awaitable[neo4j.Result]
         """
         return Result(self._execute, lambda tx: tx.run(*args, **kwargs))
+
+    async def run_batch(
+        self,
+        query: str,
+        rows: Iterable[Mapping[str, Any]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **params
+    ) -> int:
+        """Runs a write query once for every entry in rows, as a series of "UNWIND $rows AS row ..." statements
+        each covering up to chunk_size rows.
+
+        Each chunk is run on the IO thread and its result consumed there without reading any records. The next
+        chunk is queued whilst the previous one is still running.
+
+        :returns: The number of rows
+        """
+        statement = unwind_query(query)
+
+        def __run_chunk(parameters: Dict[str, Any], tx: neo4j.Transaction) -> Any:
+            return tx.run(statement, parameters).consume()
+
+        count = 0
+        outstanding: List['asyncio.Future[Any]'] = []
+        try:
+            for chunk in chunked(rows, chunk_size):
+                parameters = dict(params, **{ROWS_PARAMETER: chunk})
+                outstanding.append(asyncio.ensure_future(self._execute(partial(__run_chunk, parameters))))
+                if len(outstanding) > 1:
+                    await outstanding.pop(0)
+                count += len(chunk)
+            if outstanding:
+                await outstanding.pop()
+        except BaseException:
+            # The chunk queued behind the one which failed must not be left running, and its own error is
+            # retrieved here so that only the first one is reported
+            for future in outstanding:
+                future.cancel()
+            await asyncio.gather(*outstanding, return_exceptions=True)
+            raise
+        return count
@@ -0,0 +1,41 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""A limited asyncio wrapper for AgensGraph which uses psycopg 3
+
+It shares the interface of aioagensgraph, but uses psycopg_pool and runs each transaction in pipeline mode. It is
+selected by the scheme "postgresql+psycopg", eg. "postgresql+psycopg://localhost:5432/dbname".
+"""
+
+from typing import List
+
+__all__: List[str] = []
+
+try:
+    from .driver import Driver  # noqa: F401
+    from .session import Session  # noqa: F401
+    from .transaction import Transaction  # noqa: F401
+    from .result import Result  # noqa: F401
+except ImportError:
+    pass
+else:
+    __all__ += [
+        'Driver',
+        'Session',
+        'Transaction',
+        'Result'
+    ]
@@ -0,0 +1,144 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from ..interface.driver import Driver as AbstractDriver
+
+from typing import Tuple, AsyncContextManager, Optional, Dict
+
+from urllib.parse import urlparse
+
+from psycopg import AsyncConnection, AsyncClientCursor
+from psycopg.conninfo import make_conninfo
+from psycopg_pool import AsyncConnectionPool
+
+from .session import Session
+from .state import DriverState
+from .types import register_graph_types
+from ..aioagensgraph.pool import PoolSettings, PoolStats, pool_settings
+from ..config import Config
+from ..internal.postgres import with_statement_timeout
+from ..metrics import Metrics
+
+
+def is_agensgraph_psycopg_address(config: Config) -> bool:
+    address = config.address
+    return urlparse(address).scheme == 'postgresql+psycopg'
+
+
+def _construct_conninfo(
+    address: str,
+    auth: Tuple[str, str],
+    settings: PoolSettings = PoolSettings(),
+    options: Dict[str, str] = {}
+) -> str:
+    addr = urlparse(address)
+    hostname = addr.hostname or '127.0.0.1'
+    port = addr.port or '5432'
+    options = with_statement_timeout(options, settings.statement_timeout)
+    return make_conninfo(
+        host=hostname, user=auth[0], password=auth[1], port=port, dbname=settings.dbname, **options)
+
+
+async def _configure(connection: AsyncConnection) -> None:
+    register_graph_types(connection)
+
+
+@AbstractDriver.register_concrete(is_agensgraph_psycopg_address)
+class Driver (AbstractDriver):
+    """This class encapsulates an agensgraph db driver which uses psycopg 3 and psycopg_pool.
+
+    It is selected by the scheme "postgresql+psycopg", eg. postgresql+psycopg://localhost:5432/dbname, and
+    otherwise behaves like the aioagensgraph Driver, except that each transaction is run in pipeline mode so that
+    queries whose results are not read are sent without waiting for one another.
+
+    The connection pool is configured by the same PoolSettings as the aioagensgraph Driver, given either as keyword
+    arguments or in the query string of the address. Connections are recycled after an hour unless recycle is
+    given, and if acquire_timeout is not given then sessions wait up to psycopg_pool's default of 30 seconds.
+
+    Parameters are bound on the client, as they are by psycopg2, so that the same queries behave the same way on
+    both drivers.
+    """
+    def __init__(self, config: Config, **kwargs):
+        super().__init__(config)
+        self._pool: Optional[AsyncConnectionPool] = None
+
+        (self.pool_settings, options) = pool_settings(self._address, **kwargs)
+        self._state = DriverState(acquire_timeout=self.pool_settings.acquire_timeout)
+
+        self.conninfo = _construct_conninfo(self._address, self._auth, self.pool_settings, options)
+
+    def database_type(self) -> str:
+        return "agensgraph"
+
+    async def __aenter__(self) -> "Driver":
+        await self
+        return self
+
+    async def __aexit__(self, e_t, e_v, e_tb) -> Optional[bool]:
+        await self.close()
+        return False
+
+    async def close(self) -> None:
+        """Closes the connection pool. Awaiting the driver again will open a new one.
+        """
+        (pool, self._pool) = (self._pool, None)
+        if pool is not None:
+            await pool.close()
+
+    def __await__(self):
+        async def __inner():
+            if self._pool is None:
+                settings = self.pool_settings
+                pool = AsyncConnectionPool(
+                    self.conninfo,
+                    min_size=settings.minsize,
+                    max_size=settings.maxsize,
+                    max_lifetime=settings.recycle if settings.recycle > 0 else 3600.0,
+                    kwargs={'autocommit': True, 'cursor_factory': AsyncClientCursor},
+                    configure=_configure,
+                    open=False)
+                await pool.open()
+                self._pool = pool
+            return self._pool
+        return __inner().__await__()
+
+    def session(self, **kwargs) -> AsyncContextManager[Session]:
+        """This method is used to create a Session object, which can be used as an
+        asynchronous context manager.
+
+        All interactions should be done via a Session object. Accessing the driver
+        without one is not supported.
+        """
+        assert (self._pool is not None)
+        return self._wrap_session(Session(self._pool, self._state, **kwargs), kwargs)
+
+    def enable_metrics(self, metrics: Optional[Metrics] = None) -> Metrics:
+        self._state.metrics = super().enable_metrics(metrics)
+        return self._state.metrics
+
+    def pool_stats(self) -> PoolStats:
+        """Returns the current size of the connection pool, how many of its connections are free, how many
+        sessions are waiting for one to be returned, a histogram of how long sessions have waited for connections,
+        and how many gave up waiting.
+        """
+        stats = self._pool.get_stats() if self._pool is not None else {}
+        return PoolStats(
+            size=stats.get('pool_size', 0),
+            free=stats.get('pool_available', 0),
+            waiters=self._state.waiters,
+            acquire_latency=self._state.acquire_latency.snapshot(),
+            acquire_timeouts=self._state.acquire_timeouts)
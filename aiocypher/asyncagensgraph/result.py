@@ -0,0 +1,147 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from ..interface.result import Result as AbstractResult, DEFAULT_BATCH_SIZE, DEFAULT_MAX_BUFFERED_BATCHES
+from ..interface.exceptions import QueryFailed
+from ..internal.postgres import convert_cypher_parameters_to_postgres, rows_to_dicts
+
+from typing import List, Dict, Any, Tuple, AsyncIterator, Optional
+from itertools import count
+
+from psycopg import AsyncConnection, AsyncCursor
+
+from ..aioagensgraph.record import Record
+from ..aioagensgraph.graph import Graph
+
+
+_cursor_names = (f"aiocypher_cursor_{n}" for n in count())
+
+
+class Result (AbstractResult[Any]):
+    """A conceptual wrapper for a query which will return a result of some sort.
+
+    To execute the query and return the underlying cursor await this object. The query is only queued in the
+    transaction's pipeline, so any error it causes is raised when its rows are read, or otherwise when the
+    transaction exits.
+
+    A better way to use this object is to use the 'data()', single()' or 'graph()' methods.
+
+    Iterating over it asynchronously, or building a graph incrementally, uses a server side cursor so that the
+    rows are never all held in memory at once.
+    """
+    def __init__(self, connection: AsyncConnection, *args, **kwargs):
+        self._connection = connection
+        self._args = args
+        self._kwargs = kwargs
+        self._cursor: Optional[AsyncCursor] = None
+
+    def __await__(self):
+        async def __inner():
+            query = convert_cypher_parameters_to_postgres(self._args[0], self._kwargs)
+            self._cursor = self._connection.cursor()
+            try:
+                await self._cursor.execute(query, self._kwargs)
+            except Exception as e:
+                raise QueryFailed(query, self._kwargs) from e
+            else:
+                return self._cursor
+        return __inner().__await__()
+
+    async def _fetchall(self) -> Tuple[AsyncCursor, List[Tuple[Any, ...]]]:
+        cursor = await self
+        try:
+            return (cursor, await cursor.fetchall())
+        except Exception as e:
+            raise QueryFailed(self._args[0], self._kwargs) from e
+
+    def single(self) -> Record:
+        """Returns an Record object
+
+        Useful if the wrapped query is expected to return a single result.
+        """
+        async def __inner():
+            cursor = await self
+            try:
+                result = await cursor.fetchone()
+            except Exception as e:
+                raise QueryFailed(self._args[0], self._kwargs) from e
+            return result[0] if result else None
+        return Record(__inner())
+
+    def graph(self, incremental: bool = False) -> Graph:
+        """Returns an Graph object
+
+        Useful if the wrapped query is expected to return multiple results.
+
+        :param incremental: If True the rows are streamed from a server side cursor and discarded once they have
+                            been added to the graph, so awaiting the Graph returns None rather than the rows
+        """
+        if incremental:
+            return Graph(rows=self.stream())
+
+        async def __inner():
+            (_, rows) = await self._fetchall()
+            return rows
+        return Graph(__inner())
+
+    async def data(self) -> List[Dict[str, Any]]:
+        """Deserialises the data in this result as a list of dictionaries and returns it.
+
+        Each dictionary is keyed on the column names of the result, and any vertices or edges are replaced by
+        dictionaries of their properties and any paths by lists of those. Unlike neo4j, edges do not include
+        the properties of their endpoints.
+        """
+        (cursor, rows) = await self._fetchall()
+        if cursor.description is None:
+            return []
+        return rows_to_dicts(cursor.description, rows)
+
+    async def stream(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_buffered_batches: int = DEFAULT_MAX_BUFFERED_BATCHES
+    ) -> AsyncIterator[Tuple[Any, ...]]:
+        """Returns an asynchronous iterator over the rows of this result.
+
+        The query is run through a server side cursor (DECLARE ... CURSOR FOR), and the rows are fetched from it
+        batch_size at a time, so only one batch is held in memory. The next FETCH is queued in the pipeline before
+        the rows of the current one are yielded, so up to two batches are held, and max_buffered_batches has no
+        further effect.
+
+        The cursor lasts only as long as the transaction, so the rows must be consumed within it.
+        """
+        query = convert_cypher_parameters_to_postgres(self._args[0], self._kwargs)
+        name = next(_cursor_names)
+        fetch = f"FETCH FORWARD {int(batch_size)} FROM {name}"
+        try:
+            await self._connection.execute(f"DECLARE {name} NO SCROLL CURSOR FOR {query}", self._kwargs)
+            cursor = await self._connection.execute(fetch)
+            rows = await cursor.fetchall()
+        except Exception as e:
+            raise QueryFailed(query, self._kwargs) from e
+        try:
+            while rows:
+                cursor = await self._connection.execute(fetch)
+                for row in rows:
+                    yield row
+                rows = await cursor.fetchall()
+        finally:
+            try:
+                await self._connection.execute(f"CLOSE {name}")
+            except Exception:
+                # The transaction has already failed, which will have closed the cursor
+                pass
@@ -0,0 +1,41 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from ..internal.agensgraph import AgensGraphSession
+
+from typing import Optional
+
+from psycopg_pool import AsyncConnectionPool
+
+from .transaction import Transaction
+from .state import DriverState
+
+
+class Session (AgensGraphSession):
+    """This object encapsulates a session with an agensgraph database. It should not be initialised directly, but
+    created via an Driver object.
+
+    It should always be used as an Async Context Manager, and using its methods outside of its
+    context may lead to undefined behaviour.
+
+    The state is shared between all the sessions of a Driver, if it is None then the session has state of its own.
+    """
+    _new_state = DriverState
+    _new_transaction = Transaction
+
+    def __init__(self, pool: AsyncConnectionPool, state: Optional[DriverState] = None, **kwargs):
+        super().__init__(pool, state, **kwargs)
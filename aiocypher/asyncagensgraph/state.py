@@ -0,0 +1,55 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from psycopg import AsyncConnection, sql
+from psycopg_pool import AsyncConnectionPool, PoolTimeout
+from async_exit_stack import AsyncExitStack
+
+from ..interface.exceptions import PoolAcquireTimeout
+from ..internal.agensgraph import AgensGraphDriverState, CREATE_GRAPH, SET_GRAPH_PATH
+
+
+class DriverState (AgensGraphDriverState):
+    """State shared by all the sessions of a single Driver, used to avoid repeating setup statements on every
+    transaction. See AgensGraphDriverState for what it remembers and measures.
+
+    Since the setup statements are pipelined, whether they succeeded is only known once the transaction which
+    follows them has finished, so a transaction which fails must call forget.
+    """
+    async def _acquire(self, pool: AsyncConnectionPool, exit_stack: AsyncExitStack) -> AsyncConnection:
+        try:
+            return await exit_stack.enter_async_context(pool.connection(timeout=self._acquire_timeout))
+        except PoolTimeout:
+            raise PoolAcquireTimeout(pool.max_size, self._acquire_timeout or pool.timeout) from None
+
+    @staticmethod
+    def _exhausted(pool: AsyncConnectionPool) -> bool:
+        stats = pool.get_stats()
+        return stats.get('pool_available', 0) == 0 and stats.get('pool_size', 0) >= pool.max_size
+
+    async def _set_graph_path(self, connection: AsyncConnection, graph: str, create: bool) -> None:
+        # In pipeline mode these are only queued
+        if create:
+            await connection.execute(sql.SQL(CREATE_GRAPH).format(sql.Identifier(graph)))
+        await connection.execute(sql.SQL(SET_GRAPH_PATH).format(sql.Identifier(graph)))
+
+    def forget(self, connection: AsyncConnection, graph: str) -> None:
+        """Forgets that the graph exists and is the graph_path of the connection, so that the statements are issued
+        again by the next transaction.
+        """
+        self._graphs.discard(graph)
+        self._graph_paths.pop(connection, None)
@@ -0,0 +1,128 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from ..interface.transaction import Transaction as AbstractTransaction
+from ..interface.exceptions import QueryFailed
+from ..internal.postgres import begin_statement, convert_cypher_parameters_to_postgres
+from ..internal.batch import DEFAULT_CHUNK_SIZE, ROWS_PARAMETER, chunked
+
+from typing import Optional, Iterable, Mapping, Any
+
+from psycopg import AsyncConnection
+from psycopg.types.json import Json
+from async_exit_stack import AsyncExitStack
+
+from .result import Result
+from .state import DriverState
+
+
+class Transaction (AbstractTransaction):
+    """A class which encapsulates a Transaction. Should never be created directly,
+    but always via an Session object.
+
+    The connection is in pipeline mode for the whole of the transaction, so the setup statements, the BEGIN,
+    every query whose results are not read, and the COMMIT are sent without waiting for each other. Reading the
+    results of a query waits only for the statements queued before it. As a consequence a failing query which
+    is not read from is only reported when the transaction exits.
+    """
+    def __init__(
+        self,
+        connection: AsyncConnection,
+        database: str,
+        state: Optional[DriverState] = None,
+        read_only: bool = False,
+        isolation: Optional[str] = None
+    ):
+        self._begin = begin_statement(read_only, isolation)
+        self._exit_stack = AsyncExitStack()
+        self._connection = connection
+        self._dbname = database
+        self._state = state if state is not None else DriverState()
+        self._begun = False
+
+    def __await__(self):
+        async def __inner():
+            if not self._begun:
+                await self._exit_stack.enter_async_context(self._connection.pipeline())
+                await self._state.use_graph(self._connection, self._dbname)
+                await self._connection.execute(self._begin)
+                self._begun = True
+            return self._connection
+        return __inner().__await__()
+
+    async def __aenter__(self) -> "Transaction":
+        await self._exit_stack.__aenter__()
+        await self
+        return self
+
+    async def __aexit__(self, exc_t, exc_v, exc_tb):
+        try:
+            if self._begun and exc_v is None:
+                await self._connection.execute("COMMIT")
+            # Leaving pipeline mode waits for everything queued, raising the first error if the commit failed
+            result = await self._exit_stack.__aexit__(exc_t, exc_v, exc_tb)
+        except BaseException:
+            self._state.forget(self._connection, self._dbname)
+            await self._rollback()
+            raise
+        if exc_v is not None:
+            self._state.forget(self._connection, self._dbname)
+            await self._rollback()
+        return result
+
+    async def _rollback(self) -> None:
+        if self._begun:
+            try:
+                await self._connection.execute("ROLLBACK")
+            except Exception:
+                pass
+
+    def run(self, *args, **kwargs) -> Result:
+        """This is the main routine for this class.
+
+        :returns: a Result object
+        """
+        return Result(self._connection, *args, **kwargs)
+
+    async def run_batch(
+        self,
+        query: str,
+        rows: Iterable[Mapping[str, Any]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **params
+    ) -> int:
+        """Runs a write query once for every entry in rows, as a series of "UNWIND $rows AS row ..." statements
+        each covering up to chunk_size rows.
+
+        The statement is translated once, and each chunk is sent to the server as a single jsonb parameter. All
+        of the chunks are pipelined.
+
+        :returns: The number of rows
+        """
+        await self
+        statement = (
+            f"UNWIND %({ROWS_PARAMETER})s::jsonb AS row\n" +
+            convert_cypher_parameters_to_postgres(query, params))
+        count = 0
+        for chunk in chunked(rows, chunk_size):
+            parameters = dict(params, **{ROWS_PARAMETER: Json(chunk)})
+            try:
+                await self._connection.execute(statement, parameters)
+            except Exception as e:
+                raise QueryFailed(statement, parameters) from e
+            count += len(chunk)
+        return count
@@ -0,0 +1,148 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Loaders for the graph types of AgensGraph.
+
+The values are decoded from their text representation into the same dictionaries that the agensgraph package
+produces for psycopg2, so that the Graph, Node and Relationship classes of aioagensgraph can be shared.
+"""
+
+import json
+import re
+from typing import Any, Dict, List
+
+from psycopg.abc import AdaptContext, Buffer
+from psycopg.adapt import Loader
+from psycopg.types import TypeInfo
+
+__all__ = [
+    "parse_vertex",
+    "parse_edge",
+    "parse_path",
+    "register_graph_types"
+]
+
+
+_VERTEX = re.compile(r'(?P<label>[^\[]+)\[(?P<vid>\d+\.\d+)\](?P<properties>.*)', re.DOTALL)
+_EDGE = re.compile(
+    r'(?P<label>[^\[]+)\[(?P<eid>\d+\.\d+)\]\[(?P<source>\d+\.\d+),(?P<destination>\d+\.\d+)\](?P<properties>.*)',
+    re.DOTALL)
+
+
+def parse_vertex(text: str) -> Dict[str, Any]:
+    """Parses the text of a vertex, eg. person[3.1]{"name": "Alice"}"""
+    match = _VERTEX.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Malformed vertex: {text!r}")
+    vertex: Dict[str, Any] = {'type': 'vertex', 'label': match['label'], 'vid': match['vid']}
+    vertex.update(json.loads(match['properties']))
+    return vertex
+
+
+def parse_edge(text: str) -> Dict[str, Any]:
+    """Parses the text of an edge, eg. knows[4.1][3.1,3.2]{"since": 2001}"""
+    match = _EDGE.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Malformed edge: {text!r}")
+    edge: Dict[str, Any] = {
+        'type': 'edge',
+        'label': match['label'],
+        'eid': match['eid'],
+        'source_vid': match['source'],
+        'destination_vid': match['destination']
+    }
+    edge.update(json.loads(match['properties']))
+    return edge
+
+
+def _split_path(text: str) -> List[str]:
+    """Splits the text of a path into the texts of its vertices and edges, which are separated by commas that are
+    not inside brackets, braces or JSON strings.
+    """
+    if not (text.startswith('[') and text.endswith(']')):
+        raise ValueError(f"Malformed path: {text!r}")
+    body = text[1:-1]
+    parts = []
+    depth = 0
+    start = 0
+    in_string = False
+    escaped = False
+    for (n, c) in enumerate(body):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == '\\':
+                escaped = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c in '[{':
+            depth += 1
+        elif c in ']}':
+            depth -= 1
+        elif c == ',' and depth == 0:
+            parts.append(body[start:n])
+            start = n + 1
+    if body:
+        parts.append(body[start:])
+    return parts
+
+
+def parse_path(text: str) -> Dict[str, Any]:
+    """Parses the text of a path, which alternates vertices and edges, eg. [person[3.1]{},knows[4.1][3.1,3.2]{},...]
+    """
+    parts = _split_path(text)
+    return {
+        'type': 'path',
+        'vertices': [parse_vertex(part) for part in parts[0::2]],
+        'edges': [parse_edge(part) for part in parts[1::2]]
+    }
+
+
+class _GraphLoader (Loader):
+    parse = staticmethod(parse_vertex)
+
+    def load(self, data: Buffer) -> Dict[str, Any]:
+        return self.parse(bytes(data).decode('utf-8'))
+
+
+class _VertexLoader (_GraphLoader):
+    parse = staticmethod(parse_vertex)
+
+
+class _EdgeLoader (_GraphLoader):
+    parse = staticmethod(parse_edge)
+
+
+class _PathLoader (_GraphLoader):
+    parse = staticmethod(parse_path)
+
+
+# The names, oids and array oids of the graph types, which are fixed by AgensGraph
+_GRAPH_TYPES = (
+    ("vertex", 7012, 7011, _VertexLoader),
+    ("edge", 7022, 7021, _EdgeLoader),
+    ("graphpath", 7032, 7031, _PathLoader),
+)
+
+
+def register_graph_types(context: AdaptContext) -> None:
+    """Registers loaders for vertices, edges and paths, and arrays of them, on a connection or cursor."""
+    for (name, oid, array_oid, loader) in _GRAPH_TYPES:
+        context.adapters.register_loader(oid, loader)
+        TypeInfo(name, oid, array_oid).register(context)
@@ -0,0 +1,44 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""A limited asyncio wrapper for the native asyncio interface of the neo4j driver
+
+Unlike aioneo4j this does not need an IO thread per Session, but it does require version 5 or later of the
+neo4j driver. It is selected by adding "+async" to the end of the scheme of a neo4j address, eg.
+"bolt+async://localhost:7687" or "neo4j+s+async://example.com".
+"""
+
+from typing import List
+
+__all__: List[str] = []
+
+try:
+    from .driver import Driver  # noqa: F401
+    from .session import Session  # noqa: F401
+    from .transaction import Transaction  # noqa: F401
+    from .result import Result  # noqa: F401
+    from .record import Record  # noqa: F401
+except ImportError:
+    pass
+else:
+    __all__ += [
+        'Driver',
+        'Session',
+        'Transaction',
+        'Result',
+        'Record'
+    ]
@@ -0,0 +1,94 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from ..interface.driver import Driver as AbstractDriver
+from .session import Session
+from ..config import Config
+
+from typing import Optional, AsyncContextManager
+
+import neo4j
+from neo4j import AsyncGraphDatabase
+from async_generator import asynccontextmanager
+
+from urllib.parse import urlparse, urlunparse
+import re
+
+
+ASYNC_SCHEME_SUFFIX = "+async"
+
+
+def is_neo4j_async_address(config: Config) -> bool:
+    address = config.address
+    return bool(re.match(r'^(neo4j|bolt)(\+.+)?\+async$', urlparse(address).scheme))
+
+
+def _strip_async_scheme(address: str) -> str:
+    addr = urlparse(address)
+    return urlunparse(addr._replace(scheme=addr.scheme[:-len(ASYNC_SCHEME_SUFFIX)]))
+
+
+@AbstractDriver.register_concrete(is_neo4j_async_address)
+class Driver (AbstractDriver):
+    """This class encapsulates the neo4j.AsyncDriver object, it's interface is similar but
+    limited to what has been implemented yet.
+    """
+    def __init__(self,
+                 config: Config):
+        super().__init__(config)
+        self._async_driver: Optional[neo4j.AsyncDriver] = None
+
+    def database_type(self) -> str:
+        return "neo4j"
+
+    @property
+    def async_driver(self) -> neo4j.AsyncDriver:
+        """This property is the underlying neo4j.AsyncDriver object, which is created when first needed.
+        """
+        if self._async_driver is None:
+            self._async_driver = AsyncGraphDatabase.driver(
+                _strip_async_scheme(self._address),
+                auth=self._auth)
+        return self._async_driver
+
+    def __await__(self):
+        async def __inner():
+            return self.async_driver
+        return __inner().__await__()
+
+    async def close(self) -> None:
+        """This coroutine should be awaited when the driver is no longer needed.
+        """
+        if self._async_driver is not None:
+            async_driver = self._async_driver
+            self._async_driver = None
+            await async_driver.close()
+
+    def session(self, **kwargs) -> AsyncContextManager[Session]:
+        """This method is used to create a asyncneo4j.Session object, which can be used as an
+        asynchronous context manager.
+
+        All interactions should be done via a Session object. Accessing the driver
+        without one is not supported.
+        """
+        @asynccontextmanager
+        async def __inner(async_driver: neo4j.AsyncDriver):
+            session = Session(async_driver, **kwargs)
+            async with session:
+                yield session
+
+        return self._wrap_session(__inner(self.async_driver), kwargs)
@@ -0,0 +1,64 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from ..interface.graph import Graph as AbstractGraph
+
+from typing import Optional, Awaitable, Set
+
+import asyncio
+
+import neo4j
+
+
+class Graph (AbstractGraph[neo4j.graph.Graph]):
+    """A conceptual wrapper for a neo4j query which will return a neo4j.graph.Graph object.
+
+    The query is executed at most once, however many times this object or its properties are awaited.
+    """
+    def __init__(
+        self,
+        coroutine: Awaitable[neo4j.graph.Graph]
+    ):
+        self._coroutine = coroutine
+        self._future: Optional['asyncio.Future[neo4j.graph.Graph]'] = None
+
+    def __await__(self):
+        async def __inner():
+            # Every awaiter shares the one execution, including its failure, and cancelling one of them leaves it
+            # running for the rest
+            if self._future is None:
+                self._future = asyncio.ensure_future(self._coroutine)
+            return await asyncio.shield(self._future)
+        return __inner().__await__()
+
+    @property
+    async def nodes(self) -> Set[neo4j.graph.Node]:  # type: ignore[override]
+        """This property is a Coroutine, which is weird, but better matches the neo4j interface.
+
+        When awaited this property will execute the query and return you a Set[neo4j.graph.Node]
+        containing all of the nodes which the query matched.
+        """
+        return set((await self).nodes)
+
+    @property
+    async def relationships(self) -> Set[neo4j.graph.Relationship]:  # type: ignore[override]
+        """This property is a Coroutine, which is weird, but better matches the neo4j interface.
+
+        When awaited this property will execute the query and return you a Set[neo4j.graph.Relationship]
+        containing all of the relationships which the query matched.
+        """
+        return set((await self).relationships)
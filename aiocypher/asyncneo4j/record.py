@@ -0,0 +1,71 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from ..interface.record import Record as AbstractRecord
+
+from typing import Optional, Awaitable, Dict, Union, Any
+
+import asyncio
+
+import neo4j
+
+
+class Record (AbstractRecord[Optional[neo4j.Record]]):
+    """A conceptual wrapper for a neo4j query which will return a neo4j.Record object.
+
+    To execute the query and return the underlying object await this object. Since neo4j.Record
+    objects hold no reference to the connection it is safe to use it outside of the context
+    managers in which it was created.
+
+    A better way to use this object is to use the 'value()' coroutine.
+    """
+    def __init__(
+        self,
+        coroutine: Awaitable[Optional[neo4j.Record]]
+    ):
+        self._coroutine = coroutine
+        self._future: Optional['asyncio.Future[Optional[neo4j.Record]]'] = None
+
+    def __await__(self):
+        async def __inner():
+            # Every awaiter shares the one execution, including its failure, and cancelling one of them leaves it
+            # running for the rest
+            if self._future is None:
+                self._future = asyncio.ensure_future(self._coroutine)
+            return await asyncio.shield(self._future)
+        return __inner().__await__()
+
+    async def value(self) -> Any:
+        """When awaited this coroutine executes the query and returns the first value contained inside
+        this Record, which is often a neo4j.graph.Node object.
+
+        :returns: A neo4j.graph.Node, or other value
+        """
+        record = await self
+        if record is not None:
+            return record.value()
+        else:
+            return None
+
+    async def data(self) -> Optional[Dict[str, Dict[str, Union[str, int]]]]:
+        """Deserialises the data in this result as dictionary and returns it.
+        """
+        record = await self
+        if record is not None:
+            return record.data()
+        else:
+            return None
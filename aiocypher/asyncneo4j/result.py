@@ -0,0 +1,177 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from ..interface.result import Result as AbstractResult, DEFAULT_BATCH_SIZE, DEFAULT_MAX_BUFFERED_BATCHES
+
+import asyncio
+import warnings
+from typing import Optional, Awaitable, AsyncIterator, List, Dict, Any, NamedTuple
+
+import neo4j
+
+from .record import Record
+from .graph import Graph
+
+
+class _Materialised (NamedTuple):
+    result: neo4j.AsyncResult
+    records: Optional[List[neo4j.Record]]
+    graph: Optional[neo4j.graph.Graph]
+    summary: neo4j.ResultSummary
+
+
+async def _materialise(coroutine: Awaitable[neo4j.AsyncResult], keep_records: bool = True) -> _Materialised:
+    result = await coroutine
+    if keep_records:
+        graph = await result.graph()
+        records: Optional[List[neo4j.Record]] = [record async for record in result]
+    else:
+        # The graph is hydrated as the records arrive, so they can be dropped straight away
+        async for _ in result:
+            pass
+        graph = await result.graph()
+        records = None
+    return _Materialised(result, records, graph, await result.consume())
+
+
+class Result (AbstractResult[neo4j.AsyncResult]):
+    """A conceptual wrapper for a neo4j query which will return a neo4j.AsyncResult object.
+
+    The query is sent to the server the first time that this object (or some derivative thereof) is
+    awaited, and never more than once. All the records are read at that point, and the data, graph
+    and summary are all derived from them.
+
+    A better way to use this object is to use the 'single()', 'data()' or 'graph()' methods.
+    """
+    def __init__(
+        self,
+        coroutine: Awaitable[neo4j.AsyncResult]
+    ):
+        self._coroutine: Optional[Awaitable[neo4j.AsyncResult]] = coroutine
+        self._materialised: Optional['asyncio.Future[_Materialised]'] = None
+
+    async def _materialise(self, keep_records: bool = True) -> _Materialised:
+        if self._materialised is None:
+            assert self._coroutine is not None
+            self._materialised = asyncio.ensure_future(_materialise(self._coroutine, keep_records=keep_records))
+            self._coroutine = None
+        return await asyncio.shield(self._materialised)
+
+    async def _records(self) -> List[neo4j.Record]:
+        records = (await self._materialise()).records
+        if records is None:
+            raise RuntimeError("The records of this result were discarded when it was streamed or its graph was built "
+                               "incrementally")
+        return records
+
+    async def _graph(self, keep_records: bool = True) -> neo4j.graph.Graph:
+        graph = (await self._materialise(keep_records=keep_records)).graph
+        if graph is None:
+            raise RuntimeError("The graph of this result was discarded when it was streamed and the stream was "
+                               "abandoned")
+        return graph
+
+    def __await__(self):
+        async def __inner():
+            return (await self._materialise()).result
+        return __inner().__await__()
+
+    def single(self) -> Record:
+        """Returns an asyncneo4j.Record object, which is an Awaitable[neo4j.Record]
+
+        Useful if the wrapped query is expected to return a single result.
+        """
+        async def __inner() -> Optional[neo4j.Record]:
+            records = await self._records()
+            if len(records) > 1:
+                warnings.warn("Expected a result with a single record, but this result contains at least one more")
+            return records[0] if records else None
+        return Record(__inner())
+
+    def graph(self, incremental: bool = False) -> Graph:
+        """Returns an asyncneo4j.graph.Graph object which is an Awaitable[neo4j.graph.Graph]
+
+        Useful if the wrapped query is expected to return multiple results.
+
+        :param incremental: If True, and the query has not already been run, then the nodes and relationships
+                            are collected as the records stream in and the records themselves are dropped.
+                            The records are then no longer available to single() or data().
+        """
+        async def __inner() -> neo4j.graph.Graph:
+            return await self._graph(keep_records=not incremental)
+        return Graph(__inner())
+
+    async def data(self) -> List[Dict[str, Any]]:
+        """Deserialises the data in this result as a list of dictionaries and returns it.
+        """
+        return [record.data() for record in await self._records()]
+
+    async def consume(self) -> neo4j.ResultSummary:
+        """Returns the neo4j.ResultSummary for this result.
+        """
+        return (await self._materialise()).summary
+
+    async def stream(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_buffered_batches: int = DEFAULT_MAX_BUFFERED_BATCHES
+    ) -> AsyncIterator[neo4j.Record]:
+        """Returns an asynchronous iterator over the neo4j.Record objects in this result.
+
+        If the query has not yet been run then the records are fetched batch_size at a time as they are
+        consumed, and are not retained afterwards, so single() and data() cannot be used on this Result once
+        it has been streamed, nor graph() if iteration was abandoned before the end, since building the graph would
+        mean reading every remaining record. Since there is no IO thread to read ahead max_buffered_batches has no
+        effect.
+
+        :param batch_size: The number of records to fetch at once
+        """
+        if self._materialised is not None:
+            for record in await self._records():
+                yield record
+            return
+
+        assert self._coroutine is not None
+        coroutine = self._coroutine
+        self._coroutine = None
+        materialised: 'asyncio.Future[_Materialised]' = asyncio.get_running_loop().create_future()
+        self._materialised = materialised
+
+        try:
+            result = await coroutine
+            graph: Optional[neo4j.graph.Graph] = None
+            try:
+                while True:
+                    batch = await result.fetch(batch_size)
+                    if not batch:
+                        break
+                    for record in batch:
+                        yield record
+                # Every record has been read, so the graph is complete and asking for it buffers nothing
+                graph = await result.graph()
+            finally:
+                # If the stream was abandoned then asking for the graph would buffer every record not yet read, so
+                # there is none, and consuming the result discards those records without reading them
+                materialised.set_result(_Materialised(result, None, graph, await result.consume()))
+        except BaseException as e:
+            if not materialised.done():
+                if isinstance(e, asyncio.CancelledError):
+                    materialised.cancel()
+                else:
+                    materialised.set_exception(e)
+                    materialised.exception()
+            raise
@@ -0,0 +1,100 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from ..interface.session import Session as AbstractSession, READ_COMMITTED
+
+from typing import Optional, AsyncContextManager
+
+import neo4j
+from async_generator import asynccontextmanager
+
+from .transaction import Transaction
+
+
+class Session (AbstractSession):
+    """This object encapsulates a neo4j.AsyncSession object. It should not be initialised directly, but
+    created via an asyncneo4j.Driver object.
+
+    It should always be used as an Async Context Manager, and using its methods outside of its
+    context may lead to undefined behaviour.
+    """
+    def __init__(self, async_driver: neo4j.AsyncDriver, **kwargs):
+        self.async_driver = async_driver
+        self.__kwargs = kwargs
+
+        self._async_session: Optional[neo4j.AsyncSession] = None
+        self._transaction: Optional[Transaction] = None
+
+    async def __aenter__(self) -> 'Session':
+        self._async_session = self.async_driver.session(**self.__kwargs)
+        return self
+
+    async def __aexit__(self, *args) -> bool:
+        if self._async_session is not None:
+            async_session = self._async_session
+            self._async_session = None
+            await async_session.close()
+        return False
+
+    async def _open_read_session(self, async_session: neo4j.AsyncSession) -> neo4j.AsyncSession:
+        """Opens a second neo4j session for a read only transaction. It is given the bookmarks of the main
+        session so that it sees everything that has been written through this one.
+        """
+        bookmarks = await async_session.last_bookmarks()
+        kwargs = dict(self.__kwargs, default_access_mode=neo4j.READ_ACCESS, bookmarks=bookmarks)
+        return self.async_driver.session(**kwargs)
+
+    def begin_transaction(
+        self,
+        read_only: bool = False,
+        isolation: Optional[str] = None
+    ) -> AsyncContextManager[Transaction]:
+        """This is the main method for interacting with the Session. It
+        creates a new Transaction which is then represented by an Async Context Manager
+        yielding an asyncneo4j.Transaction object.
+
+        neo4j sessions have a fixed access mode, so unless this session was opened with
+        default_access_mode=neo4j.READ_ACCESS a read only transaction is run in a separate neo4j session
+        which is closed when the transaction ends.
+
+        :param read_only: If True the transaction uses READ_ACCESS, and so may be routed to a read replica
+        :param isolation: Only None or READ COMMITTED, which is what neo4j provides
+        """
+        if isolation is not None and isolation.upper() != READ_COMMITTED:
+            raise ValueError(f"Unsupported isolation level {isolation!r}, neo4j only provides {READ_COMMITTED}")
+
+        separate_session = (
+            read_only and self.__kwargs.get('default_access_mode', neo4j.WRITE_ACCESS) != neo4j.READ_ACCESS)
+
+        @asynccontextmanager
+        async def __inner():
+            if self._async_session is None:
+                raise RuntimeError("Cannot begin a transaction unless the session is open")
+            if self._transaction is not None:
+                raise neo4j.exceptions.TransactionError()
+
+            if separate_session:
+                self._transaction = Transaction(await self._open_read_session(self._async_session), owns_session=True)
+            else:
+                self._transaction = Transaction(self._async_session)
+            try:
+                async with self._transaction:
+                    yield self._transaction
+            finally:
+                self._transaction = None
+
+        return __inner()
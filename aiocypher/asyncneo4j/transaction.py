@@ -0,0 +1,98 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from ..interface.transaction import Transaction as AbstractTransaction
+from ..internal.batch import DEFAULT_CHUNK_SIZE, ROWS_PARAMETER, unwind_query, chunked
+
+from typing import Optional, Iterable, Mapping, Any
+
+import neo4j
+
+from .result import Result
+
+
+class Transaction (AbstractTransaction):
+    """A class which encapsulates a neo4j.AsyncTransaction object. Should never be created directly,
+    but always via an asyncneo4j.Session object.
+
+    Should always be used as an Async Context Manager. Using any of its methods outside of
+    the context may lead to undefined behaviour.
+
+    If owns_session is True then the neo4j.AsyncSession was opened just for this transaction, and is closed
+    when it ends.
+    """
+    def __init__(self, async_session: neo4j.AsyncSession, owns_session: bool = False):
+        self._async_session = async_session
+        self._owns_session = owns_session
+        self._async_transaction: Optional[neo4j.AsyncTransaction] = None
+
+    async def __aenter__(self) -> "Transaction":
+        try:
+            self._async_transaction = await self._async_session.begin_transaction()
+        except BaseException:
+            if self._owns_session:
+                await self._async_session.close()
+            raise
+        return self
+
+    async def __aexit__(self, *args):
+        try:
+            if self._async_transaction is not None:
+                return await self._async_transaction.__aexit__(*args)
+            else:
+                return False
+        finally:
+            if self._owns_session:
+                await self._async_session.close()
+
+    def run(self, *args, **kwargs) -> Result:
+        """This is the main routine for this class.
+
+        It has an interface identical to neo4j.AsyncTransaction.run.
+
+        The actual query will not be executed until such a time as the return value (or some derivative thereof)
+        is awaited.
+
+        :returns: an asyncneo4j.Result object, which is a subclass of Awaitable[neo4j.AsyncResult]
+        """
+        async def __inner() -> neo4j.AsyncResult:
+            if self._async_transaction is None:
+                raise RuntimeError("Cannot run a query outside of an open transaction")
+            return await self._async_transaction.run(*args, **kwargs)
+        return Result(__inner())
+
+    async def run_batch(
+        self,
+        query: str,
+        rows: Iterable[Mapping[str, Any]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **params
+    ) -> int:
+        """Runs a write query once for every entry in rows, as a series of "UNWIND $rows AS row ..." statements
+        each covering up to chunk_size rows. The result of each is consumed without reading any records.
+
+        :returns: The number of rows
+        """
+        if self._async_transaction is None:
+            raise RuntimeError("Cannot run a query outside of an open transaction")
+        statement = unwind_query(query)
+        count = 0
+        for chunk in chunked(rows, chunk_size):
+            result = await self._async_transaction.run(statement, dict(params, **{ROWS_PARAMETER: chunk}))
+            await result.consume()
+            count += len(chunk)
+        return count
@@ -0,0 +1,338 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import sys
+import time
+from collections import OrderedDict
+from typing import (
+    Any, AsyncContextManager, Callable, Dict, FrozenSet, Hashable, Iterable, List, Mapping, NamedTuple, Optional,
+    Set, Tuple)
+
+from .interface.session import Session
+from .interface.transaction import Transaction
+from .interface.result import Result
+from .internal.batch import DEFAULT_CHUNK_SIZE
+from .internal.proxy import SessionProxy, TransactionProxy, ResultProxy
+from .internal.cypher import normalise_query, query_labels, is_write_query, freeze_parameters
+
+
+__all__ = [
+    "DEFAULT_CACHE_MAX_ENTRIES",
+    "DEFAULT_CACHE_MAX_BYTES",
+    "DEFAULT_CACHE_TTL",
+    "QueryCache",
+    "QueryCacheStats"
+]
+
+
+DEFAULT_CACHE_MAX_ENTRIES = 1024
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_CACHE_TTL = 60.0
+
+
+class QueryCacheStats (NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    entries: int
+    size: int
+
+
+class _Entry (NamedTuple):
+    value: Any
+    tags: FrozenSet[str]
+    size: int
+    expires: float
+
+
+def _sizeof(value: Any) -> int:
+    """An estimate of the memory used by a result, counting the containers and everything in them."""
+    size = sys.getsizeof(value)
+    if isinstance(value, Mapping):
+        size += sum(_sizeof(key) + _sizeof(v) for (key, v) in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_sizeof(v) for v in value)
+    return size
+
+
+class QueryCache (object):
+    """A cache of the results of read queries, shared by all the sessions of a Driver.
+
+    Only Result.data() is served from the cache. The other ways of reading a result, and awaiting it directly,
+    always run the query. Results are keyed on the normalised text of the query, its parameters and the keyword
+    arguments of the session, and are kept for ttl seconds, or until the cache holds more than max_entries
+    results or max_bytes of them, in which case the least recently used are evicted.
+
+    Each result is tagged with the labels which appear in its query, as found by tagger. When a transaction which
+    wrote commits or fails, every result which shares a tag with one of its writes is invalidated, as is every
+    result with no tags. A write with no tags invalidates everything. Since labels can only be found when they
+    are written in a query, an application which writes through other drivers, or matches nodes without naming
+    their labels, should supply its own tagger or call invalidate() itself.
+
+    Queries are treated as writes unless they are run in a read only transaction or certainly cannot write.
+    Reads which follow a write in the same transaction are never cached, so that they see the write.
+
+    The results returned by the cache are shared, and must not be modified.
+
+    Should be created via Driver.enable_query_cache().
+    """
+    def __init__(self,
+                 max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+                 ttl: Optional[float] = DEFAULT_CACHE_TTL,
+                 tagger: Callable[[str], Iterable[str]] = query_labels):
+        """
+        :param max_entries: The most results to keep
+        :param max_bytes: The most memory, as estimated from the sizes of the results, to use
+        :param ttl: The number of seconds a result is kept for, or None to keep it until it is evicted or
+                    invalidated
+        :param tagger: Returns the tags of a query
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, not {max_entries}")
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._tagger = tagger
+        self._entries: 'OrderedDict[Hashable, _Entry]' = OrderedDict()
+        self._by_tag: Dict[str, Set[Hashable]] = {}
+        self._untagged: Set[Hashable] = set()
+        self._size = 0
+
+        # Every invalidation advances the clock. A result read before an invalidation which affects it is not
+        # stored, since it may already be out of date.
+        self._clock = 0
+        self._tags_invalidated_at: Dict[str, int] = {}
+        self._any_invalidated_at = 0
+        self._all_invalidated_at = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    @property
+    def clock(self) -> int:
+        return self._clock
+
+    def tags(self, query: str) -> FrozenSet[str]:
+        return frozenset(self._tagger(query))
+
+    def key(self, query: str, params: Mapping[str, Any], scope: Mapping[str, Any] = {}) -> Optional[Hashable]:
+        """The key for a query run with the given parameters in a session opened with the given keyword arguments,
+        or None if the parameters are not hashable and so the result cannot be cached.
+        """
+        try:
+            key = (normalise_query(query), freeze_parameters(params), freeze_parameters(scope))
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Looks up a result.
+
+        :returns: A pair of whether the result was found and the result
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires < time.monotonic():
+            self._remove(key)
+            self._expirations += 1
+            entry = None
+        if entry is None:
+            self._misses += 1
+            return (False, None)
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return (True, entry.value)
+
+    def put(self, key: Hashable, tags: FrozenSet[str], value: Any, since: int) -> None:
+        """Stores a result, unless anything which it depends on has been invalidated since the clock read since.
+        """
+        if self._invalidated_since(tags, since):
+            return
+        size = _sizeof(value)
+        if size > self._max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        expires = time.monotonic() + self._ttl if self._ttl is not None else float('inf')
+        self._entries[key] = _Entry(value, tags, size, expires)
+        self._size += size
+        if tags:
+            for tag in tags:
+                self._by_tag.setdefault(tag, set()).add(key)
+        else:
+            self._untagged.add(key)
+        while len(self._entries) > self._max_entries or self._size > self._max_bytes:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        """Removes every result which has any of the tags, or no tags at all."""
+        self._clock += 1
+        self._any_invalidated_at = self._clock
+        keys = set(self._untagged)
+        for tag in tags:
+            self._tags_invalidated_at[tag] = self._clock
+            keys.update(self._by_tag.get(tag, ()))
+        for key in keys:
+            self._remove(key)
+        self._invalidations += len(keys)
+
+    def invalidate_all(self) -> None:
+        """Removes every result."""
+        self._clock += 1
+        self._any_invalidated_at = self._all_invalidated_at = self._clock
+        self._invalidations += len(self._entries)
+        self._entries.clear()
+        self._by_tag.clear()
+        self._untagged.clear()
+        self._size = 0
+
+    def stats(self) -> QueryCacheStats:
+        """Returns the numbers of hits, misses, evictions to make room, expirations and invalidations since the
+        cache was created, and the number and estimated size of the results it holds.
+        """
+        return QueryCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            invalidations=self._invalidations,
+            entries=len(self._entries),
+            size=self._size)
+
+    def session(self, session: AsyncContextManager[Session], scope: Mapping[str, Any] = {}) -> '_CachingSession':
+        """Wraps a session so that the transactions begun on it read through the cache and invalidate it when they
+        write.
+
+        :param scope: The keyword arguments the session was opened with
+        """
+        return _CachingSession(self, session, scope)
+
+    def _invalidated_since(self, tags: FrozenSet[str], since: int) -> bool:
+        if self._all_invalidated_at > since:
+            return True
+        if not tags:
+            return self._any_invalidated_at > since
+        return any(self._tags_invalidated_at.get(tag, 0) > since for tag in tags)
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._size -= entry.size
+        if entry.tags:
+            for tag in entry.tags:
+                keys = self._by_tag.get(tag)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._by_tag[tag]
+        else:
+            self._untagged.discard(key)
+
+
+class _CachingSession (SessionProxy):
+    def __init__(self, cache: QueryCache, session: AsyncContextManager[Session], scope: Mapping[str, Any]):
+        super().__init__(session)
+        self._cache = cache
+        self._scope = dict(scope)
+
+    def _wrap_transaction(
+        self,
+        transaction: AsyncContextManager[Transaction],
+        read_only: bool
+    ) -> AsyncContextManager[Transaction]:
+        return _CachingTransaction(self._cache, transaction, self._scope, read_only)
+
+
+class _CachingTransaction (TransactionProxy):
+    def __init__(self,
+                 cache: QueryCache,
+                 transaction: AsyncContextManager[Transaction],
+                 scope: Mapping[str, Any],
+                 read_only: bool):
+        super().__init__(transaction)
+        self._cache = cache
+        self._scope = scope
+        self._read_only = read_only
+        self._written: Set[str] = set()
+        self._wrote = False
+        self._wrote_untagged = False
+
+    async def __aexit__(self, *args):
+        try:
+            return await super().__aexit__(*args)
+        finally:
+            if self._wrote_untagged:
+                self._cache.invalidate_all()
+            elif self._wrote:
+                self._cache.invalidate(self._written)
+
+    def _write(self, query: str) -> None:
+        tags = self._cache.tags(query)
+        self._wrote = True
+        self._written.update(tags)
+        if not tags:
+            self._wrote_untagged = True
+
+    def run(self, query: str, *args, **params) -> Result:
+        result = super().run(query, *args, **params)
+        if not self._read_only and is_write_query(query):
+            self._write(query)
+            return result
+        if self._wrote or args:
+            return result
+        key = self._cache.key(query, params, self._scope)
+        if key is None:
+            return result
+        return _CachedResult(self._cache, result, key, self._cache.tags(query))
+
+    async def run_batch(
+        self,
+        query: str,
+        rows: Iterable[Mapping[str, Any]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **params
+    ) -> int:
+        self._write(query)
+        return await super().run_batch(query, rows, chunk_size=chunk_size, **params)
+
+
+class _CachedResult (ResultProxy):
+    """A Result whose data() is read through the cache. Everything else is passed to the Result which runs the
+    query.
+    """
+    def __init__(self, cache: QueryCache, result: Result, key: Hashable, tags: FrozenSet[str]):
+        super().__init__(result)
+        self._cache = cache
+        self._key = key
+        self._tags = tags
+
+    async def data(self) -> List[Dict[str, Any]]:
+        (found, value) = self._cache.get(self._key)
+        if found:
+            return value
+        since = self._cache.clock
+        value = await self._result.data()
+        self._cache.put(self._key, self._tags, value, since)
+        return value
@@ -0,0 +1,174 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Mapping, NamedTuple, Any, Optional, Set, Tuple, TYPE_CHECKING
+
+from .internal.cypher import substitute_parameters, pattern_map_parameters
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .interface.driver import Driver
+
+
+__all__ = [
+    "DEFAULT_WINDOW",
+    "DEFAULT_MAX_ITEMS",
+    "WriteCoalescer"
+]
+
+
+DEFAULT_WINDOW = 0.002
+DEFAULT_MAX_ITEMS = 100
+
+
+class _Write (NamedTuple):
+    parameters: Mapping[str, Any]
+    future: 'asyncio.Future[None]'
+
+
+_Key = Tuple[str, FrozenSet[str]]
+
+
+@lru_cache(maxsize=256)
+def _row_query(query: str) -> str:
+    """Rewrites a query written in terms of $parameters into one written in terms of the properties of 'row'"""
+    return substitute_parameters(query, lambda name: f"row.{name}")
+
+
+def _resolve(future: 'asyncio.Future[None]', e: Optional[BaseException]) -> None:
+    if future.done():
+        return
+    if e is not None:
+        future.set_exception(e)
+    else:
+        future.set_result(None)
+
+
+class WriteCoalescer (object):
+    """Collects small parameterised writes made by many concurrent coroutines and runs them in batches.
+
+    Writes made with the same query text and the same parameter names within a short window of each other
+    are combined into a single "UNWIND $rows AS row ..." statement and run in one transaction. If that fails
+    then each of the writes in the batch is retried in a transaction of its own, so that every caller sees
+    the outcome of their own write and only their own.
+
+    A query which uses a parameter as the property map of a pattern, such as CREATE (n:Person $props), cannot be
+    rewritten in terms of 'row', since only a map literal or a parameter may appear there. Writes with such a
+    query are run straight away, each in a transaction of its own.
+
+    Any results of the queries are discarded, so this is only suitable for writes. Can be used as an
+    Async Context Manager, in which case all pending writes are flushed when the context exits.
+
+    Should be created via Driver.coalescer().
+    """
+    def __init__(self,
+                 driver: 'Driver',
+                 window: float = DEFAULT_WINDOW,
+                 max_items: int = DEFAULT_MAX_ITEMS,
+                 **session_kwargs):
+        """
+        :param driver: The driver to open sessions on
+        :param window: The longest a write will wait for others to join its batch, in seconds
+        :param max_items: The batch is run straight away once it contains this many writes
+        :param session_kwargs: Passed to driver.session() for every session the coalescer opens
+        """
+        if max_items < 1:
+            raise ValueError(f"max_items must be at least 1, not {max_items}")
+        self._driver = driver
+        self._window = window
+        self._max_items = max_items
+        self._session_kwargs = session_kwargs
+        self._pending: Dict[_Key, List[_Write]] = {}
+        self._timers: Dict[_Key, asyncio.TimerHandle] = {}
+        self._running: Set['asyncio.Future[None]'] = set()
+
+    async def __aenter__(self) -> 'WriteCoalescer':
+        return self
+
+    async def __aexit__(self, *args) -> bool:
+        await self.flush()
+        return False
+
+    async def run(self, query: str, **params) -> None:
+        """Runs a write query with the given parameters, returning once it has been committed as part of a
+        batch, or raising the exception that running it on its own produced.
+
+        Cancelling the caller does not withdraw a write that has already joined a batch.
+        """
+        loop = asyncio.get_running_loop()
+        write = _Write(params, loop.create_future())
+        key = (query, frozenset(params))
+
+        batch = self._pending.setdefault(key, [])
+        batch.append(write)
+        if len(batch) >= self._max_items or pattern_map_parameters(query):
+            self.__dispatch(key)
+        elif len(batch) == 1:
+            self._timers[key] = loop.call_later(self._window, self.__dispatch, key)
+
+        await write.future
+
+    async def flush(self) -> None:
+        """Runs all pending writes immediately, and waits for every batch which is running to finish."""
+        for key in list(self._pending):
+            self.__dispatch(key)
+        while self._running:
+            await asyncio.wait(list(self._running))
+
+    def __dispatch(self, key: _Key) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+
+        if len(batch) == 1:
+            task = asyncio.ensure_future(self.__run_individually(key[0], batch))
+        else:
+            task = asyncio.ensure_future(self.__run_batch(key[0], batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def __run_batch(self, query: str, batch: List[_Write]) -> None:
+        try:
+            async with self._driver.session(**self._session_kwargs) as session:
+                async with session.begin_transaction() as tx:
+                    await tx.run_batch(_row_query(query),
+                                       [write.parameters for write in batch],
+                                       chunk_size=len(batch))
+        except Exception:
+            await self.__run_individually(query, batch)
+        else:
+            for write in batch:
+                _resolve(write.future, None)
+
+    async def __run_individually(self, query: str, batch: List[_Write]) -> None:
+        try:
+            async with self._driver.session(**self._session_kwargs) as session:
+                for write in batch:
+                    try:
+                        async with session.begin_transaction() as tx:
+                            await tx.run(query, **write.parameters)
+                    except Exception as e:
+                        _resolve(write.future, e)
+                    else:
+                        _resolve(write.future, None)
+        except Exception as e:
+            for write in batch:
+                _resolve(write.future, e)
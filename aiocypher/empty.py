@@ -15,9 +15,9 @@
 # limitations under the License.
 #
 
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Set, AsyncIterator
 
-from .interface.result import Result
+from .interface.result import Result, DEFAULT_BATCH_SIZE, DEFAULT_MAX_BUFFERED_BATCHES
 from .interface.record import Record
 from .interface.graph import Graph
 from .interface.node import Node
@@ -59,6 +59,16 @@ class EmptyResult(Result[None]):
         """
         return EmptyGraph()
 
+    async def stream(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_buffered_batches: int = DEFAULT_MAX_BUFFERED_BATCHES
+    ) -> AsyncIterator[Any]:
+        """Yields nothing at all.
+        """
+        return
+        yield
+
     def __await__(self):
         async def __inner():
             return None
@@ -17,12 +17,21 @@
 
 from .session import Session
 from ..config import Config
+from ..coalescer import WriteCoalescer, DEFAULT_WINDOW, DEFAULT_MAX_ITEMS
+from ..singleflight import SingleFlight
+from ..cache import QueryCache, DEFAULT_CACHE_MAX_ENTRIES, DEFAULT_CACHE_MAX_BYTES, DEFAULT_CACHE_TTL
+from ..metrics import Metrics, InMemoryMetrics, instrument_session
+from ..tracing import Tracer, SYSTEM, NAMESPACE, trace_session
+from ..internal.cypher import query_labels, freeze_parameters
 
 from ..internal.abc import AIOCypherABCMeta
 
 from abc import abstractmethod
 
-from typing import Tuple, Optional, AsyncContextManager
+from typing import Tuple, Optional, AsyncContextManager, Callable, Iterable, Dict, Any, TypeVar, Hashable, cast
+
+
+S = TypeVar('S', bound=Session)
 
 
 class Driver (object, metaclass=AIOCypherABCMeta):
@@ -33,6 +42,10 @@ class Driver (object, metaclass=AIOCypherABCMeta):
                  config: Config):
         self._address = config.address
         self._auth: Tuple[str, str] = config.auth
+        self._query_cache: Optional[QueryCache] = None
+        self._singleflights: Dict[Hashable, SingleFlight] = {}
+        self._metrics: Optional[Metrics] = None
+        self._tracer: Optional[Tracer] = None
 
     async def __aenter__(self) -> 'Driver':
         return self
@@ -61,6 +74,98 @@ class Driver (object, metaclass=AIOCypherABCMeta):
         """
         ...
 
+    def coalescer(self,
+                  window: float = DEFAULT_WINDOW,
+                  max_items: int = DEFAULT_MAX_ITEMS,
+                  **kwargs) -> WriteCoalescer:
+        """Creates a WriteCoalescer, which combines small parameterised writes made concurrently with the same
+        query into batched UNWIND statements.
+
+        :param window: The longest a write will wait for others to join its batch, in seconds
+        :param max_items: The largest number of writes combined into one batch
+        :param kwargs: Passed to session() whenever the coalescer needs a session
+        """
+        return WriteCoalescer(self, window=window, max_items=max_items, **kwargs)
+
+    def singleflight(self, **kwargs) -> SingleFlight:
+        """Returns the SingleFlight of this driver for sessions opened with the given keyword arguments, which
+        makes concurrent identical read queries share one execution and one result. Every call with the same
+        arguments returns the same SingleFlight, so callers in different places still share their queries.
+
+        :param kwargs: Passed to session() whenever the SingleFlight needs a session
+        """
+        key = freeze_parameters(kwargs)
+        singleflight = self._singleflights.get(key)
+        if singleflight is None:
+            singleflight = self._singleflights[key] = SingleFlight(self, **kwargs)
+        return singleflight
+
+    def enable_query_cache(self,
+                           max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+                           max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+                           ttl: Optional[float] = DEFAULT_CACHE_TTL,
+                           tagger: Callable[[str], Iterable[str]] = query_labels) -> QueryCache:
+        """Makes the data() of read queries run through sessions opened from now on be served from a QueryCache,
+        which is invalidated by writes made through this driver.
+
+        :param max_entries: The most results to keep
+        :param max_bytes: The most memory, as estimated from the sizes of the results, to use
+        :param ttl: The number of seconds a result is kept for, or None to keep it until it is evicted or
+                    invalidated
+        :param tagger: Returns the tags of a query, by default the labels in it
+        :returns: The cache, which can be used to read its stats and invalidate it
+        """
+        self._query_cache = QueryCache(max_entries=max_entries, max_bytes=max_bytes, ttl=ttl, tagger=tagger)
+        return self._query_cache
+
+    @property
+    def query_cache(self) -> Optional[QueryCache]:
+        return self._query_cache
+
+    def enable_metrics(self, metrics: Optional[Metrics] = None) -> Metrics:
+        """Makes this driver, and sessions opened from now on, report their metrics. See aiocypher.metrics for
+        what is reported.
+
+        :param metrics: Where to report them, by default a new InMemoryMetrics
+        :returns: The metrics, which for an InMemoryMetrics can be used to read or render them
+        """
+        self._metrics = metrics if metrics is not None else InMemoryMetrics()
+        return self._metrics
+
+    @property
+    def metrics(self) -> Optional[Metrics]:
+        return self._metrics
+
+    def enable_tracing(self, tracer: Tracer) -> Tracer:
+        """Makes sessions opened from now on emit spans to tracer. See aiocypher.tracing for what is traced.
+
+        :param tracer: Anything with the start_as_current_span method of an OpenTelemetry Tracer, eg. an
+                       opentelemetry.trace.Tracer or an aiocypher.tracing.InMemoryTracer
+        :returns: The tracer
+        """
+        self._tracer = tracer
+        return tracer
+
+    @property
+    def tracer(self) -> Optional[Tracer]:
+        return self._tracer
+
+    def _wrap_session(self, session: AsyncContextManager[S], kwargs: Dict[str, Any]) -> AsyncContextManager[S]:
+        """Concrete subclasses pass every session they create through this, with the keyword arguments it was
+        created with, so that it uses the query cache, reports metrics and is traced if they are enabled. The wrapped
+        session passes anything it does not handle itself on to the original.
+        """
+        if self._query_cache is not None:
+            session = cast(AsyncContextManager[S], self._query_cache.session(session, kwargs))
+        if self._metrics is not None:
+            session = cast(AsyncContextManager[S], instrument_session(self._metrics, session))
+        if self._tracer is not None:
+            attributes = {SYSTEM: self.database_type()}
+            if kwargs.get('database') is not None:
+                attributes[NAMESPACE] = kwargs['database']
+            session = cast(AsyncContextManager[S], trace_session(self._tracer, session, attributes))
+        return session
+
     @abstractmethod
     def database_type(self) -> str:
         ...
@@ -21,3 +21,17 @@ from typing import Dict, Union
 class QueryFailed (Exception):
     def __init__(self, query: str, params: Dict[str, Union[str, int]]):
         super().__init__(f"Query failed: << {query} >> with parameters {params!r}")
+
+
+class SessionLimitReached (Exception):
+    def __init__(self, limit: int, timeout: float):
+        super().__init__(f"Timed out after {timeout}s waiting for one of the {limit} permitted sessions to be closed")
+
+
+class PoolAcquireTimeout (SessionLimitReached):
+    """Raised by the agensgraph drivers when no pooled connection became free within the acquire timeout. It is a
+    SessionLimitReached, since every session holds one connection for as long as it is open.
+    """
+    def __init__(self, limit: int, timeout: float):
+        Exception.__init__(
+            self, f"Timed out after {timeout}s waiting for one of the {limit} pooled connections to be returned")
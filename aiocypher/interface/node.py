@@ -15,10 +15,15 @@
 # limitations under the License.
 #
 
-from abc import ABCMeta
+from abc import ABCMeta, abstractmethod
 
 from typing import Mapping, Union, Set, List
 
 
 class Node (Mapping[str, Union[str, int, List[Union[str, int]]]], metaclass=ABCMeta):
-    labels: Set[str]
+    __slots__ = ()
+
+    @property
+    @abstractmethod
+    def labels(self) -> Set[str]:
+        ...
@@ -17,7 +17,7 @@
 
 from abc import ABCMeta, abstractmethod
 
-from typing import TypeVar, Awaitable, List, Dict, Any, Generic
+from typing import TypeVar, Awaitable, AsyncIterator, List, Dict, Any, Generic
 
 from .record import Record
 from .graph import Graph
@@ -26,12 +26,18 @@ from .graph import Graph
 R = TypeVar('R')
 
 
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_MAX_BUFFERED_BATCHES = 4
+
+
 class Result (Generic[R], Awaitable[R], metaclass=ABCMeta):
     """A conceptual wrapper for a query which will return a result object of some kind.
 
     To execute the query and return the underlying object await this object.
 
     It also has other methods which return awaitable objects.
+
+    It can also be iterated over asynchronously, yielding records as they arrive from the database.
     """
 
     @abstractmethod
@@ -55,3 +61,23 @@ class Result (Generic[R], Awaitable[R], metaclass=ABCMeta):
         Useful if the wrapped query is expected to return multiple results.
         """
         ...
+
+    @abstractmethod
+    def stream(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_buffered_batches: int = DEFAULT_MAX_BUFFERED_BATCHES
+    ) -> AsyncIterator[Any]:
+        """Returns an asynchronous iterator over the records of this result, which are read from the database
+        a batch at a time rather than all at once.
+
+        :param batch_size: The number of records to transfer from the database at once
+        :param max_buffered_batches: The maximum number of batches that will be read ahead of the consumer
+                                     before reading from the database is paused.
+        """
+        ...
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        """Iterates over the records of this result using the default batch settings.
+        """
+        return self.stream()
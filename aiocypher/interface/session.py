@@ -16,11 +16,16 @@
 #
 
 from abc import ABCMeta, abstractmethod
-from typing import AsyncContextManager
+from typing import AsyncContextManager, Optional
 
 from .transaction import Transaction
 
 
+READ_COMMITTED = "READ COMMITTED"
+REPEATABLE_READ = "REPEATABLE READ"
+SERIALIZABLE = "SERIALIZABLE"
+
+
 class Session (object, metaclass=ABCMeta):
     """This object encapsulates a Session object. It should not be initialised directly, but
     created via a Driver object.
@@ -37,8 +42,16 @@ class Session (object, metaclass=ABCMeta):
         return False
 
     @abstractmethod
-    def begin_transaction(self) -> AsyncContextManager[Transaction]:
+    def begin_transaction(
+        self,
+        read_only: bool = False,
+        isolation: Optional[str] = None
+    ) -> AsyncContextManager[Transaction]:
         """This is the main method for interacting with the Session. It
         creates a new Transaction which is then represented by an Async Context Manager
+
+        :param read_only: If True the transaction may not write, which allows it to be routed to a replica
+        :param isolation: One of READ_COMMITTED, REPEATABLE_READ or SERIALIZABLE, or None for the default of the
+                          database. A ValueError is raised if the database does not support the level requested.
         """
         ...
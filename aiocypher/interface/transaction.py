@@ -17,7 +17,10 @@
 
 from abc import ABCMeta, abstractmethod
 
+from typing import Iterable, Mapping, Any
+
 from .result import Result
+from ..internal.batch import DEFAULT_CHUNK_SIZE, ROWS_PARAMETER, unwind_query, chunked
 
 
 class Transaction (object, metaclass=ABCMeta):
@@ -43,3 +46,27 @@ class Transaction (object, metaclass=ABCMeta):
         :returns: an Result object
         """
         ...
+
+    async def run_batch(
+        self,
+        query: str,
+        rows: Iterable[Mapping[str, Any]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **params
+    ) -> int:
+        """Runs a write query once for every entry in rows.
+
+        The query should refer to the values for each entry as properties of 'row', eg.
+        "CREATE (n:Person {name: row.name})". The rows are split into chunks of chunk_size and each
+        chunk is sent as a single "UNWIND $rows AS row ..." statement. Any other keyword arguments are
+        passed to every statement as parameters.
+
+        Unlike run() this executes immediately, and any results of the query are discarded.
+
+        :returns: The number of rows
+        """
+        count = 0
+        for chunk in chunked(rows, chunk_size):
+            await self.run(unwind_query(query), **{ROWS_PARAMETER: chunk}, **params)
+            count += len(chunk)
+        return count
@@ -0,0 +1,180 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""The driver state and session shared by the backends which talk to AgensGraph, leaving only the calls into
+their PostgreSQL client libraries to be implemented by each of them.
+"""
+
+from ..interface.session import Session as AbstractSession
+from ..interface.transaction import Transaction as AbstractTransaction
+from ..interface.exceptions import PoolAcquireTimeout
+from ..internal.stats import Histogram
+from ..metrics import Metrics, POOL_ACQUIRE
+
+import time
+from abc import ABCMeta, abstractmethod
+from typing import Any, AsyncContextManager, Callable, Optional, Set, TypeVar
+from weakref import WeakKeyDictionary
+
+from async_exit_stack import AsyncExitStack
+
+__all__ = [
+    "CREATE_GRAPH",
+    "SET_GRAPH_PATH",
+    "AgensGraphDriverState",
+    "AgensGraphSession"
+]
+
+
+# The graph is the only parameter, and must be formatted in as an identifier so that its case is kept
+CREATE_GRAPH = "CREATE GRAPH IF NOT EXISTS {}"
+SET_GRAPH_PATH = "SET graph_path = {}"
+
+
+class AgensGraphDriverState (object, metaclass=ABCMeta):
+    """State shared by all the sessions of a single Driver, used to avoid repeating setup statements on every
+    transaction.
+
+    It remembers which graphs are already known to exist, and which graph_path has been set on each pooled
+    connection. Connections are held weakly, so when the pool discards a connection its state goes with it.
+
+    Graphs which are dropped by something other than this driver while it is running will not be recreated.
+
+    It also measures how long sessions wait to acquire connections from the pool, and reports it to metrics if
+    that is set. Only sessions which find no free connection are counted as waiters, and acquires which time out
+    are counted separately rather than measured.
+    """
+    def __init__(self, acquire_timeout: Optional[float] = None) -> None:
+        self._acquire_timeout = acquire_timeout
+        self.acquire_latency = Histogram()
+        self.waiters = 0
+        self.acquire_timeouts = 0
+        self.metrics: Optional[Metrics] = None
+        self._graphs: Set[str] = set()
+        self._graph_paths: 'WeakKeyDictionary[Any, str]' = WeakKeyDictionary()
+
+    async def acquire(self, pool: Any, exit_stack: AsyncExitStack) -> Any:
+        """Acquires a connection from the pool, which is returned when the exit stack is closed.
+
+        :raises PoolAcquireTimeout: if no connection became free within the acquire timeout
+        """
+        start = time.monotonic()
+        waiting = self._exhausted(pool)
+        if waiting:
+            self.waiters += 1
+        try:
+            connection = await self._acquire(pool, exit_stack)
+        except PoolAcquireTimeout:
+            self.acquire_timeouts += 1
+            raise
+        finally:
+            if waiting:
+                self.waiters -= 1
+        latency = time.monotonic() - start
+        self.acquire_latency.observe(latency)
+        if self.metrics is not None:
+            self.metrics.observe(POOL_ACQUIRE, latency)
+        return connection
+
+    @abstractmethod
+    async def _acquire(self, pool: Any, exit_stack: AsyncExitStack) -> Any:
+        """Enters the context of a connection from the pool on the exit stack, raising PoolAcquireTimeout if
+        none became free within the acquire timeout.
+        """
+        ...
+
+    @staticmethod
+    @abstractmethod
+    def _exhausted(pool: Any) -> bool:
+        """True if a connection cannot be had from the pool without waiting for one to be returned."""
+        ...
+
+    async def use_graph(self, connection: Any, graph: str) -> None:
+        """Makes sure that the graph exists and is the graph_path of the connection, issuing only the statements
+        which have not already been issued.
+
+        Must be called outside of a transaction, since graph_path is set for the lifetime of the connection.
+        """
+        if self._graph_paths.get(connection) == graph:
+            return
+        await self._set_graph_path(connection, graph, create=graph not in self._graphs)
+        self._graphs.add(graph)
+        self._graph_paths[connection] = graph
+
+    @abstractmethod
+    async def _set_graph_path(self, connection: Any, graph: str, create: bool) -> None:
+        """Issues SET_GRAPH_PATH on the connection, preceded by CREATE_GRAPH if create is True, with the name of
+        the graph quoted as an identifier.
+        """
+        ...
+
+
+_S = TypeVar('_S', bound='AgensGraphSession')
+
+
+class AgensGraphSession (AbstractSession):
+    """This object encapsulates a session with an agensgraph database. It should not be initialised directly, but
+    created via an Driver object.
+
+    It should always be used as an Async Context Manager, and using its methods outside of its
+    context may lead to undefined behaviour.
+
+    The state is shared between all the sessions of a Driver, if it is None then the session has state of its own
+    made by calling _new_state.
+    """
+    _new_state: Callable[[], AgensGraphDriverState]
+    _new_transaction: Callable[..., AsyncContextManager[AbstractTransaction]]
+
+    def __init__(self, pool: Any, state: Optional[AgensGraphDriverState] = None, **kwargs):
+        self._exit_stack = AsyncExitStack()
+        self._pool = pool
+        self._state = state if state is not None else self._new_state()
+        self._connection: Optional[Any] = None
+        self.__kwargs = kwargs
+
+        self._dbname = self.__kwargs.get('database', "database") or "database"
+
+    async def __aenter__(self: _S) -> _S:
+        await self._exit_stack.__aenter__()
+        await self
+        return self
+
+    async def __aexit__(self, *args) -> bool:
+        return await self._exit_stack.__aexit__(*args)
+
+    def __await__(self):
+        async def __inner():
+            if self._connection is None:
+                self._connection = await self._state.acquire(self._pool, self._exit_stack)
+            return self._connection
+        return __inner().__await__()
+
+    def begin_transaction(
+        self,
+        read_only: bool = False,
+        isolation: Optional[str] = None
+    ) -> AsyncContextManager[AbstractTransaction]:
+        """This is the main method for interacting with the Session. It
+        creates a new Transaction which is then represented by an Async Context Manager
+
+        :param read_only: If True the transaction is begun READ ONLY
+        :param isolation: READ COMMITTED, REPEATABLE READ or SERIALIZABLE. Defaults to SERIALIZABLE.
+        """
+        if self._connection is None:
+            raise RuntimeError("Cannot begin a transaction unless the session is open")
+        return self._new_transaction(
+            self._connection, self._dbname, self._state, read_only=read_only, isolation=isolation)
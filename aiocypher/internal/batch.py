@@ -0,0 +1,51 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from typing import Iterable, Iterator, List, TypeVar
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "ROWS_PARAMETER",
+    "unwind_query",
+    "chunked"
+]
+
+
+T = TypeVar('T')
+
+
+DEFAULT_CHUNK_SIZE = 1000
+ROWS_PARAMETER = "rows"
+
+
+def unwind_query(query: str) -> str:
+    """Turns a query written in terms of a single 'row' into one which runs it for every entry in $rows"""
+    return f"UNWIND ${ROWS_PARAMETER} AS row\n{query}"
+
+
+def chunked(rows: Iterable[T], chunk_size: int) -> Iterator[List[T]]:
+    """Splits an iterable into lists of at most chunk_size entries, without reading more of it than needed"""
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, not {chunk_size}")
+    chunk: List[T] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
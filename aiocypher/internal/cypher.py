@@ -0,0 +1,175 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import re
+from functools import lru_cache
+from typing import Any, Callable, FrozenSet, Hashable, Mapping, Optional, Set
+
+__all__ = [
+    "parameter_names",
+    "substitute_parameters",
+    "normalise_query",
+    "query_labels",
+    "is_write_query",
+    "query_fingerprint",
+    "pattern_map_parameters",
+    "freeze_parameters"
+]
+
+
+# Everything which might contain something that looks like a parameter but is not one is matched as a whole,
+# so a single left to right pass only ever sees real parameters in the last alternative.
+_TOKENS = re.compile(r"""
+      '(?:[^'\\]|\\.)*'
+    | "(?:[^"\\]|\\.)*"
+    | `[^`]*`
+    | //[^\n]*
+    | /\*.*?\*/
+    | \$\$
+    | \$(?P<name>\w+)
+""", re.VERBOSE | re.DOTALL)
+
+
+def parameter_names(query: str) -> Set[str]:
+    """Returns the names of all the $parameters in a cypher query, ignoring anything in string literals,
+    quoted identifiers and comments, and any instances of $$.
+    """
+    return {match.group('name') for match in _TOKENS.finditer(query) if match.group('name') is not None}
+
+
+def substitute_parameters(query: str, replacement: Callable[[str], Optional[str]]) -> str:
+    """Replaces $parameters in a cypher query in a single pass, ignoring anything in string literals,
+    quoted identifiers and comments, and any instances of $$.
+
+    :param replacement: Called with the name of each parameter, and returns the text to replace it with, or None
+                        to leave it as it is
+    """
+    def __replace(match: 're.Match[str]') -> str:
+        name = match.group('name')
+        if name is None:
+            return match.group(0)
+        r = replacement(name)
+        return match.group(0) if r is None else r
+
+    return _TOKENS.sub(__replace, query)
+
+
+# String literals and quoted identifiers are matched whole so that nothing inside them is mistaken for syntax,
+# and runs of whitespace and comments are matched together as a single gap.
+_LEXEMES = re.compile(r"""
+      (?P<string>'(?:[^'\\]|\\.)*' | "(?:[^"\\]|\\.)*")
+    | (?P<identifier>`[^`]*`)
+    | (?P<gap>(?:\s+ | //[^\n]* | /\*.*?\*/)+)
+""", re.VERBOSE | re.DOTALL)
+
+_LABEL = re.compile(r"[:|]\s*(`[^`]+`|[A-Za-z_]\w*)")
+
+_WRITE_CLAUSE = re.compile(
+    r"(?<![.$])\b(?:CREATE|MERGE|SET|DELETE|REMOVE|DROP|FOREACH|LOAD\s+CSV|CALL)\b", re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def normalise_query(query: str) -> str:
+    """Returns a cypher query with its comments removed and every run of whitespace outside string literals and
+    quoted identifiers replaced by a single space, so that queries which differ only in layout compare equal.
+    """
+    def __replace(match: 're.Match[str]') -> str:
+        return ' ' if match.group('gap') is not None else match.group(0)
+
+    return _LEXEMES.sub(__replace, query).strip()
+
+
+def _code(query: str) -> str:
+    """The query with every string literal emptied, leaving only its syntax and identifiers"""
+    def __replace(match: 're.Match[str]') -> str:
+        if match.group('string') is not None:
+            return "''"
+        return ' ' if match.group('gap') is not None else match.group(0)
+
+    return _LEXEMES.sub(__replace, query)
+
+
+_FINGERPRINT_LEXEMES = re.compile(_LEXEMES.pattern + r"""
+    | (?P<number>(?<![\w.$])\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b)
+""", re.VERBOSE | re.DOTALL)
+
+
+@lru_cache(maxsize=1024)
+def query_fingerprint(query: str) -> str:
+    """Returns the normalised text of a cypher query with every string and number literal replaced by ?, so that
+    queries which differ only in their literal values share a fingerprint.
+    """
+    def __replace(match: 're.Match[str]') -> str:
+        if match.group('string') is not None or match.group('number') is not None:
+            return '?'
+        return ' ' if match.group('gap') is not None else match.group(0)
+
+    return _FINGERPRINT_LEXEMES.sub(__replace, query).strip()
+
+
+# A parameter on its own in place of the property map of a node or relationship pattern, eg. (n:Label $props)
+_PATTERN_MAP = re.compile(r"""
+    (?<![\w`])[(\[] \s*
+    (?:[A-Za-z_]\w* | `[^`]*`)? \s*
+    (?:[:|&] \s* (?:[A-Za-z_]\w* | `[^`]*`) \s*)*
+    \$(?P<name>\w+) \s* [)\]]
+""", re.VERBOSE)
+
+
+@lru_cache(maxsize=1024)
+def pattern_map_parameters(query: str) -> FrozenSet[str]:
+    """Returns the names of the $parameters used as the property maps of node or relationship patterns in a cypher
+    query, which cannot be replaced by an arbitrary expression.
+
+    This errs on the side of including too much, so a parameter which is the only thing in parentheses or a list,
+    such as ($x) or [$x], is also returned.
+    """
+    return frozenset(match.group('name') for match in _PATTERN_MAP.finditer(_code(query)))
+
+
+@lru_cache(maxsize=1024)
+def query_labels(query: str) -> FrozenSet[str]:
+    """Returns the node labels and relationship types which appear in a cypher query.
+
+    This errs on the side of including too much, so a few names which are not labels, such as variables used as
+    the values in map literals, may also be returned. Labels which are not written in the query, such as those of
+    a node matched only by a variable or a property, cannot be found.
+    """
+    return frozenset(label.strip('`') for label in _LABEL.findall(_code(query)))
+
+
+@lru_cache(maxsize=1024)
+def is_write_query(query: str) -> bool:
+    """Returns True unless a cypher query is certainly read only. Any query containing a clause which can write,
+    including CALL of a procedure, is treated as a write.
+    """
+    return _WRITE_CLAUSE.search(_code(query)) is not None
+
+
+def freeze_parameters(value: Any) -> Hashable:
+    """Converts the parameters of a query into an equivalent value which can be hashed, as long as every value
+    inside them other than maps, lists and sets can be. Otherwise hashing the returned value raises a TypeError.
+
+    Other values are paired with their types, since True, 1 and 1.0 are equal in Python but not in cypher.
+    """
+    if isinstance(value, Mapping):
+        return ('map', tuple(sorted((key, freeze_parameters(v)) for (key, v) in value.items())))
+    elif isinstance(value, (list, tuple)):
+        return ('list', tuple(freeze_parameters(v) for v in value))
+    elif isinstance(value, (set, frozenset)):
+        return ('set', frozenset(freeze_parameters(v) for v in value))
+    return (type(value), value)
@@ -0,0 +1,112 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Helpers shared by the backends which talk to AgensGraph through PostgreSQL client libraries."""
+
+from .cypher import substitute_parameters
+from ..interface.session import READ_COMMITTED, REPEATABLE_READ, SERIALIZABLE
+
+from typing import List, Dict, Any, Tuple, FrozenSet, Mapping, Sequence, Optional
+from functools import lru_cache
+
+__all__ = [
+    "TRANSLATION_CACHE_SIZE",
+    "ISOLATION_LEVELS",
+    "convert_cypher_parameters_to_postgres",
+    "begin_statement",
+    "with_statement_timeout",
+    "plain_value",
+    "rows_to_dicts"
+]
+
+
+TRANSLATION_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=TRANSLATION_CACHE_SIZE)
+def _translate(query: str, names: FrozenSet[str]) -> str:
+    # Replace entries of the form $name with %(name)s, in a single pass which skips string literals,
+    # comments and instances of $$
+    return substitute_parameters(query, lambda name: f"%({name})s" if name in names else None)
+
+
+def convert_cypher_parameters_to_postgres(query: str, params: Mapping[str, Any]) -> str:
+    """Rewrites the $parameters of a cypher query which appear in params into the pyformat style used by
+    psycopg.
+
+    Translations are cached, keyed on the query and the set of parameter names.
+    """
+    return _translate(str(query), frozenset(params))
+
+
+ISOLATION_LEVELS = (READ_COMMITTED, REPEATABLE_READ, SERIALIZABLE)
+
+
+def begin_statement(read_only: bool, isolation: Optional[str]) -> str:
+    """The statement which begins a transaction with the given options. SERIALIZABLE is the default."""
+    level = SERIALIZABLE if isolation is None else isolation.upper()
+    if level not in ISOLATION_LEVELS:
+        raise ValueError(f"Unsupported isolation level {isolation!r}, must be one of {', '.join(ISOLATION_LEVELS)}")
+    return f"BEGIN ISOLATION LEVEL {level}" + (" READ ONLY" if read_only else "")
+
+
+def with_statement_timeout(options: Mapping[str, str], statement_timeout: Optional[int]) -> Dict[str, str]:
+    """The libpq connection options with statement_timeout, in milliseconds, added to the server options which
+    are sent when connecting. Any server options already given are kept.
+    """
+    options = dict(options)
+    if statement_timeout is not None:
+        setting = f"-c statement_timeout={statement_timeout}"
+        options['options'] = f"{options['options']} {setting}" if options.get('options') else setting
+    return options
+
+
+_VERTEX_KEYS = frozenset(('type', 'label', 'vid'))
+_EDGE_KEYS = frozenset(('type', 'label', 'eid', 'source_vid', 'destination_vid'))
+
+
+def plain_value(value: Any) -> Any:
+    """Strips the agensgraph metadata from decoded vertices, edges and paths, leaving only their properties.
+
+    A vertex becomes the dict of its properties, as a neo4j node does in neo4j.Record.data(). An edge also becomes
+    the dict of its own properties, and a path the list of the property dicts of its vertices and edges in order.
+    Neither matches neo4j.Record.data(), which gives the properties of the endpoints and the type of a
+    relationship, since a decoded edge carries only the vids of its endpoints.
+    """
+    if isinstance(value, dict):
+        kind = value.get('type')
+        if kind == 'vertex':
+            return {key: v for (key, v) in value.items() if key not in _VERTEX_KEYS}
+        elif kind == 'edge':
+            return {key: v for (key, v) in value.items() if key not in _EDGE_KEYS}
+        elif kind == 'path':
+            vertices = value['vertices']
+            path = [plain_value(vertex) for vertex in vertices[:1]]
+            for (edge, vertex) in zip(value['edges'], vertices[1:]):
+                path.extend((plain_value(edge), plain_value(vertex)))
+            return path
+    elif isinstance(value, list):
+        return [plain_value(v) for v in value]
+    return value
+
+
+def rows_to_dicts(description: Sequence[Any], rows: List[Tuple[Any, ...]]) -> List[Dict[str, Any]]:
+    """Turns rows into dictionaries keyed on the column names in a cursor description, which are only looked up
+    once.
+    """
+    names = [column.name for column in description]
+    return [dict(zip(names, map(plain_value, row))) for row in rows]
@@ -0,0 +1,193 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Base classes for wrappers around the Sessions, Transactions and Results of any backend, which pass everything
+they do not override on to the object they wrap.
+"""
+
+import asyncio
+from typing import Any, AsyncContextManager, AsyncIterator, Collection, Dict, Iterable, List, Mapping, Optional, Union
+
+from ..interface.session import Session
+from ..interface.transaction import Transaction
+from ..interface.result import Result, DEFAULT_BATCH_SIZE, DEFAULT_MAX_BUFFERED_BATCHES
+from ..interface.record import Record
+from ..interface.graph import Graph
+from ..interface.node import Node
+from ..interface.relationship import Relationship
+from .batch import DEFAULT_CHUNK_SIZE
+
+__all__ = [
+    "SessionProxy",
+    "TransactionProxy",
+    "ResultProxy",
+    "RecordProxy",
+    "GraphProxy"
+]
+
+
+class SessionProxy (Session):
+    """Wraps the async context manager of a session. Subclasses override _wrap_transaction to wrap the
+    transactions begun on it.
+    """
+    def __init__(self, session: AsyncContextManager[Session]):
+        self._context = session
+        self._session: Optional[Session] = None
+
+    async def __aenter__(self) -> 'SessionProxy':
+        self._session = await self._context.__aenter__()
+        return self
+
+    async def __aexit__(self, *args) -> bool:
+        return bool(await self._context.__aexit__(*args))
+
+    def __await__(self):
+        return self._session.__await__()  # type: ignore
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+    def begin_transaction(
+        self,
+        read_only: bool = False,
+        isolation: Optional[str] = None
+    ) -> AsyncContextManager[Transaction]:
+        assert self._session is not None
+        return self._wrap_transaction(
+            self._session.begin_transaction(read_only=read_only, isolation=isolation), read_only)
+
+    def _wrap_transaction(
+        self,
+        transaction: AsyncContextManager[Transaction],
+        read_only: bool
+    ) -> AsyncContextManager[Transaction]:
+        return transaction
+
+
+class TransactionProxy (Transaction):
+    """Wraps the async context manager of a transaction."""
+    def __init__(self, transaction: AsyncContextManager[Transaction]):
+        self._context = transaction
+        self._transaction: Optional[Transaction] = None
+
+    async def __aenter__(self) -> 'TransactionProxy':
+        self._transaction = await self._context.__aenter__()
+        return self
+
+    async def __aexit__(self, *args):
+        return await self._context.__aexit__(*args)
+
+    def __await__(self):
+        return self._transaction.__await__()  # type: ignore
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._transaction, name)
+
+    def run(self, *args, **kwargs) -> Result:
+        assert self._transaction is not None
+        return self._transaction.run(*args, **kwargs)
+
+    async def run_batch(
+        self,
+        query: str,
+        rows: Iterable[Mapping[str, Any]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **params
+    ) -> int:
+        assert self._transaction is not None
+        return await self._transaction.run_batch(query, rows, chunk_size=chunk_size, **params)
+
+
+class ResultProxy (Result[Any]):
+    """Wraps a result."""
+    def __init__(self, result: Result):
+        self._result = result
+
+    def __await__(self):
+        return self._result.__await__()
+
+    def single(self) -> Record:
+        return self._result.single()
+
+    def graph(self, *args, **kwargs) -> Graph:
+        return self._result.graph(*args, **kwargs)
+
+    async def data(self) -> List[Dict[str, Any]]:
+        return await self._result.data()
+
+    def stream(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_buffered_batches: int = DEFAULT_MAX_BUFFERED_BATCHES
+    ) -> AsyncIterator[Any]:
+        return self._result.stream(batch_size=batch_size, max_buffered_batches=max_buffered_batches)
+
+
+class RecordProxy (Record[Any]):
+    """Wraps the record of a result. The first time it is awaited, directly or by data() or value(), the original
+    is awaited by _fetch, which subclasses override. Concurrent awaits all wait for that one _fetch.
+    """
+    def __init__(self, record: Record):
+        self._record = record
+        self._future: Optional['asyncio.Future[Any]'] = None
+
+    async def _fetch(self) -> Any:
+        return await self._record
+
+    def __await__(self):
+        async def __inner():
+            if self._future is None:
+                self._future = asyncio.ensure_future(self._fetch())
+            return await asyncio.shield(self._future)
+        return __inner().__await__()
+
+    async def data(self) -> Optional[Dict[str, Dict[str, Union[str, int]]]]:
+        await self
+        return await self._record.data()
+
+    async def value(self) -> Optional[Node]:
+        await self
+        return await self._record.value()
+
+
+class GraphProxy (Graph[Any]):
+    """Wraps the graph of a result. The first time it is awaited, directly or through its properties, the original
+    is awaited by _fetch, which subclasses override. Concurrent awaits all wait for that one _fetch.
+    """
+    def __init__(self, graph: Graph):
+        self._graph = graph
+        self._future: Optional['asyncio.Future[Any]'] = None
+
+    async def _fetch(self) -> Any:
+        return await self._graph
+
+    def __await__(self):
+        async def __inner():
+            if self._future is None:
+                self._future = asyncio.ensure_future(self._fetch())
+            return await asyncio.shield(self._future)
+        return __inner().__await__()
+
+    @property
+    async def nodes(self) -> Collection[Node]:
+        await self
+        return await self._graph.nodes
+
+    @property
+    async def relationships(self) -> Collection[Relationship]:
+        await self
+        return await self._graph.relationships
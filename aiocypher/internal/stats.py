@@ -0,0 +1,74 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from bisect import bisect_left
+from typing import NamedTuple, Sequence, Tuple
+
+__all__ = [
+    "DEFAULT_LATENCY_BUCKETS",
+    "HistogramSnapshot",
+    "Histogram"
+]
+
+
+# In seconds, from half a millisecond to ten seconds
+DEFAULT_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class HistogramSnapshot (NamedTuple):
+    """The state of a Histogram at one moment.
+
+    counts[n] is the number of observations no greater than buckets[n] and greater than the bucket before it. The
+    final entry of counts, which has no bucket, is the number of observations greater than every bucket.
+    """
+    buckets: Tuple[float, ...]
+    counts: Tuple[int, ...]
+    total: int
+    sum: float
+
+    def quantile(self, q: float) -> float:
+        """An upper bound for the q-th quantile (0 <= q <= 1) of the observations, being the upper bound of the
+        bucket it falls in. Returns infinity if it is above every bucket and 0 if there are no observations.
+        """
+        if self.total == 0:
+            return 0.0
+        target = q * self.total
+        seen = 0
+        for (bound, count) in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return float('inf')
+
+
+class Histogram (object):
+    """Counts observations into fixed buckets, in the manner of a Prometheus histogram. Observing is cheap enough
+    to do on every operation.
+    """
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self._buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self._buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self._buckets, value)] += 1
+        self._count += 1
+        self._sum += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(self._buckets, tuple(self._counts), self._count, self._sum)
@@ -0,0 +1,365 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Instrumentation of drivers, which is off unless Driver.enable_metrics() is called.
+
+Histograms, which are in seconds:
+    aiocypher_session_acquire_seconds: opening a session, including waiting for a thread or connection
+    aiocypher_queue_wait_seconds: (aioneo4j) a command waiting for the session's IO thread to pick it up
+    aiocypher_pool_acquire_seconds: (aioagensgraph, asyncagensgraph) waiting for a pooled connection
+    aiocypher_execution_seconds: running a query without reading its rows, ie. awaiting a Result, or run_batch
+    aiocypher_fetch_seconds: running a query and reading its rows, with data(), single(), graph() or stream()
+    aiocypher_commit_seconds: committing a transaction
+
+Counters:
+    aiocypher_rows_total: rows read with data(), single() or stream()
+    aiocypher_errors_total: queries, commits and sessions which failed
+
+Gauges:
+    aiocypher_open_sessions: sessions currently open
+    aiocypher_io_threads: (aioneo4j) IO threads currently occupied by sessions
+
+The histograms of queries and the counters are labelled with the fingerprint of the query, which is its text with
+literal values removed.
+"""
+
+import threading
+import time
+from typing import Any, AsyncContextManager, AsyncIterator, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .interface.session import Session
+from .interface.transaction import Transaction
+from .interface.result import Result, DEFAULT_BATCH_SIZE, DEFAULT_MAX_BUFFERED_BATCHES
+from .interface.record import Record
+from .interface.graph import Graph
+from .internal.batch import DEFAULT_CHUNK_SIZE
+from .internal.cypher import query_fingerprint
+from .internal.proxy import SessionProxy, TransactionProxy, ResultProxy, RecordProxy, GraphProxy
+from .internal.stats import DEFAULT_LATENCY_BUCKETS, Histogram, HistogramSnapshot
+
+
+__all__ = [
+    "SESSION_ACQUIRE",
+    "QUEUE_WAIT",
+    "POOL_ACQUIRE",
+    "EXECUTION",
+    "FETCH",
+    "COMMIT",
+    "ROWS",
+    "ERRORS",
+    "OPEN_SESSIONS",
+    "IO_THREADS",
+    "Metrics",
+    "InMemoryMetrics",
+    "instrument_session"
+]
+
+
+SESSION_ACQUIRE = "aiocypher_session_acquire_seconds"
+QUEUE_WAIT = "aiocypher_queue_wait_seconds"
+POOL_ACQUIRE = "aiocypher_pool_acquire_seconds"
+EXECUTION = "aiocypher_execution_seconds"
+FETCH = "aiocypher_fetch_seconds"
+COMMIT = "aiocypher_commit_seconds"
+ROWS = "aiocypher_rows_total"
+ERRORS = "aiocypher_errors_total"
+OPEN_SESSIONS = "aiocypher_open_sessions"
+IO_THREADS = "aiocypher_io_threads"
+
+
+class Metrics (object):
+    """The interface through which a driver reports its metrics. Every method does nothing, so subclasses need
+    only override those they are interested in.
+
+    Some metrics are reported from the IO threads of aioneo4j, so implementations must be thread safe.
+    """
+    def observe(self, name: str, value: float, fingerprint: Optional[str] = None) -> None:
+        """Records a value, in seconds, in a histogram."""
+        pass
+
+    def increment(self, name: str, amount: float = 1, fingerprint: Optional[str] = None) -> None:
+        """Adds to a counter."""
+        pass
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Sets the value of a gauge."""
+        pass
+
+    def adjust_gauge(self, name: str, amount: float) -> None:
+        """Adds to, or with a negative amount subtracts from, the value of a gauge."""
+        pass
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(fingerprint: Optional[str], *extra: Tuple[str, str]) -> str:
+    pairs = ([('query', fingerprint)] if fingerprint is not None else []) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for (name, value) in pairs) + '}'
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class InMemoryMetrics (Metrics):
+    """Keeps metrics in memory, and renders them in the Prometheus text exposition format, eg. to be served by an
+    application's /metrics endpoint.
+
+    :param buckets: The upper bounds of the buckets of every histogram, in seconds
+    """
+    def __init__(self, buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS):
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, Optional[str]], Histogram] = {}
+        self._counters: Dict[Tuple[str, Optional[str]], float] = {}
+        self._gauges: Dict[str, float] = {}
+
+    def observe(self, name: str, value: float, fingerprint: Optional[str] = None) -> None:
+        with self._lock:
+            histogram = self._histograms.get((name, fingerprint))
+            if histogram is None:
+                histogram = self._histograms[(name, fingerprint)] = Histogram(self._buckets)
+            histogram.observe(value)
+
+    def increment(self, name: str, amount: float = 1, fingerprint: Optional[str] = None) -> None:
+        with self._lock:
+            self._counters[(name, fingerprint)] = self._counters.get((name, fingerprint), 0) + amount
+
+    def set_gauge(self, name: str, value: float) -> None:
+        with self._lock:
+            self._gauges[name] = value
+
+    def adjust_gauge(self, name: str, amount: float) -> None:
+        with self._lock:
+            self._gauges[name] = self._gauges.get(name, 0) + amount
+
+    def histogram(self, name: str, fingerprint: Optional[str] = None) -> HistogramSnapshot:
+        """The current state of a histogram, which is empty if nothing has been observed."""
+        with self._lock:
+            histogram = self._histograms.get((name, fingerprint))
+            return (histogram if histogram is not None else Histogram(self._buckets)).snapshot()
+
+    def counter(self, name: str, fingerprint: Optional[str] = None) -> float:
+        with self._lock:
+            return self._counters.get((name, fingerprint), 0)
+
+    def gauge(self, name: str) -> float:
+        with self._lock:
+            return self._gauges.get(name, 0)
+
+    def render(self) -> str:
+        """Returns every metric in the Prometheus text exposition format."""
+        with self._lock:
+            histograms = sorted(
+                ((name, fingerprint, h.snapshot()) for ((name, fingerprint), h) in self._histograms.items()),
+                key=lambda item: (item[0], item[1] or ''))
+            counters = sorted(self._counters.items(), key=lambda item: (item[0][0], item[0][1] or ''))
+            gauges = sorted(self._gauges.items())
+
+        lines: List[str] = []
+        typed = set()
+        for (name, fingerprint, snapshot) in histograms:
+            if name not in typed:
+                lines.append(f"# TYPE {name} histogram")
+                typed.add(name)
+            cumulative = 0
+            for (bound, count) in zip(snapshot.buckets + (float('inf'),), snapshot.counts):
+                cumulative += count
+                le = "+Inf" if bound == float('inf') else _number(bound)
+                lines.append(f"{name}_bucket{_labels(fingerprint, ('le', le))} {cumulative}")
+            lines.append(f"{name}_sum{_labels(fingerprint)} {_number(snapshot.sum)}")
+            lines.append(f"{name}_count{_labels(fingerprint)} {snapshot.total}")
+        for ((name, fingerprint), value) in counters:
+            if name not in typed:
+                lines.append(f"# TYPE {name} counter")
+                typed.add(name)
+            lines.append(f"{name}{_labels(fingerprint)} {_number(value)}")
+        for (name, value) in gauges:
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {_number(value)}")
+        return ''.join(line + '\n' for line in lines)
+
+
+def instrument_session(metrics: Metrics, session: AsyncContextManager[Session]) -> AsyncContextManager[Session]:
+    """Wraps the async context manager of a session so that everything done with it is reported to metrics."""
+    return _InstrumentedSession(metrics, session)
+
+
+class _InstrumentedSession (SessionProxy):
+    def __init__(self, metrics: Metrics, session: AsyncContextManager[Session]):
+        super().__init__(session)
+        self._metrics = metrics
+
+    async def __aenter__(self) -> '_InstrumentedSession':
+        start = time.perf_counter()
+        try:
+            await super().__aenter__()
+        except BaseException:
+            self._metrics.increment(ERRORS)
+            raise
+        finally:
+            self._metrics.observe(SESSION_ACQUIRE, time.perf_counter() - start)
+        self._metrics.adjust_gauge(OPEN_SESSIONS, 1)
+        return self
+
+    async def __aexit__(self, *args) -> bool:
+        try:
+            return await super().__aexit__(*args)
+        finally:
+            self._metrics.adjust_gauge(OPEN_SESSIONS, -1)
+
+    def _wrap_transaction(
+        self,
+        transaction: AsyncContextManager[Transaction],
+        read_only: bool
+    ) -> AsyncContextManager[Transaction]:
+        return _InstrumentedTransaction(self._metrics, transaction)
+
+
+class _InstrumentedTransaction (TransactionProxy):
+    def __init__(self, metrics: Metrics, transaction: AsyncContextManager[Transaction]):
+        super().__init__(transaction)
+        self._metrics = metrics
+
+    async def __aexit__(self, exc_t, exc_v, exc_tb):
+        start = time.perf_counter()
+        try:
+            return await super().__aexit__(exc_t, exc_v, exc_tb)
+        except BaseException:
+            self._metrics.increment(ERRORS)
+            raise
+        finally:
+            if exc_v is None:
+                self._metrics.observe(COMMIT, time.perf_counter() - start)
+
+    def run(self, query: str, *args, **kwargs) -> Result:
+        return _InstrumentedResult(self._metrics, super().run(query, *args, **kwargs), query_fingerprint(query))
+
+    async def run_batch(
+        self,
+        query: str,
+        rows: Iterable[Mapping[str, Any]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **params
+    ) -> int:
+        fingerprint = query_fingerprint(query)
+        start = time.perf_counter()
+        try:
+            return await super().run_batch(query, rows, chunk_size=chunk_size, **params)
+        except BaseException:
+            self._metrics.increment(ERRORS, fingerprint=fingerprint)
+            raise
+        finally:
+            self._metrics.observe(EXECUTION, time.perf_counter() - start, fingerprint)
+
+
+class _Timer (object):
+    """Times the body of a with statement into a histogram, and counts it as an error if it raises."""
+    def __init__(self, metrics: Metrics, name: str, fingerprint: str):
+        self._metrics = metrics
+        self._name = name
+        self._fingerprint = fingerprint
+
+    def __enter__(self) -> '_Timer':
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_t, exc_v, exc_tb) -> None:
+        self._metrics.observe(self._name, time.perf_counter() - self._start, self._fingerprint)
+        if exc_v is not None:
+            self._metrics.increment(ERRORS, fingerprint=self._fingerprint)
+
+
+class _InstrumentedResult (ResultProxy):
+    def __init__(self, metrics: Metrics, result: Result, fingerprint: str):
+        super().__init__(result)
+        self._metrics = metrics
+        self._fingerprint = fingerprint
+
+    def _timer(self, name: str) -> _Timer:
+        return _Timer(self._metrics, name, self._fingerprint)
+
+    def __await__(self):
+        async def __inner():
+            with self._timer(EXECUTION):
+                return await self._result
+        return __inner().__await__()
+
+    def single(self) -> Record:
+        return _InstrumentedRecord(self, super().single())
+
+    def graph(self, *args, **kwargs) -> Graph:
+        return _InstrumentedGraph(self, super().graph(*args, **kwargs))
+
+    async def data(self) -> List[Dict[str, Any]]:
+        with self._timer(FETCH):
+            data = await self._result.data()
+        self._metrics.increment(ROWS, len(data), self._fingerprint)
+        return data
+
+    async def stream(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_buffered_batches: int = DEFAULT_MAX_BUFFERED_BATCHES
+    ) -> AsyncIterator[Any]:
+        # Only the time spent waiting for rows is counted, not the time the consumer spends on them
+        rows = self._result.stream(batch_size=batch_size, max_buffered_batches=max_buffered_batches).__aiter__()
+        waited = 0.0
+        count = 0
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    row = await rows.__anext__()
+                except StopAsyncIteration:
+                    break
+                except BaseException:
+                    self._metrics.increment(ERRORS, fingerprint=self._fingerprint)
+                    raise
+                finally:
+                    waited += time.perf_counter() - start
+                count += 1
+                yield row
+        finally:
+            self._metrics.observe(FETCH, waited, self._fingerprint)
+            self._metrics.increment(ROWS, count, self._fingerprint)
+
+
+class _InstrumentedRecord (RecordProxy):
+    def __init__(self, result: _InstrumentedResult, record: Record):
+        super().__init__(record)
+        self._result = result
+
+    async def _fetch(self) -> Any:
+        with self._result._timer(FETCH):
+            value = await super()._fetch()
+        self._result._metrics.increment(ROWS, int(value is not None), self._result._fingerprint)
+        return value
+
+
+class _InstrumentedGraph (GraphProxy):
+    def __init__(self, result: _InstrumentedResult, graph: Graph):
+        super().__init__(graph)
+        self._result = result
+
+    async def _fetch(self) -> Any:
+        with self._result._timer(FETCH):
+            return await super()._fetch()
@@ -0,0 +1,100 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+from typing import Any, Dict, Hashable, List, Mapping, NamedTuple, TYPE_CHECKING
+
+from .internal.cypher import normalise_query, freeze_parameters
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .interface.driver import Driver
+
+
+__all__ = [
+    "SingleFlight",
+    "SingleFlightStats"
+]
+
+
+class SingleFlightStats (NamedTuple):
+    executions: int
+    shared: int
+    in_flight: int
+
+
+class SingleFlight (object):
+    """Runs read queries so that concurrent callers making the same query with the same parameters share a single
+    execution of it, and a single result.
+
+    The first caller starts the query in a session and read only transaction of its own, and any identical
+    query made before it has finished waits for the same result instead of opening another session. Once it has
+    finished the next identical query runs it again, so this never returns a result older than the query which
+    asked for it.
+
+    A caller which is cancelled does not cancel the query for the others. The results are shared between all
+    their callers, and must not be modified.
+
+    Should be created via Driver.singleflight().
+    """
+    def __init__(self, driver: 'Driver', **session_kwargs):
+        """
+        :param driver: The driver to open sessions on
+        :param session_kwargs: Passed to driver.session() for every session opened
+        """
+        self._driver = driver
+        self._session_kwargs = session_kwargs
+        self._in_flight: Dict[Hashable, 'asyncio.Future[List[Dict[str, Any]]]'] = {}
+        self._executions = 0
+        self._shared = 0
+
+    async def data(self, query: str, **params) -> List[Dict[str, Any]]:
+        """Runs a read query and returns the result of Result.data(), or the result of an identical query which is
+        already running.
+        """
+        try:
+            key = (normalise_query(query), freeze_parameters(params))
+            hash(key)
+        except TypeError:
+            return await self.__read(query, params)
+
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self.__read(query, params))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda f: self.__done(key, f))
+        else:
+            self._shared += 1
+        return await asyncio.shield(future)
+
+    def stats(self) -> SingleFlightStats:
+        """Returns the number of queries which were run, the number of callers who shared the result of one which
+        was already running, and the number running now.
+        """
+        return SingleFlightStats(executions=self._executions, shared=self._shared, in_flight=len(self._in_flight))
+
+    async def __read(self, query: str, params: Mapping[str, Any]) -> List[Dict[str, Any]]:
+        self._executions += 1
+        async with self._driver.session(**self._session_kwargs) as session:
+            async with session.begin_transaction(read_only=True) as tx:
+                return await tx.run(query, **params).data()
+
+    def __done(self, key: Hashable, future: 'asyncio.Future[List[Dict[str, Any]]]') -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            # Retrieve any exception, so that it is not reported as unhandled if every caller was cancelled
+            future.exception()
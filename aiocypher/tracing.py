@@ -0,0 +1,332 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tracing of drivers, which is off unless Driver.enable_tracing() is called.
+
+Sessions opened through a driver with tracing enabled emit these spans, nested as shown:
+
+    aiocypher.session: the whole of a session
+        aiocypher.session.acquire: opening it, including waiting for a thread or connection
+        aiocypher.transaction: the whole of a transaction
+            aiocypher.transaction.begin: beginning it
+            aiocypher.query: running a query without reading its rows, ie. awaiting a Result, or run_batch
+            aiocypher.fetch: running a query and reading its rows, with data(), single(), graph() or stream()
+            aiocypher.commit or aiocypher.rollback: ending it
+
+The query spans have the fingerprint of their query, which is its text with literal values removed, and the fetch
+spans the number of rows read. A stream's span is the current span for the whole of the iteration, so a stream
+should be read to its end or closed.
+
+Any tracer with the start_as_current_span method of an OpenTelemetry Tracer can be used, so an
+opentelemetry.trace.Tracer may be passed to enable_tracing without aiocypher depending on OpenTelemetry. Spans are
+made current using the tracer's own contextvars, which aioneo4j carries over to its IO threads, so spans started by
+anything called on those threads are children of the span of the query which caused them.
+"""
+
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any, AsyncContextManager, AsyncIterator, ContextManager, Dict, Iterable, Iterator, List, Mapping, NamedTuple,
+    Optional, Protocol
+)
+
+from .interface.session import Session
+from .interface.transaction import Transaction
+from .interface.result import Result, DEFAULT_BATCH_SIZE, DEFAULT_MAX_BUFFERED_BATCHES
+from .interface.record import Record
+from .interface.graph import Graph
+from .internal.batch import DEFAULT_CHUNK_SIZE
+from .internal.cypher import query_fingerprint
+from .internal.proxy import SessionProxy, TransactionProxy, ResultProxy, RecordProxy, GraphProxy
+
+
+__all__ = [
+    "SESSION",
+    "SESSION_ACQUIRE",
+    "TRANSACTION",
+    "TRANSACTION_BEGIN",
+    "QUERY",
+    "FETCH",
+    "COMMIT",
+    "ROLLBACK",
+    "SYSTEM",
+    "NAMESPACE",
+    "QUERY_TEXT",
+    "RETURNED_ROWS",
+    "READ_ONLY",
+    "Span",
+    "Tracer",
+    "FinishedSpan",
+    "InMemoryTracer",
+    "trace_session"
+]
+
+
+SESSION = "aiocypher.session"
+SESSION_ACQUIRE = "aiocypher.session.acquire"
+TRANSACTION = "aiocypher.transaction"
+TRANSACTION_BEGIN = "aiocypher.transaction.begin"
+QUERY = "aiocypher.query"
+FETCH = "aiocypher.fetch"
+COMMIT = "aiocypher.commit"
+ROLLBACK = "aiocypher.rollback"
+
+# The names of attributes follow the OpenTelemetry semantic conventions for databases where there is one
+SYSTEM = "db.system.name"
+NAMESPACE = "db.namespace"
+QUERY_TEXT = "db.query.text"
+RETURNED_ROWS = "db.response.returned_rows"
+READ_ONLY = "aiocypher.read_only"
+
+
+class Span (Protocol):
+    """The value of the context managers returned by a Tracer, eg. an opentelemetry.trace.Span."""
+    def set_attribute(self, key: str, value: Any) -> Any:
+        ...
+
+
+class Tracer (Protocol):
+    """Anything which can start spans, eg. an opentelemetry.trace.Tracer.
+
+    start_as_current_span returns a context manager which starts a span as a child of the current one and makes it
+    current for as long as the context is entered. If the context is left with an exception it should be recorded
+    on the span.
+    """
+    def start_as_current_span(self, name: str, attributes: Optional[Mapping[str, Any]] = None) -> ContextManager[Span]:
+        ...
+
+
+class FinishedSpan (NamedTuple):
+    """A span recorded by an InMemoryTracer. parent is the id of the span it was started in, if any."""
+    name: str
+    id: int
+    parent: Optional[int]
+    attributes: Dict[str, Any]
+    start: float
+    end: float
+    error: Optional[BaseException]
+
+
+class _RecordingSpan (object):
+    def __init__(self, attributes: Optional[Mapping[str, Any]]):
+        self.attributes = dict(attributes or {})
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class InMemoryTracer (object):
+    """A Tracer which keeps the spans it finishes in a list, in the order they finished, eg. for tests or
+    debugging.
+    """
+    def __init__(self) -> None:
+        self.spans: List[FinishedSpan] = []
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._current: ContextVar[Optional[int]] = ContextVar('aiocypher_span', default=None)
+
+    @property
+    def current_span(self) -> Optional[int]:
+        """The id of the current span, if any."""
+        return self._current.get()
+
+    @contextmanager
+    def start_as_current_span(self, name: str, attributes: Optional[Mapping[str, Any]] = None) -> Iterator[Any]:
+        span = _RecordingSpan(attributes)
+        parent = self._current.get()
+        with self._lock:
+            id = next(self._ids)
+        token = self._current.set(id)
+        error: Optional[BaseException] = None
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            end = time.perf_counter()
+            try:
+                self._current.reset(token)
+            except ValueError:
+                # A stream which was not finished with is closed later in another context
+                self._current.set(parent)
+            with self._lock:
+                self.spans.append(FinishedSpan(name, id, parent, span.attributes, start, end, error))
+
+
+class _OpenSpan (object):
+    """A span which is started and ended in different methods, eg. __aenter__ and __aexit__."""
+    def __init__(self, tracer: Tracer, name: str, attributes: Optional[Mapping[str, Any]] = None):
+        self._context = tracer.start_as_current_span(name, attributes=attributes)
+        self.span = self._context.__enter__()
+
+    def end(self, exc_t=None, exc_v=None, exc_tb=None) -> None:
+        self._context.__exit__(exc_t, exc_v, exc_tb)
+
+
+def trace_session(
+    tracer: Tracer,
+    session: AsyncContextManager[Session],
+    attributes: Optional[Mapping[str, Any]] = None
+) -> AsyncContextManager[Session]:
+    """Wraps the async context manager of a session so that everything done with it is traced.
+
+    :param attributes: Set on the span of the session
+    """
+    return _TracedSession(tracer, session, attributes)
+
+
+class _TracedSession (SessionProxy):
+    def __init__(self, tracer: Tracer, session: AsyncContextManager[Session], attributes: Optional[Mapping[str, Any]]):
+        super().__init__(session)
+        self._tracer = tracer
+        self._attributes = attributes
+        self._span: Optional[_OpenSpan] = None
+
+    async def __aenter__(self) -> '_TracedSession':
+        self._span = _OpenSpan(self._tracer, SESSION, self._attributes)
+        try:
+            with self._tracer.start_as_current_span(SESSION_ACQUIRE):
+                await super().__aenter__()
+        except BaseException as e:
+            self._span.end(type(e), e, e.__traceback__)
+            raise
+        return self
+
+    async def __aexit__(self, exc_t, exc_v, exc_tb) -> bool:
+        try:
+            return await super().__aexit__(exc_t, exc_v, exc_tb)
+        finally:
+            assert self._span is not None
+            self._span.end(exc_t, exc_v, exc_tb)
+
+    def _wrap_transaction(
+        self,
+        transaction: AsyncContextManager[Transaction],
+        read_only: bool
+    ) -> AsyncContextManager[Transaction]:
+        return _TracedTransaction(self._tracer, transaction, read_only)
+
+
+class _TracedTransaction (TransactionProxy):
+    def __init__(self, tracer: Tracer, transaction: AsyncContextManager[Transaction], read_only: bool):
+        super().__init__(transaction)
+        self._tracer = tracer
+        self._read_only = read_only
+        self._span: Optional[_OpenSpan] = None
+
+    async def __aenter__(self) -> '_TracedTransaction':
+        self._span = _OpenSpan(self._tracer, TRANSACTION, {READ_ONLY: self._read_only})
+        try:
+            with self._tracer.start_as_current_span(TRANSACTION_BEGIN):
+                await super().__aenter__()
+        except BaseException as e:
+            self._span.end(type(e), e, e.__traceback__)
+            raise
+        return self
+
+    async def __aexit__(self, exc_t, exc_v, exc_tb):
+        assert self._span is not None
+        try:
+            with self._tracer.start_as_current_span(COMMIT if exc_v is None else ROLLBACK):
+                result = await super().__aexit__(exc_t, exc_v, exc_tb)
+        except BaseException as e:
+            self._span.end(type(e), e, e.__traceback__)
+            raise
+        self._span.end(exc_t, exc_v, exc_tb)
+        return result
+
+    def run(self, query: str, *args, **kwargs) -> Result:
+        return _TracedResult(self._tracer, super().run(query, *args, **kwargs), query_fingerprint(query))
+
+    async def run_batch(
+        self,
+        query: str,
+        rows: Iterable[Mapping[str, Any]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        **params
+    ) -> int:
+        with self._tracer.start_as_current_span(QUERY, attributes={QUERY_TEXT: query_fingerprint(query)}):
+            return await super().run_batch(query, rows, chunk_size=chunk_size, **params)
+
+
+class _TracedResult (ResultProxy):
+    def __init__(self, tracer: Tracer, result: Result, fingerprint: str):
+        super().__init__(result)
+        self._tracer = tracer
+        self._fingerprint = fingerprint
+
+    def _span(self, name: str) -> ContextManager[Span]:
+        return self._tracer.start_as_current_span(name, attributes={QUERY_TEXT: self._fingerprint})
+
+    def __await__(self):
+        async def __inner():
+            with self._span(QUERY):
+                return await self._result
+        return __inner().__await__()
+
+    def single(self) -> Record:
+        return _TracedRecord(self, super().single())
+
+    def graph(self, *args, **kwargs) -> Graph:
+        return _TracedGraph(self, super().graph(*args, **kwargs))
+
+    async def data(self) -> List[Dict[str, Any]]:
+        with self._span(FETCH) as span:
+            data = await self._result.data()
+            span.set_attribute(RETURNED_ROWS, len(data))
+        return data
+
+    async def stream(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_buffered_batches: int = DEFAULT_MAX_BUFFERED_BATCHES
+    ) -> AsyncIterator[Any]:
+        count = 0
+        with self._span(FETCH) as span:
+            try:
+                async for row in self._result.stream(batch_size=batch_size, max_buffered_batches=max_buffered_batches):
+                    count += 1
+                    yield row
+            finally:
+                span.set_attribute(RETURNED_ROWS, count)
+
+
+class _TracedRecord (RecordProxy):
+    def __init__(self, result: _TracedResult, record: Record):
+        super().__init__(record)
+        self._result = result
+
+    async def _fetch(self) -> Any:
+        with self._result._span(FETCH) as span:
+            value = await super()._fetch()
+            span.set_attribute(RETURNED_ROWS, int(value is not None))
+        return value
+
+
+class _TracedGraph (GraphProxy):
+    def __init__(self, result: _TracedResult, graph: Graph):
+        super().__init__(graph)
+        self._result = result
+
+    async def _fetch(self) -> Any:
+        with self._result._span(FETCH):
+            return await super()._fetch()
@@ -0,0 +1,56 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Micro-benchmarks for aiocypher.
+
+These are not run as part of the test suite. Each module can be run directly from the top level of the
+repository, eg.
+
+    python3 -m benchmarks.aioneo4j_session_latency
+"""
+
+import time
+import statistics
+from typing import List, Callable, Awaitable
+
+
+def report(name: str, samples: List[float]) -> None:
+    """Prints a one line summary of a list of timings, which are in seconds."""
+    samples = sorted(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(f"{name:<40} n={len(samples):<7} mean={statistics.mean(samples) * 1e6:10.1f}us "
+          f"p50={statistics.median(samples) * 1e6:10.1f}us p99={p99 * 1e6:10.1f}us")
+
+
+def time_sync(f: Callable[[], object], iterations: int) -> List[float]:
+    """Calls f repeatedly and returns the time taken by each iteration."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        f()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def time_async(f: Callable[[], Awaitable[object]], iterations: int) -> List[float]:
+    """Awaits the result of calling f repeatedly and returns the time taken by each iteration."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await f()
+        samples.append(time.perf_counter() - start)
+    return samples
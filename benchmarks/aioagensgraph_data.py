@@ -0,0 +1,63 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Compares Result.data() with the previous way of getting dictionaries out of an aioagensgraph result, which
+was to build the graph and then rebuild a dictionary of properties for every node by hand.
+
+A stub connection is used, so this measures the client side decoding only. Its cursors stand in for aiopg
+cursors, which is what Result is typed to take.
+"""
+
+import asyncio
+from typing import cast
+
+import aiopg
+
+from aiocypher.aioagensgraph.result import Result
+
+from tests.aioagensgraph.stubs import StubConnection, vertex
+
+from . import report, time_async
+
+
+ROWS = 10000
+ITERATIONS = 20
+
+
+def cursor(connection: StubConnection) -> aiopg.Cursor:
+    return cast(aiopg.Cursor, connection.cursor())
+
+
+async def via_graph(connection: StubConnection) -> object:
+    graph = Result(cursor(connection), "MATCH (n) RETURN n").graph()
+    return [{'n': {key: value for (key, value) in node.items() if key not in ('type', 'label', 'vid')}}
+            for node in await graph.nodes]
+
+
+async def via_data(connection: StubConnection) -> object:
+    return await Result(cursor(connection), "MATCH (n) RETURN n").data()
+
+
+async def main() -> None:
+    rows = [(vertex('v', f"3.{n}", name=f"node{n}", n=n, a="a", b="b"),) for n in range(ROWS)]
+    connection = StubConnection(lambda query, parameters: (('n',), rows))
+
+    report(f"graph() then dicts, {ROWS} rows", await time_async(lambda: via_graph(connection), ITERATIONS))
+    report(f"data(), {ROWS} rows", await time_async(lambda: via_data(connection), ITERATIONS))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,71 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Compares the construction time and memory use of aioagensgraph Nodes with the previous implementation, which
+subclassed dict, copied the decoded vertex into itself and hashed str(data) when there was no vid.
+
+The vertices are created before timing starts, as they would already have been decoded by the agensgraph package,
+so only the Nodes are measured.
+"""
+
+import gc
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from aiocypher.aioagensgraph.node import Node
+
+from . import report, time_sync
+
+
+NODES = 1000000
+ITERATIONS = 5
+
+
+class DictNode (Dict[str, Any]):
+    def __init__(self, data: Dict[str, Any]):
+        if 'vid' in data:
+            self._hash = hash(data['vid'])
+        else:
+            self._hash = hash(str(data))
+        super().__init__({key: value for (key, value) in data.items()})
+
+    def __hash__(self):
+        return self._hash
+
+
+def allocated(f: Callable[[], object]) -> int:
+    """The number of bytes still allocated by f once it has returned, ie. the size of what it returns."""
+    gc.collect()
+    tracemalloc.start()
+    result = f()
+    (size, _) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    vertices: List[Dict[str, Any]] = [
+        {'type': 'vertex', 'label': 'v', 'vid': f"3.{n}", 'name': f"node{n}", 'n': n} for n in range(NODES)]
+
+    for (name, cls) in (("dict subclass", DictNode), ("__slots__ Node", Node)):
+        report(f"{name}, {NODES} nodes", time_sync(lambda: {cls(v) for v in vertices}, ITERATIONS))
+        print(f"{name:<40} {allocated(lambda: [cls(v) for v in vertices]) / NODES:.0f} bytes per node")
+
+
+if __name__ == "__main__":
+    main()
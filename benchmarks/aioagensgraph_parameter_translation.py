@@ -0,0 +1,53 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Compares the old per-parameter regular expression translation of cypher parameters for psycopg2 with
+the single pass, cached translation, for a query with 50 parameters.
+"""
+
+import re
+from typing import Dict, Any
+
+from aiocypher.internal.postgres import convert_cypher_parameters_to_postgres, _translate
+
+from . import report, time_sync
+
+
+PARAMETERS = 50
+ITERATIONS = 2000
+
+
+def per_parameter_regex(query: str, params: Dict[str, Any]) -> str:
+    q = str(query)
+    for key in params:
+        q = re.sub(r'(?<!\$)\$' + key + r'(?!\w)', r'%(' + key + ')s', q)
+    return q
+
+
+def main() -> None:
+    params = {f"p{n}": n for n in range(PARAMETERS)}
+    query = "CREATE (n:Node {" + ", ".join(f"{key}: ${key}" for key in params) + "}) SET n.note = 'costs $5'"
+
+    expected = per_parameter_regex(query.replace("'costs $5'", "''"), params)
+    assert convert_cypher_parameters_to_postgres(query.replace("'costs $5'", "''"), params) == expected
+
+    report("per parameter re.sub", time_sync(lambda: per_parameter_regex(query, params), ITERATIONS))
+    report("single pass, uncached", time_sync(lambda: _translate.__wrapped__(query, frozenset(params)), ITERATIONS))
+    report("single pass, cached", time_sync(lambda: convert_cypher_parameters_to_postgres(query, params), ITERATIONS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Compares writing entities one tx.run() at a time with writing them through tx.run_batch().
+
+A stub neo4j.Driver is used, so this measures the client side overhead only. Against a real server each
+tx.run() also costs a network round trip, which run_batch() pays once per chunk.
+"""
+
+import asyncio
+import time
+
+from aiocypher.aioneo4j.session import Session
+
+from tests.aioneo4j.stubs import StubDriver, completed_future
+
+
+ROWS = 20000
+
+
+async def main() -> None:
+    rows = [{'name': f"node{n}"} for n in range(ROWS)]
+
+    async with Session(completed_future(StubDriver())) as session:
+        async with session.begin_transaction() as tx:
+            start = time.perf_counter()
+            for row in rows:
+                await tx.run("CREATE (n:Node {name: $name})", **row)
+            single = time.perf_counter() - start
+
+        async with session.begin_transaction() as tx:
+            start = time.perf_counter()
+            await tx.run_batch("CREATE (n:Node {name: row.name})", rows)
+            batch = time.perf_counter() - start
+
+    print(f"tx.run() per row:  {ROWS / single:12.0f} rows/s")
+    print(f"tx.run_batch():    {ROWS / batch:12.0f} rows/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
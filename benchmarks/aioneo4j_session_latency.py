@@ -0,0 +1,52 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Measures the cost of handing commands to the IO thread of an aioneo4j.Session.
+
+A stub neo4j.Driver is used, so this measures only the asyncio/thread handoff and not any network or server
+time.
+"""
+
+import asyncio
+
+from aiocypher.aioneo4j.session import Session
+
+from tests.aioneo4j.stubs import StubDriver, completed_future
+from . import report, time_async
+
+
+ITERATIONS = 2000
+
+
+async def main() -> None:
+    driver = StubDriver(lambda query, params: [{'n': 1}])
+
+    async with Session(completed_future(driver)) as session:
+        report("session._execute round trip", await time_async(lambda: session._execute(lambda s: None), ITERATIONS))
+
+        async def __transaction():
+            async with session.begin_transaction() as tx:
+                await tx.run("RETURN 1 AS n").single()
+
+        report("begin + run().single() + commit", await time_async(__transaction, ITERATIONS))
+
+        async with session.begin_transaction() as tx:
+            report("tx.run().data()", await time_async(lambda: tx.run("RETURN 1 AS n").data(), ITERATIONS))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,74 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Measures the cost of tracing an aioneo4j session, transaction and query, and what is left of it when no tracer
+is registered.
+
+Without a tracer sessions are not wrapped at all, so the only remaining cost is copying the context of each command
+for its IO thread, which is timed separately. With a tracer which does nothing the cost is that of the wrappers
+themselves, and InMemoryTracer adds that of recording the spans.
+
+A stub neo4j.Driver is used, so this measures no network or server time.
+"""
+
+import asyncio
+import contextvars
+from contextlib import nullcontext
+from typing import Any, ContextManager, Mapping, Optional
+
+from aiocypher import Config, InMemoryTracer
+from aiocypher.aioneo4j.driver import Driver
+
+from tests.aioneo4j.stubs import StubDriver, completed_future
+from . import report, time_async, time_sync
+
+
+ITERATIONS = 2000
+
+
+class NullSpan (object):
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+class NullTracer (object):
+    def start_as_current_span(self, name: str, attributes: Optional[Mapping[str, Any]] = None) -> ContextManager[Any]:
+        return nullcontext(NullSpan())
+
+
+async def main() -> None:
+    report("copy_context()", time_sync(contextvars.copy_context, ITERATIONS))
+
+    for (name, tracer) in (("no tracer", None), ("NullTracer", NullTracer()),
+                           ("InMemoryTracer", InMemoryTracer())):
+        driver = Driver(Config('bolt://localhost:7687', 'neo4j', 'test'), session_pool_max_size=1)
+        driver._sync_driver = completed_future(StubDriver(lambda query, params: [{'n': 1}]))
+        if tracer is not None:
+            driver.enable_tracing(tracer)
+
+        async def __query():
+            async with driver.session() as session:
+                async with session.begin_transaction() as tx:
+                    await tx.run("RETURN 1 AS n").data()
+
+        async with driver:
+            await time_async(__query, ITERATIONS // 10)
+            report(f"{name}: run().data()", await time_async(__query, ITERATIONS))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
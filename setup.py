@@ -39,6 +39,8 @@ package_names = [
     'aiocypher',
     'aiocypher.aioagensgraph',
     'aiocypher.aioneo4j',
+    'aiocypher.asyncagensgraph',
+    'aiocypher.asyncneo4j',
     'aiocypher.interface',
     'aiocypher.internal'
 ]
@@ -48,8 +50,7 @@ packages = {
 
 packages_required = [
     "async_generator",
-    "neo4j < 4.3.0",
-    "janus",
+    "neo4j < 6.0.0",
 ]
 
 extras_require = {
@@ -58,6 +59,11 @@ extras_require = {
         "aiopg",
         "async_exit_stack"
     ],
+    "psycopg": [
+        "psycopg",
+        "psycopg-pool",
+        "async_exit_stack"
+    ],
     "neo4j": []
 }
 
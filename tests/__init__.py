@@ -15,7 +15,7 @@
 # limitations under the License.
 #
 
-__all__ = ["HAS_AGENSGRAPH", "HAS_NEO4J"]
+__all__ = ["HAS_AGENSGRAPH", "HAS_NEO4J", "HAS_ASYNC_NEO4J", "HAS_PSYCOPG"]
 
 
 try:
@@ -32,3 +32,20 @@ except ImportError:
     HAS_NEO4J = False
 else:
     HAS_NEO4J = True
+
+
+try:
+    from neo4j import AsyncGraphDatabase  # noqa: F401
+except ImportError:
+    HAS_ASYNC_NEO4J = False
+else:
+    HAS_ASYNC_NEO4J = True
+
+
+try:
+    import psycopg  # noqa: F401
+    import psycopg_pool  # noqa: F401
+except ImportError:
+    HAS_PSYCOPG = False
+else:
+    HAS_PSYCOPG = True
@@ -0,0 +1,137 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Minimal stand-ins for aiopg connections and cursors, used to exercise aioagensgraph without a database
+server. Queries are answered by a responder callable, which returns the column names and rows of the result.
+"""
+
+import re
+from typing import Any, AsyncIterator, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from async_generator import asynccontextmanager
+from psycopg2 import sql
+
+
+class StubColumn (NamedTuple):
+    name: str
+    type_code: int = 0
+
+
+Response = Tuple[Sequence[str], List[Tuple[Any, ...]]]
+
+
+def vertex(label: str, vid: str, **properties) -> Dict[str, Any]:
+    """A vertex as decoded by the agensgraph package"""
+    return dict({'type': 'vertex', 'label': label, 'vid': vid}, **properties)
+
+
+def edge(label: str, eid: str, source_vid: str, destination_vid: str, **properties) -> Dict[str, Any]:
+    """An edge as decoded by the agensgraph package"""
+    return dict({'type': 'edge', 'label': label, 'eid': eid, 'source_vid': source_vid,
+                 'destination_vid': destination_vid}, **properties)
+
+
+def query_string(query: Union[str, sql.Composable]) -> str:
+    """Renders a query composed with psycopg2.sql as it would be sent, without needing a connection to quote
+    identifiers with.
+    """
+    if isinstance(query, str):
+        return query
+    elif isinstance(query, sql.Composed):
+        return ''.join(query_string(part) for part in query.seq)
+    elif isinstance(query, sql.Identifier):
+        return '.'.join('"' + string.replace('"', '""') + '"' for string in query.strings)
+    elif isinstance(query, sql.SQL):
+        return query.string
+    raise TypeError(f"Cannot render {query!r}")
+
+
+class StubCursor (object):
+    def __init__(self, connection: 'StubConnection'):
+        self._connection = connection
+        self._rows: List[Tuple[Any, ...]] = []
+        self.description: Optional[List[StubColumn]] = None
+
+    @property
+    def connection(self) -> 'StubConnection':
+        return self._connection
+
+    async def __aenter__(self) -> 'StubCursor':
+        return self
+
+    async def __aexit__(self, *args) -> bool:
+        return False
+
+    async def execute(self, query: Union[str, sql.Composable], parameters: Optional[Dict[str, Any]] = None) -> None:
+        query = query_string(query)
+        self._connection.queries.append(query)
+        self._connection.parameters.append(parameters)
+
+        fetch = re.match(r'FETCH FORWARD (\d+) FROM (\w+)', query)
+        declare = re.match(r'DECLARE (\w+) NO SCROLL CURSOR FOR (.*)', query, re.DOTALL)
+        if fetch:
+            (columns, rows) = self._connection.cursors[fetch.group(2)]
+            n = int(fetch.group(1))
+            self._connection.cursors[fetch.group(2)] = (columns, rows[n:])
+            self._set_result(columns, rows[:n])
+        elif declare:
+            self._connection.cursors[declare.group(1)] = self._connection.responder(declare.group(2), parameters)
+            self._set_result(None, [])
+        else:
+            (columns, rows) = self._connection.responder(query, parameters)
+            self._set_result(columns, rows)
+
+    def _set_result(self, columns: Optional[Sequence[str]], rows: List[Tuple[Any, ...]]) -> None:
+        self.description = [StubColumn(name) for name in columns] if columns else None
+        self._rows = list(rows)
+
+    async def fetchone(self) -> Optional[Tuple[Any, ...]]:
+        return self._rows.pop(0) if self._rows else None
+
+    async def fetchall(self) -> List[Tuple[Any, ...]]:
+        (rows, self._rows) = (self._rows, [])
+        return rows
+
+    async def fetchmany(self, size: int) -> List[Tuple[Any, ...]]:
+        (rows, self._rows) = (self._rows[:size], self._rows[size:])
+        return rows
+
+
+class StubConnection (object):
+    """Stands in for an aiopg.Connection. The responder is called with the query and parameters of every
+    statement, and by default returns no columns and no rows.
+    """
+    def __init__(self, responder: Optional[Callable[[str, Optional[Dict[str, Any]]], Response]] = None):
+        self.responder = responder or (lambda query, parameters: ((), []))
+        self.queries: List[str] = []
+        self.parameters: List[Optional[Dict[str, Any]]] = []
+        self.cursors: Dict[str, Response] = {}
+
+    def cursor(self) -> StubCursor:
+        return StubCursor(self)
+
+
+class StubPool (object):
+    """Stands in for an aiopg.Pool which holds a single StubConnection."""
+    def __init__(self, connection: StubConnection):
+        self.connection = connection
+        self.maxsize = 1
+        self.size = 1
+        self.freesize = 1
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[StubConnection]:
+        yield self.connection
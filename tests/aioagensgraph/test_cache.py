@@ -0,0 +1,69 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+
+from .. import HAS_AGENSGRAPH
+
+if HAS_AGENSGRAPH:
+    from aiocypher import Config
+    from aiocypher.aioagensgraph.driver import Driver
+
+    from .stubs import StubConnection, StubPool, vertex
+
+    def make_driver():
+        driver = Driver(Config('postgresql://localhost:5432', 'user', 'password'))
+        connection = StubConnection(
+            lambda query, parameters: (('n',), [(vertex('v', '3.1', name='a'),)]) if 'RETURN' in query else ((), []))
+        driver._pool = StubPool(connection)
+        return (driver, connection)
+
+
+READ = "MATCH (n:v) RETURN n"
+
+
+@unittest.skipUnless(HAS_AGENSGRAPH, "Don't test aioagensgraph unless agensgraph is installed")
+class TestQueryCache(unittest.IsolatedAsyncioTestCase):
+    async def test_reads_are_cached_until_a_write(self):
+        (driver, connection) = make_driver()
+        cache = driver.enable_query_cache()
+        results = []
+        async with driver.session(database="graph") as session:
+            for _ in range(2):
+                async with session.begin_transaction() as tx:
+                    results.append(await tx.run(READ).data())
+            async with session.begin_transaction() as tx:
+                await tx.run("CREATE (:v {name: 'b'})")
+            async with session.begin_transaction() as tx:
+                results.append(await tx.run(READ).data())
+
+        self.assertEqual(results, [[{'n': {'name': 'a'}}]] * 3)
+        self.assertEqual(sum('RETURN' in query for query in connection.queries), 2)
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.invalidations), (1, 2, 1))
+
+    async def test_other_result_methods_are_not_cached(self):
+        (driver, connection) = make_driver()
+        driver.enable_query_cache()
+        async with driver.session(database="graph") as session:
+            async with session.begin_transaction() as tx:
+                nodes = await tx.run(READ).graph().nodes
+                node = await tx.run(READ).single().value()
+
+        self.assertEqual([n['name'] for n in nodes], ['a'])
+        self.assertEqual(node['name'], 'a')
+        self.assertEqual(sum('RETURN' in query for query in connection.queries), 2)
@@ -25,6 +25,7 @@ from .. import HAS_AGENSGRAPH
 
 if HAS_AGENSGRAPH:
     from aiocypher.aioagensgraph.driver import Driver
+    from aiocypher.aioagensgraph import BulkVertex, BulkEdge
     from aiocypher import Config
     import aiopg
 
@@ -35,12 +36,12 @@ if HAS_AGENSGRAPH:
 
     DB = "testdb"
 
-    def make_driver():
+    def make_driver(**kwargs):
         config = Config(
             address=f'postgresql://{HOST}:{PORT}',
             username=USER,
             password=PASSWORD)
-        return Driver(config)
+        return Driver(config, **kwargs)
 
     @retry_on_exception(exception=psycopg2.OperationalError)
     async def _check_db_connection():
@@ -120,3 +121,105 @@ if HAS_AGENSGRAPH:
                         node = await tx.run("MATCH (n) RETURN n").single().value()
             self.assertIn('name', node)
             self.assertEqual('AgensGraph', node['name'])
+
+        async def test_driver_session_transaction_run_result_async_for(self):
+            async with make_driver() as UUT:
+                async with UUT.session(database=DB) as session:
+                    async with session.begin_transaction() as tx:
+                        await tx.run("CREATE (:v {name: 'AgensGraph'})")
+                        await tx.run("CREATE (:v {name: 'Cypher'})")
+                        rows = [row async for row in tx.run("MATCH (n) RETURN n").stream(batch_size=1)]
+            self.assertCountEqual([row[0]['name'] for row in rows], ['AgensGraph', 'Cypher'])
+
+        async def test_driver_session_transaction_run_batch(self):
+            async with make_driver() as UUT:
+                async with UUT.session(database=DB) as session:
+                    async with session.begin_transaction() as tx:
+                        count = await tx.run_batch("CREATE (:v {name: row.name})",
+                                                   ({'name': f"node{n}"} for n in range(5)),
+                                                   chunk_size=2)
+                        rows = await tx.run("MATCH (n:v) RETURN n").graph()
+            self.assertEqual(count, 5)
+            self.assertCountEqual([row[0]['name'] for row in rows], [f"node{n}" for n in range(5)])
+
+        async def test_driver_graph_path_is_set_once_per_connection(self):
+            async with make_driver() as UUT:
+                async with UUT.session(database=DB) as session:
+                    conn = await session
+                    for name in ['AgensGraph', 'Cypher']:
+                        async with session.begin_transaction() as tx:
+                            await tx.run(f"CREATE (:v {{name: '{name}'}})")
+                    self.assertEqual(UUT._state._graph_paths[conn], DB)
+                    self.assertIn(DB, UUT._state._graphs)
+                async with UUT.session(database=DB) as session:
+                    async with session.begin_transaction() as tx:
+                        names = [row[0]['name'] for row in await tx.run("MATCH (n:v) RETURN n").graph()]
+            self.assertCountEqual(names, ['AgensGraph', 'Cypher'])
+
+        async def test_driver_session_read_only_transaction(self):
+            async with make_driver() as UUT:
+                async with UUT.session(database=DB) as session:
+                    async with session.begin_transaction(isolation="REPEATABLE READ") as tx:
+                        await tx.run("CREATE (:v {name: 'AgensGraph'})")
+                    async with session.begin_transaction(read_only=True, isolation="READ COMMITTED") as tx:
+                        node = await tx.run("MATCH (n) RETURN n").single().value()
+                    with self.assertRaises(Exception):
+                        async with session.begin_transaction(read_only=True) as tx:
+                            await tx.run("CREATE (:v {name: 'Cypher'})")
+                    with self.assertRaises(ValueError):
+                        session.begin_transaction(isolation="SNAPSHOT")
+            self.assertEqual('AgensGraph', node['name'])
+
+        async def test_driver_session_transaction_run_result_incremental_graph(self):
+            async with make_driver() as UUT:
+                async with UUT.session(database=DB) as session:
+                    async with session.begin_transaction() as tx:
+                        await tx.run_batch("CREATE (:v {name: row.name})", ({'name': f"node{n}"} for n in range(5)))
+                        graph = tx.run("MATCH (n:v) RETURN n").graph(incremental=True)
+                        rows = await graph
+                        nodes = await graph.nodes
+            self.assertIsNone(rows)
+            self.assertCountEqual([node['name'] for node in nodes], [f"node{n}" for n in range(5)])
+
+        async def test_driver_session_transaction_run_result_data(self):
+            async with make_driver() as UUT:
+                async with UUT.session(database=DB) as session:
+                    async with session.begin_transaction() as tx:
+                        await tx.run("CREATE (:v {name: 'AgensGraph'})")
+                        data = await tx.run("MATCH (n:v) RETURN n, n.name AS name").data()
+            self.assertEqual(data, [{'n': {'name': 'AgensGraph'}, 'name': 'AgensGraph'}])
+
+        async def test_driver_bulk_load(self):
+            async def vertices():
+                for n in range(25):
+                    yield BulkVertex('person', {'id': n, 'name': f"person{n}"})
+
+            edges = (BulkEdge('knows', ('person', n), ('person', n + 1), {'since': n}) for n in range(24))
+
+            async with make_driver() as UUT:
+                stats = await UUT.bulk_load(DB, vertices(), edges, key='id', batch_size=10)
+                async with UUT.session(database=DB) as session:
+                    async with session.begin_transaction() as tx:
+                        graph = tx.run("MATCH (a:person)-[e:knows]->(b:person) RETURN a, e, b").graph()
+                        relationships = await graph.relationships
+                async with UUT._pool.acquire() as connection:
+                    async with connection.cursor() as cursor:
+                        await cursor.execute("SELECT indexname FROM pg_indexes WHERE schemaname = %(graph)s",
+                                             {'graph': DB})
+                        indexes = [name for (name,) in await cursor.fetchall()]
+            self.assertEqual((stats.vertices, stats.edges), (25, 24))
+            self.assertIn("person_id_bulk_key", indexes)
+            self.assertCountEqual([(r.start_node['id'], r.end_node['id'], r['since']) for r in relationships],
+                                  [(n, n + 1, n) for n in range(24)])
+
+        async def test_driver_prepared_statements(self):
+            async with make_driver(statement_cache_size=8) as UUT:
+                async with UUT.session(database=DB) as session:
+                    async with session.begin_transaction() as tx:
+                        for name in ['AgensGraph', 'Cypher']:
+                            await tx.run("CREATE (:v {name: $name})", name=name)
+                        names = [row['n']['name'] for row in await tx.run("MATCH (n:v) RETURN n").data()]
+                stats = UUT.statement_stats()
+            self.assertCountEqual(names, ['AgensGraph', 'Cypher'])
+            self.assertEqual((stats["CREATE (:v {name: $name})"].hits, stats["CREATE (:v {name: $name})"].misses),
+                             (1, 1))
@@ -0,0 +1,64 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+
+from .. import HAS_AGENSGRAPH
+
+if HAS_AGENSGRAPH:
+    from aiocypher.aioagensgraph.node import Node
+
+    from .stubs import vertex
+
+
+@unittest.skipUnless(HAS_AGENSGRAPH, "Don't test aioagensgraph unless agensgraph is installed")
+class TestNode(unittest.TestCase):
+    def test_mapping(self):
+        data = vertex('v', '3.1', name='a', n=1)
+        node = Node(data)
+        self.assertEqual(node['name'], 'a')
+        self.assertEqual(node['vid'], '3.1')
+        self.assertIn('n', node)
+        self.assertEqual(dict(node), data)
+        self.assertEqual(node, data)
+        self.assertEqual(node.get('missing'), None)
+
+    def test_attributes(self):
+        node = Node(vertex('v', '3.1', name='a', n=1))
+        self.assertEqual(node.vid, '3.1')
+        self.assertEqual(node.label, 'v')
+        self.assertEqual(node.labels, {'v'})
+        self.assertEqual(node.properties, {'name': 'a', 'n': 1})
+        self.assertIs(node.properties, node.properties)
+        self.assertFalse(hasattr(node, '__dict__'))
+
+    def test_equality_and_hash_use_vid(self):
+        a = Node(vertex('v', '3.1', name='a'))
+        b = Node({'vid': '3.1'})
+        c = Node(vertex('v', '3.2', name='a'))
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertNotEqual(a, c)
+        self.assertEqual(len({a, b, c}), 2)
+
+    def test_nodes_without_vid_are_only_equal_to_themselves(self):
+        a = Node({'name': 'a'})
+        b = Node({'name': 'a'})
+        self.assertEqual(a, a)
+        self.assertNotEqual(a, b)
+        self.assertEqual(a.labels, set())
+        self.assertEqual(len({a, b}), 2)
@@ -0,0 +1,135 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+import asyncio
+
+from .. import HAS_AGENSGRAPH
+
+if HAS_AGENSGRAPH:
+    from aiocypher import Config, PoolAcquireTimeout, SessionLimitReached
+    from aiocypher.aioagensgraph.driver import Driver
+    from aiocypher.aioagensgraph.pool import PoolSettings
+    from aiocypher.aioagensgraph.state import DriverState
+    from aiocypher.metrics import POOL_ACQUIRE
+    from async_exit_stack import AsyncExitStack
+
+
+class StubPool (object):
+    """Stands in for an aiopg.Pool which has a single connection"""
+    def __init__(self):
+        self.maxsize = 1
+        self.size = 1
+        self._lock = asyncio.Lock()
+
+    @property
+    def freesize(self):
+        return 0 if self._lock.locked() else 1
+
+    def acquire(self):
+        pool = self
+
+        class __Acquire (object):
+            async def __aenter__(self):
+                await pool._lock.acquire()
+                return "connection"
+
+            async def __aexit__(self, *args):
+                pool._lock.release()
+                return False
+
+        return __Acquire()
+
+
+@unittest.skipUnless(HAS_AGENSGRAPH, "Don't test aioagensgraph unless agensgraph is installed")
+class TestPoolSettings(unittest.TestCase):
+    def test_defaults(self):
+        driver = Driver(Config('postgresql://localhost:5432', 'user', 'password'))
+
+        self.assertEqual(driver.pool_settings, PoolSettings())
+        self.assertEqual(driver.dsn, "host=localhost user=user password=password port=5432")
+
+    def test_settings_from_address(self):
+        driver = Driver(Config(
+            'postgresql://localhost:5432/mydb?maxsize=20&recycle=300&statement_timeout=5000&sslmode=require',
+            'user', 'password'))
+
+        self.assertEqual(driver.pool_settings,
+                         PoolSettings(maxsize=20, recycle=300.0, statement_timeout=5000, dbname="mydb"))
+        self.assertEqual(driver.dsn, ("host=localhost user=user password=password port=5432 dbname=mydb "
+                                      "sslmode=require options='-c statement_timeout=5000'"))
+
+    def test_statement_timeout_is_added_to_server_options_from_address(self):
+        driver = Driver(Config(
+            'postgresql://localhost:5432?options=-c%20search_path%3Dx&statement_timeout=5000', 'user', 'password'))
+
+        self.assertEqual(driver.dsn, ("host=localhost user=user password=password port=5432 "
+                                      "options='-c search_path=x -c statement_timeout=5000'"))
+
+    def test_keyword_arguments_take_precedence(self):
+        driver = Driver(Config('postgresql://localhost:5432/mydb?maxsize=20', 'user', 'password'),
+                        maxsize=5, minsize=2, acquire_timeout=1.5)
+
+        self.assertEqual(driver.pool_settings, PoolSettings(minsize=2, maxsize=5, acquire_timeout=1.5, dbname="mydb"))
+
+    def test_unknown_keyword_argument(self):
+        with self.assertRaises(TypeError):
+            Driver(Config('postgresql://localhost:5432', 'user', 'password'), maxsise=5)
+
+
+@unittest.skipUnless(HAS_AGENSGRAPH, "Don't test aioagensgraph unless agensgraph is installed")
+class TestAcquire(unittest.IsolatedAsyncioTestCase):
+    async def test_acquire_latency_and_waiters_are_recorded(self):
+        state = DriverState()
+        pool = StubPool()
+        async with AsyncExitStack() as first:
+            await state.acquire(pool, first)
+            self.assertEqual(state.waiters, 0)
+            async with AsyncExitStack() as second:
+                waiting = asyncio.ensure_future(state.acquire(pool, second))
+                await asyncio.sleep(0.01)
+                self.assertEqual(state.waiters, 1)
+                await first.aclose()
+                self.assertEqual(await waiting, "connection")
+
+        snapshot = state.acquire_latency.snapshot()
+        self.assertEqual(state.waiters, 0)
+        self.assertEqual(snapshot.total, 2)
+        self.assertGreaterEqual(snapshot.sum, 0.01)
+
+    async def test_acquire_timeout(self):
+        state = DriverState(acquire_timeout=0.01)
+        pool = StubPool()
+        async with AsyncExitStack() as first:
+            await state.acquire(pool, first)
+            with self.assertRaises(PoolAcquireTimeout) as raised:
+                async with AsyncExitStack() as second:
+                    await state.acquire(pool, second)
+
+        self.assertIsInstance(raised.exception, SessionLimitReached)
+        self.assertIn("1 pooled connections", str(raised.exception))
+        self.assertEqual(state.acquire_timeouts, 1)
+        self.assertEqual(state.acquire_latency.snapshot().total, 1)
+        self.assertEqual(state.waiters, 0)
+
+    async def test_acquire_latency_is_reported_to_metrics(self):
+        driver = Driver(Config('postgresql://localhost:5432', 'user', 'password'))
+        metrics = driver.enable_metrics()
+        async with AsyncExitStack() as exit_stack:
+            await driver._state.acquire(StubPool(), exit_stack)
+
+        self.assertEqual(metrics.histogram(POOL_ACQUIRE).total, 1)
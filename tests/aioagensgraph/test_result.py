@@ -0,0 +1,167 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import unittest
+
+from .. import HAS_AGENSGRAPH
+
+if HAS_AGENSGRAPH:
+    from aiocypher.aioagensgraph.graph import Graph
+    from aiocypher.aioagensgraph.record import Record
+    from aiocypher.aioagensgraph.result import Result, convert_cypher_parameters_to_postgres
+    from .stubs import StubConnection, vertex, edge
+
+
+@unittest.skipUnless(HAS_AGENSGRAPH, "Don't test aioagensgraph unless agensgraph is installed")
+class TestParameterTranslation(unittest.TestCase):
+    def test_parameters_are_translated(self):
+        self.assertEqual(
+            convert_cypher_parameters_to_postgres("CREATE (:v {name: $name, id: $id})", {'name': "a", 'id': 1}),
+            "CREATE (:v {name: %(name)s, id: %(id)s})")
+
+    def test_only_known_parameters_are_translated(self):
+        self.assertEqual(
+            convert_cypher_parameters_to_postgres("CREATE (:v {name: $name, other: $names})", {'name': "a"}),
+            "CREATE (:v {name: %(name)s, other: $names})")
+
+    def test_literals_and_double_dollars_are_left_alone(self):
+        self.assertEqual(
+            convert_cypher_parameters_to_postgres("CREATE (:v {name: '$name', other: $$name})", {'name': "a"}),
+            "CREATE (:v {name: '$name', other: $$name})")
+
+    def test_translation_depends_on_parameter_names(self):
+        query = "MATCH (n {a: $a, b: $b}) RETURN n"
+        self.assertEqual(convert_cypher_parameters_to_postgres(query, {'a': 1}), "MATCH (n {a: %(a)s, b: $b}) RETURN n")
+        self.assertEqual(convert_cypher_parameters_to_postgres(query, {'a': 1, 'b': 2}),
+                         "MATCH (n {a: %(a)s, b: %(b)s}) RETURN n")
+
+
+@unittest.skipUnless(HAS_AGENSGRAPH, "Don't test aioagensgraph unless agensgraph is installed")
+class TestResultData(unittest.IsolatedAsyncioTestCase):
+    async def test_rows_are_keyed_on_column_names(self):
+        connection = StubConnection(lambda query, parameters: (('name', 'n'), [("a", 1), ("b", 2)]))
+        data = await Result(connection.cursor(), "MATCH (n) RETURN n.name AS name, n.n AS n").data()
+
+        self.assertEqual(data, [{'name': "a", 'n': 1}, {'name': "b", 'n': 2}])
+
+    async def test_vertices_edges_and_paths_are_reduced_to_their_own_properties(self):
+        a = vertex('v', '3.1', name="a")
+        b = vertex('v', '3.2', name="b")
+        e = edge('e', '4.1', '3.1', '3.2', weight=2)
+        path = {'type': 'path', 'vertices': [a, b], 'edges': [e]}
+        connection = StubConnection(lambda query, parameters: (('a', 'e', 'p'), [(a, e, path)]))
+        data = await Result(connection.cursor(), "MATCH p=(a)-[e]->(b) RETURN a, e, p").data()
+
+        self.assertEqual(data, [{'a': {'name': "a"},
+                                 'e': {'weight': 2},
+                                 'p': [{'name': "a"}, {'weight': 2}, {'name': "b"}]}])
+
+    async def test_no_results(self):
+        connection = StubConnection()
+        self.assertEqual(await Result(connection.cursor(), "CREATE (:v)").data(), [])
+
+
+@unittest.skipUnless(HAS_AGENSGRAPH, "Don't test aioagensgraph unless agensgraph is installed")
+class TestResultStream(unittest.IsolatedAsyncioTestCase):
+    async def test_rows_are_fetched_from_a_server_side_cursor(self):
+        rows = [(vertex('v', f"3.{n}", n=n),) for n in range(5)]
+        connection = StubConnection(lambda query, parameters: (('n',), rows))
+        streamed = [row async for row in Result(connection.cursor(), "MATCH (n) RETURN n").stream(batch_size=2)]
+
+        self.assertEqual(streamed, rows)
+        self.assertRegex(connection.queries[0], r"^DECLARE \w+ NO SCROLL CURSOR FOR MATCH \(n\) RETURN n$")
+        self.assertEqual(len([q for q in connection.queries if q.startswith("FETCH FORWARD 2 ")]), 4)
+        self.assertTrue(connection.queries[-1].startswith("CLOSE "))
+
+    async def test_incremental_graph(self):
+        rows = [(vertex('v', f"3.{n}", n=n),) for n in range(5)]
+        connection = StubConnection(lambda query, parameters: (('n',), rows))
+        graph = Result(connection.cursor(), "MATCH (n) RETURN n").graph(incremental=True)
+
+        self.assertIsNone(await graph)
+        self.assertCountEqual([node['n'] for node in await graph.nodes], range(5))
+
+
+@unittest.skipUnless(HAS_AGENSGRAPH, "Don't test aioagensgraph unless agensgraph is installed")
+class TestResultGraph(unittest.IsolatedAsyncioTestCase):
+    async def test_nodes_and_relationships(self):
+        a = vertex('v', '3.1', name="a")
+        b = vertex('v', '3.2', name="b")
+        c = vertex('v', '3.3', name="c")
+        ab = edge('e', '4.1', '3.1', '3.2', weight=1)
+        bc = edge('e', '4.2', '3.2', '3.3', weight=2)
+        path = {'type': 'path', 'vertices': [a, b, c], 'edges': [ab, bc]}
+        connection = StubConnection(lambda query, parameters: (('p', 'e'), [(path, [ab]), (path, [bc])]))
+        graph = Result(connection.cursor(), "MATCH p=(a)-[e*]->(b) RETURN p, e").graph()
+
+        nodes = await graph.nodes
+        relationships = await graph.relationships
+
+        self.assertCountEqual([node['name'] for node in nodes], ["a", "b", "c"])
+        self.assertCountEqual([(r.type, r.start_node['name'], r.end_node['name'], r['weight']) for r in relationships],
+                              [('e', "a", "b", 1), ('e', "b", "c", 2)])
+        by_vid = {node['vid']: node for node in nodes}
+        for r in relationships:
+            self.assertIs(r.start_node, by_vid[r['source_vid']])
+
+    async def test_endpoints_which_were_not_returned(self):
+        ab = edge('e', '4.1', '3.1', '3.2')
+        connection = StubConnection(lambda query, parameters: (('e',), [(ab,)]))
+        graph = Result(connection.cursor(), "MATCH ()-[e]->() RETURN e").graph()
+
+        self.assertEqual(await graph.nodes, set())
+        (relationship,) = await graph.relationships
+        self.assertEqual(relationship.start_node['vid'], '3.1')
+        self.assertEqual(relationship.end_node['vid'], '3.2')
+
+    async def test_concurrent_awaits_see_the_whole_graph(self):
+        rows = [(vertex('v', f"3.{n}", n=n), edge('e', f"4.{n}", f"3.{n}", "3.0")) for n in range(5)]
+
+        async def _slow_rows():
+            for row in rows:
+                await asyncio.sleep(0)
+                yield row
+
+        async def _slow_fetch():
+            await asyncio.sleep(0)
+            return rows
+
+        for graph in (Graph(rows=_slow_rows()), Graph(_slow_fetch())):
+            (nodes, relationships, again) = await asyncio.gather(graph.nodes, graph.relationships, graph.nodes)
+
+            self.assertEqual(len(nodes), 5)
+            self.assertEqual(again, nodes)
+            self.assertEqual(len(relationships), 5)
+
+
+@unittest.skipUnless(HAS_AGENSGRAPH, "Don't test aioagensgraph unless agensgraph is installed")
+class TestRecord(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_awaits_share_one_fetch(self):
+        fetches = []
+
+        async def _fetch():
+            fetches.append(None)
+            await asyncio.sleep(0)
+            return vertex('v', '3.1', name="a")
+
+        record = Record(_fetch())
+        (data, value) = await asyncio.gather(record.data(), record.value())
+
+        self.assertEqual(data['v']['name'], "a")
+        self.assertEqual(value['name'], "a")
+        self.assertEqual(len(fetches), 1)
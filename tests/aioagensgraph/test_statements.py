@@ -0,0 +1,134 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+
+from .. import HAS_AGENSGRAPH
+
+if HAS_AGENSGRAPH:
+    from aiocypher import QueryFailed
+    from aiocypher.aioagensgraph.state import DriverState
+    from aiocypher.aioagensgraph.transaction import Transaction
+    from aiocypher.aioagensgraph.statements import StatementStats, STATEMENT_STATS_SIZE
+    from .stubs import StubConnection
+
+
+@unittest.skipUnless(HAS_AGENSGRAPH, "Don't test aioagensgraph unless agensgraph is installed")
+class TestStatementCache(unittest.IsolatedAsyncioTestCase):
+    async def test_statements_are_prepared_once_per_connection(self):
+        state = DriverState(statement_cache_size=4)
+        connection = StubConnection()
+        for name in ["a", "b"]:
+            async with Transaction(connection, "testdb", state) as tx:
+                await tx.run("CREATE (:v {name: $name, other: $name, n: $n})", name=name, n=1)
+
+        prepares = [q for q in connection.queries if q.startswith("PREPARE")]
+        executes = [(q, p) for (q, p) in zip(connection.queries, connection.parameters) if q.startswith("EXECUTE")]
+        self.assertEqual(len(prepares), 1)
+        self.assertRegex(prepares[0], r"^PREPARE (\w+) AS CREATE \(:v \{name: \$1, other: \$1, n: \$2\}\)$")
+        self.assertEqual([q.split(" ", 2)[2] for (q, _) in executes], ["(%(name)s, %(n)s)"] * 2)
+        self.assertEqual([p['name'] for (_, p) in executes], ["a", "b"])
+        self.assertEqual(state.statement_stats(),
+                         {"CREATE (:v {name: $name, other: $name, n: $n})": StatementStats(hits=1, misses=1)})
+
+        other = StubConnection()
+        async with Transaction(other, "testdb", state) as tx:
+            await tx.run("CREATE (:v {name: $name, other: $name, n: $n})", name="c", n=1)
+        self.assertEqual(len([q for q in other.queries if q.startswith("PREPARE")]), 1)
+
+    async def test_least_recently_used_statement_is_deallocated(self):
+        state = DriverState(statement_cache_size=2)
+        connection = StubConnection()
+        async with Transaction(connection, "testdb", state) as tx:
+            for query in ["RETURN 1", "RETURN 2", "RETURN 1", "RETURN 3"]:
+                await tx.run(query)
+
+        prepared = [q.split(" ")[1] for q in connection.queries if q.startswith("PREPARE")]
+        deallocated = [q.split(" ")[1] for q in connection.queries if q.startswith("DEALLOCATE")]
+        self.assertEqual(len(prepared), 3)
+        self.assertEqual(deallocated, [prepared[1]])
+        self.assertEqual(len(state.statements(connection)), 2)
+
+    async def test_statements_are_prepared_per_graph(self):
+        state = DriverState(statement_cache_size=4)
+        connection = StubConnection()
+        for graph in ["a", "b", "a"]:
+            async with Transaction(connection, graph, state) as tx:
+                await tx.run("MATCH (n:v) RETURN n")
+
+        prepared = [q.split(" ")[1] for q in connection.queries if q.startswith("PREPARE")]
+        executed = [q.split(" ")[1] for q in connection.queries if q.startswith("EXECUTE")]
+        self.assertEqual(len(prepared), 2)
+        self.assertEqual(executed, [prepared[0], prepared[1], prepared[0]])
+        paths = [q for q in connection.queries if q.startswith("SET graph_path") or q.startswith("EXECUTE")]
+        self.assertEqual([q.split(" ")[0] for q in paths], ["SET", "EXECUTE"] * 3)
+
+    async def test_statement_which_failed_to_deallocate_is_still_tracked(self):
+        def __respond(query, parameters):
+            if query.startswith("DEALLOCATE") and not failed:
+                failed.append(query)
+                raise RuntimeError("current transaction is aborted")
+            return ((), [])
+
+        failed = []
+        state = DriverState(statement_cache_size=1)
+        connection = StubConnection(__respond)
+        async with Transaction(connection, "testdb", state) as tx:
+            await tx.run("RETURN 1")
+            with self.assertRaises(QueryFailed):
+                await tx.run("RETURN 2")
+            await tx.run("RETURN 2")
+
+        prepared = [q.split(" ")[1] for q in connection.queries if q.startswith("PREPARE")]
+        deallocated = [q.split(" ")[1] for q in connection.queries if q.startswith("DEALLOCATE")]
+        self.assertEqual(deallocated, [prepared[0], prepared[0]])
+        self.assertEqual(len(state.statements(connection)), 1)
+
+    async def test_stats_are_kept_for_a_bounded_number_of_queries(self):
+        state = DriverState(statement_cache_size=2)
+        connection = StubConnection()
+        async with Transaction(connection, "testdb", state) as tx:
+            for n in range(STATEMENT_STATS_SIZE + 10):
+                await tx.run(f"RETURN {n}")
+            await tx.run("RETURN 20")
+
+        stats = state.statement_stats()
+        self.assertEqual(len(stats), STATEMENT_STATS_SIZE)
+        self.assertNotIn("RETURN 0", stats)
+        self.assertEqual(list(stats)[-1], "RETURN 20")
+
+    async def test_disabled_by_default(self):
+        state = DriverState()
+        connection = StubConnection()
+        async with Transaction(connection, "testdb", state) as tx:
+            await tx.run("CREATE (:v {name: $name})", name="a")
+
+        self.assertIn("CREATE (:v {name: %(name)s})", connection.queries)
+        self.assertIsNone(state.statements(connection))
+
+
+@unittest.skipUnless(HAS_AGENSGRAPH, "Don't test aioagensgraph unless agensgraph is installed")
+class TestUseGraph(unittest.IsolatedAsyncioTestCase):
+    async def test_graph_name_is_quoted_to_keep_its_case(self):
+        state = DriverState()
+        connection = StubConnection()
+        for _ in range(2):
+            async with Transaction(connection, "MyGraph", state) as tx:
+                await tx.run("RETURN 1")
+
+        self.assertEqual([q for q in connection.queries if "GRAPH" in q.upper()],
+                         ['CREATE GRAPH IF NOT EXISTS "MyGraph"', 'SET graph_path = "MyGraph"'])
@@ -0,0 +1,167 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Minimal stand-ins for the synchronous neo4j driver objects, used to exercise the asyncio machinery of
+aioneo4j without a database server.
+"""
+
+import asyncio
+from typing import List, Dict, Any, Optional, Callable, Iterable
+
+import neo4j
+
+
+class StubSummary (object):
+    def __init__(self, query: str):
+        self.query = query
+
+
+class StubResult (object):
+    """Behaves like a neo4j.Result which has already been run. The graph contains any neo4j.graph.Node or
+    neo4j.graph.Relationship values which appear in the records.
+    """
+    def __init__(self, query: str, records: List[Dict[str, Any]]):
+        self._query = query
+        self._records = [neo4j.Record(record) for record in records]
+        self.pulled = 0
+        self._buffered = 0
+        self._graph = neo4j.graph.Graph()
+        for record in self._records:
+            for value in record.values():
+                if isinstance(value, neo4j.graph.Node):
+                    self._graph._nodes[value.element_id] = value
+                elif isinstance(value, neo4j.graph.Relationship):
+                    self._graph._relationships[value.element_id] = value
+
+    def __iter__(self):
+        while self._records:
+            if self._buffered:
+                self._buffered -= 1
+            else:
+                self.pulled += 1
+            yield self._records.pop(0)
+
+    def single(self) -> Optional[neo4j.Record]:
+        records = list(self)
+        return records[0] if records else None
+
+    def data(self) -> List[Dict[str, Any]]:
+        return [record.data() for record in self]
+
+    def graph(self) -> neo4j.graph.Graph:
+        # Like neo4j.Result.graph() this pulls every remaining record into a buffer, which is then iterated
+        self.pulled += len(self._records) - self._buffered
+        self._buffered = len(self._records)
+        return self._graph
+
+    def consume(self) -> StubSummary:
+        self._records = []
+        return StubSummary(self._query)
+
+
+def make_node(graph: neo4j.graph.Graph, id_: int, labels: Iterable[str], **properties) -> neo4j.graph.Node:
+    """Creates a neo4j.graph.Node as though it had been hydrated from a query result."""
+    return neo4j.graph.Node(graph, str(id_), id_, labels, properties)
+
+
+def make_relationship(
+    graph: neo4j.graph.Graph,
+    id_: int,
+    start_node: neo4j.graph.Node,
+    type_: str,
+    end_node: neo4j.graph.Node,
+    **properties
+) -> neo4j.graph.Relationship:
+    """Creates a neo4j.graph.Relationship as though it had been hydrated from a query result."""
+    relationship = graph.relationship_type(type_)(graph, str(id_), id_, properties)
+    relationship._start_node = start_node
+    relationship._end_node = end_node
+    return relationship
+
+
+class StubTransaction (object):
+    def __init__(self, session: 'StubSession'):
+        self._session = session
+        self.closed = False
+
+    def __enter__(self) -> 'StubTransaction':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.closed = True
+
+    def run(self, query: str, parameters: Optional[Dict[str, Any]] = None, **kwargs) -> StubResult:
+        params = dict(parameters or {}, **kwargs)
+        self._session.queries.append(query)
+        self._session.parameters.append(params)
+        result = StubResult(query, self._session.responder(query, params))
+        self._session.results.append(result)
+        return result
+
+
+class StubSession (object):
+    def __init__(self, responder: Callable[[str, Dict[str, Any]], List[Dict[str, Any]]], **kwargs):
+        self.responder = responder
+        self.kwargs = kwargs
+        self.queries: List[str] = []
+        self.parameters: List[Dict[str, Any]] = []
+        self.results: List[StubResult] = []
+        self.transactions: List[StubTransaction] = []
+        self.closed = False
+
+    def __enter__(self) -> 'StubSession':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.closed = True
+
+    def begin_transaction(self) -> StubTransaction:
+        tx = StubTransaction(self)
+        self.transactions.append(tx)
+        return tx
+
+    def last_bookmarks(self) -> List[str]:
+        return [f"bookmark:{len(self.transactions)}"]
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class StubDriver (object):
+    """Stands in for a neo4j.Driver. Every query run through it returns the records produced by the
+    responder callable, which by default is no records at all.
+    """
+    def __init__(self, responder: Optional[Callable[[str, Dict[str, Any]], List[Dict[str, Any]]]] = None):
+        self.responder = responder or (lambda query, params: [])
+        self.sessions: List[StubSession] = []
+
+    def session(self, **kwargs) -> StubSession:
+        session = StubSession(self.responder, **kwargs)
+        self.sessions.append(session)
+        return session
+
+    def close(self) -> None:
+        pass
+
+
+def completed_future(value: Any) -> 'asyncio.Future[Any]':
+    """Wraps a value in an already completed future, which is how aioneo4j.Session expects to receive its
+    driver.
+    """
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(value)
+    return future
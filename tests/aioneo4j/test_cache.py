@@ -0,0 +1,93 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+
+from .. import HAS_NEO4J
+
+if HAS_NEO4J:
+    from aiocypher import Config
+    from aiocypher.aioneo4j.driver import Driver
+    from .stubs import StubDriver, completed_future
+
+    def make_driver():
+        driver = Driver(Config('bolt://localhost:7687', 'neo4j', 'test'))
+        stub = StubDriver(lambda query, params: [{'name': params.get('name', 'x')}])
+        driver._sync_driver = completed_future(stub)
+        return (driver, stub)
+
+
+READ = "MATCH (n:TestNode {name: $name}) RETURN n.name AS name"
+
+
+@unittest.skipUnless(HAS_NEO4J, "Don't test aioneo4j unless neo4j is installed")
+class TestQueryCache(unittest.IsolatedAsyncioTestCase):
+    async def read(self, driver, name, **kwargs):
+        async with driver.session(**kwargs) as session:
+            async with session.begin_transaction() as tx:
+                return await tx.run(READ, name=name).data()
+
+    async def test_repeated_reads_are_served_from_the_cache(self):
+        (driver, stub) = make_driver()
+        cache = driver.enable_query_cache()
+        async with driver:
+            results = [await self.read(driver, "a") for _ in range(3)]
+            await self.read(driver, "b")
+            await self.read(driver, "a", database="other")
+
+        self.assertEqual(results, [[{'name': 'a'}]] * 3)
+        self.assertEqual([q for s in stub.sessions for q in s.queries], [READ] * 3)
+        self.assertEqual((cache.stats().hits, cache.stats().misses), (2, 3))
+
+    async def test_writes_invalidate_reads_with_the_same_labels(self):
+        (driver, stub) = make_driver()
+        cache = driver.enable_query_cache()
+        async with driver:
+            await self.read(driver, "a")
+            async with driver.session() as session:
+                async with session.begin_transaction() as tx:
+                    await tx.run("CREATE (n:OtherNode)")
+            await self.read(driver, "a")
+            async with driver.session() as session:
+                async with session.begin_transaction() as tx:
+                    await tx.run_batch("CREATE (n:TestNode {name: row.name})", [{'name': "a"}])
+            await self.read(driver, "a")
+
+        self.assertEqual(sum(q == READ for s in stub.sessions for q in s.queries), 2)
+        self.assertEqual(cache.stats().invalidations, 1)
+
+    async def test_reads_after_a_write_in_the_same_transaction_are_not_cached(self):
+        (driver, stub) = make_driver()
+        cache = driver.enable_query_cache()
+        async with driver:
+            async with driver.session() as session:
+                async with session.begin_transaction() as tx:
+                    await tx.run("CREATE (n:TestNode {name: 'a'})")
+                    await tx.run(READ, name="a").data()
+
+        self.assertEqual((cache.stats().hits, cache.stats().misses, cache.stats().entries), (0, 0, 0))
+
+    async def test_read_only_transactions_read_through_the_cache(self):
+        (driver, stub) = make_driver()
+        cache = driver.enable_query_cache()
+        async with driver:
+            for _ in range(2):
+                async with driver.session() as session:
+                    async with session.begin_transaction(read_only=True) as tx:
+                        await tx.run(READ, name="a").data()
+
+        self.assertEqual(cache.stats().hits, 1)
@@ -0,0 +1,95 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+import asyncio
+
+from .. import HAS_NEO4J
+
+if HAS_NEO4J:
+    from aiocypher import Config
+    from aiocypher.aioneo4j.driver import Driver
+    from .stubs import StubDriver, completed_future
+
+    def make_driver(responder=None):
+        driver = Driver(Config('bolt://localhost:7687', 'neo4j', 'test'))
+        stub = StubDriver(responder)
+        driver._sync_driver = completed_future(stub)
+        return (driver, stub)
+
+
+QUERY = "MERGE (n:TestNode {name: $name}) SET n.label = '$name'"
+
+
+@unittest.skipUnless(HAS_NEO4J, "Don't test aioneo4j unless neo4j is installed")
+class TestWriteCoalescer(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_writes_are_batched(self):
+        (driver, stub) = make_driver()
+        async with driver:
+            async with driver.coalescer(window=0.01) as coalescer:
+                await asyncio.gather(*(coalescer.run(QUERY, name=f"node{n}") for n in range(5)))
+
+        queries = [q for s in stub.sessions for q in s.queries]
+        self.assertEqual(queries, ["UNWIND $rows AS row\nMERGE (n:TestNode {name: row.name}) SET n.label = '$name'"])
+        self.assertEqual(stub.sessions[0].parameters[0]['rows'], [{'name': f"node{n}"} for n in range(5)])
+
+    async def test_different_parameters_are_not_batched_together(self):
+        (driver, stub) = make_driver()
+        async with driver:
+            async with driver.coalescer(window=0.01) as coalescer:
+                await asyncio.gather(coalescer.run(QUERY, name="a"),
+                                     coalescer.run(QUERY, name="b", extra=1),
+                                     coalescer.run(QUERY, name="c"))
+
+        queries = sorted(q for s in stub.sessions for q in s.queries)
+        self.assertEqual(queries, [QUERY, "UNWIND $rows AS row\n" + QUERY.replace("$name}", "row.name}")])
+
+    async def test_max_items_starts_a_batch(self):
+        (driver, stub) = make_driver()
+        async with driver:
+            coalescer = driver.coalescer(window=10, max_items=3)
+            await asyncio.wait_for(asyncio.gather(*(coalescer.run(QUERY, name=n) for n in "abc")), timeout=1)
+
+        self.assertEqual([len(s.parameters[0]['rows']) for s in stub.sessions], [3])
+
+    async def test_failures_are_routed_to_their_callers(self):
+        def __fail(query, params):
+            if 'rows' in params or params['name'] == "bad":
+                raise ValueError(query)
+            return []
+
+        (driver, stub) = make_driver(__fail)
+        async with driver:
+            async with driver.coalescer(window=0.01) as coalescer:
+                results = await asyncio.gather(*(coalescer.run(QUERY, name=n) for n in ["a", "bad", "c"]),
+                                               return_exceptions=True)
+
+        self.assertIsNone(results[0])
+        self.assertIsInstance(results[1], ValueError)
+        self.assertIsNone(results[2])
+        self.assertEqual(len([q for s in stub.sessions for q in s.queries]), 4)
+
+    async def test_pattern_property_maps_are_not_batched(self):
+        (driver, stub) = make_driver()
+        query = "CREATE (n:TestNode $props)"
+        async with driver:
+            async with driver.coalescer(window=10) as coalescer:
+                await asyncio.wait_for(
+                    asyncio.gather(*(coalescer.run(query, props={'name': n}) for n in "ab")), timeout=1)
+
+        self.assertEqual([q for s in stub.sessions for q in s.queries], [query, query])
+        self.assertEqual([p['props'] for s in stub.sessions for p in s.parameters], [{'name': "a"}, {'name': "b"}])
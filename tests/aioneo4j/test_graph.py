@@ -0,0 +1,110 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import unittest
+
+from .. import HAS_NEO4J
+
+if HAS_NEO4J:
+    import neo4j
+    from aiocypher.aioneo4j.session import Session
+    from .stubs import StubDriver, completed_future, make_node, make_relationship
+
+    def _translation(query, params):
+        graph = neo4j.graph.Graph()
+        a = make_node(graph, 1, ['TestNode'], name='example')
+        b = make_node(graph, 2, ['TestNode'], name='模範')
+        r = make_relationship(graph, 3, a, 'Translation', b, lang='ja')
+        return [{'a': a, 'r': r, 'b': b}, {'a': b, 'r': r, 'b': a}]
+
+
+@unittest.skipUnless(HAS_NEO4J, "Don't test aioneo4j unless neo4j is installed")
+class TestGraph(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.driver = StubDriver(_translation)
+        self.session = await Session(completed_future(self.driver)).__aenter__()
+
+    async def asyncTearDown(self):
+        await self.session.__aexit__(None, None, None)
+
+    @property
+    def queries(self):
+        return self.driver.sessions[0].queries
+
+    async def assertTranslationGraph(self, graph):
+        nodes = await graph.nodes
+        relationships = await graph.relationships
+
+        self.assertCountEqual([n['name'] for n in nodes], ['example', '模範'])
+        self.assertEqual(len(relationships), 1)
+        relationship = next(iter(relationships))
+        self.assertEqual(relationship.type, 'Translation')
+        self.assertEqual(relationship.start_node['name'], 'example')
+        self.assertEqual(relationship.end_node['name'], '模範')
+
+    async def test_nodes_and_relationships_from_one_run(self):
+        async with self.session.begin_transaction() as tx:
+            graph = tx.run("MATCH (a)-[r]-(b) RETURN a,r,b").graph()
+            await self.assertTranslationGraph(graph)
+            await self.assertTranslationGraph(graph)
+
+        self.assertEqual(len(self.queries), 1)
+
+    async def test_concurrent_awaits_share_one_run(self):
+        async with self.session.begin_transaction() as tx:
+            graph = tx.run("MATCH (a)-[r]-(b) RETURN a,r,b").graph()
+            (nodes, relationships) = await asyncio.gather(graph.nodes, graph.relationships)
+
+        self.assertEqual(len(nodes), 2)
+        self.assertEqual(len(relationships), 1)
+        self.assertEqual(len(self.queries), 1)
+
+    async def test_failure_is_raised_to_every_await(self):
+        def _fail(query, params):
+            raise RuntimeError("Query failed")
+
+        self.driver.responder = _fail
+        session = await Session(completed_future(self.driver)).__aenter__()
+        try:
+            async with session.begin_transaction() as tx:
+                graph = tx.run("MATCH (a)-[r]-(b) RETURN a,r,b").graph()
+                for _ in range(2):
+                    with self.assertRaises(RuntimeError):
+                        await graph.nodes
+        finally:
+            await session.__aexit__(None, None, None)
+
+    async def test_incremental_graph(self):
+        async with self.session.begin_transaction() as tx:
+            result = tx.run("MATCH (a)-[r]-(b) RETURN a,r,b")
+            await self.assertTranslationGraph(result.graph(incremental=True))
+            summary = await result.consume()
+            with self.assertRaises(RuntimeError):
+                await result.data()
+
+        self.assertEqual(summary.query, "MATCH (a)-[r]-(b) RETURN a,r,b")
+        self.assertEqual(len(self.queries), 1)
+
+    async def test_incremental_graph_of_materialised_result_keeps_records(self):
+        async with self.session.begin_transaction() as tx:
+            result = tx.run("MATCH (a)-[r]-(b) RETURN a,r,b")
+            data = await result.data()
+            await self.assertTranslationGraph(result.graph(incremental=True))
+
+        self.assertEqual(len(data), 2)
+        self.assertEqual(len(self.queries), 1)
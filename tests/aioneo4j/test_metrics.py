@@ -0,0 +1,114 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import unittest
+
+from .. import HAS_NEO4J
+
+if HAS_NEO4J:
+    from aiocypher import Config, InMemoryMetrics
+    from aiocypher.aioneo4j.driver import Driver
+    from aiocypher.aioneo4j.session import Session
+    from aiocypher.metrics import (
+        SESSION_ACQUIRE, QUEUE_WAIT, EXECUTION, FETCH, COMMIT, ROWS, ERRORS, OPEN_SESSIONS, IO_THREADS
+    )
+    from .stubs import StubDriver, completed_future
+
+    def respond(query, params):
+        if "fail" in query:
+            raise RuntimeError("Query failed")
+        return [{'name': name} for name in params.get('names', [])]
+
+    def make_driver(**kwargs):
+        driver = Driver(Config('bolt://localhost:7687', 'neo4j', 'test'), **kwargs)
+        stub = StubDriver(respond)
+        driver._sync_driver = completed_future(stub)
+        return (driver, stub)
+
+
+READ = "MATCH (n:TestNode) WHERE n.name IN $names AND n.x = 'literal' RETURN n.name AS name"
+FINGERPRINT = "MATCH (n:TestNode) WHERE n.name IN $names AND n.x = ? RETURN n.name AS name"
+
+
+@unittest.skipUnless(HAS_NEO4J, "Don't test aioneo4j unless neo4j is installed")
+class TestMetrics(unittest.IsolatedAsyncioTestCase):
+    async def test_queries_are_measured_by_fingerprint(self):
+        (driver, stub) = make_driver()
+        metrics = driver.enable_metrics()
+        self.assertIs(driver.metrics, metrics)
+        async with driver:
+            async with driver.session() as session:
+                self.assertEqual(metrics.gauge(OPEN_SESSIONS), 1)
+                self.assertEqual(metrics.gauge(IO_THREADS), 1)
+                async with session.begin_transaction() as tx:
+                    self.assertEqual(await tx.run(READ, names=["a", "b"]).data(), [{'name': "a"}, {'name': "b"}])
+                    self.assertEqual(await tx.run(READ, names=["c"]).single().data(), {'name': "c"})
+                    self.assertEqual([row async for row in tx.run(READ, names=["d", "e", "f"]).stream()],
+                                     [{'name': name} for name in "def"])
+                    await tx.run("CREATE (n:TestNode)")
+                    self.assertEqual(await tx.run_batch("CREATE (n:TestNode {name: row.name})", [{'name': "a"}]), 1)
+            self.assertEqual(metrics.gauge(OPEN_SESSIONS), 0)
+
+        self.assertEqual(metrics.histogram(FETCH, FINGERPRINT).total, 3)
+        self.assertEqual(metrics.counter(ROWS, FINGERPRINT), 6)
+        self.assertEqual(metrics.histogram(EXECUTION, "CREATE (n:TestNode)").total, 1)
+        self.assertEqual(metrics.histogram(EXECUTION, "CREATE (n:TestNode {name: row.name})").total, 1)
+        self.assertEqual(metrics.histogram(SESSION_ACQUIRE).total, 1)
+        self.assertEqual(metrics.histogram(COMMIT).total, 1)
+        self.assertGreater(metrics.histogram(QUEUE_WAIT).total, 5)
+        self.assertEqual(metrics.gauge(IO_THREADS), 0)
+        self.assertIn('aiocypher_fetch_seconds_count{query="' + FINGERPRINT + '"} 3\n', metrics.render())
+
+    async def test_concurrent_record_access_is_fetched_once(self):
+        (driver, stub) = make_driver()
+        metrics = driver.enable_metrics()
+        async with driver:
+            async with driver.session() as session:
+                async with session.begin_transaction() as tx:
+                    record = tx.run(READ, names=["a"]).single()
+                    (data, value) = await asyncio.gather(record.data(), record.value())
+
+        self.assertEqual((data, value), ({'name': "a"}, "a"))
+        self.assertEqual(metrics.histogram(FETCH, FINGERPRINT).total, 1)
+        self.assertEqual(metrics.counter(ROWS, FINGERPRINT), 1)
+
+    async def test_errors_are_counted(self):
+        (driver, stub) = make_driver()
+        metrics = driver.enable_metrics(InMemoryMetrics())
+        async with driver:
+            with self.assertRaises(RuntimeError):
+                async with driver.session() as session:
+                    async with session.begin_transaction() as tx:
+                        await tx.run("MATCH (n) WHERE fail RETURN n").data()
+
+        self.assertEqual(metrics.counter(ERRORS, "MATCH (n) WHERE fail RETURN n"), 1)
+        self.assertEqual(metrics.histogram(COMMIT).total, 0)
+        self.assertEqual(metrics.gauge(OPEN_SESSIONS), 0)
+
+    async def test_sessions_are_only_wrapped_once_enabled(self):
+        (driver, stub) = make_driver(session_pool_max_size=1)
+        async with driver:
+            async with driver.session() as session:
+                self.assertIsInstance(session, Session)
+            metrics = driver.enable_metrics()
+            async with driver.session() as session:
+                self.assertNotIsInstance(session, Session)
+                async with session.begin_transaction() as tx:
+                    await tx.run(READ, names=[]).data()
+
+        self.assertEqual(metrics.histogram(FETCH, FINGERPRINT).total, 1)
@@ -0,0 +1,185 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+import asyncio
+import time
+
+from .. import HAS_NEO4J
+
+if HAS_NEO4J:
+    from aiocypher import Config
+    from aiocypher.aioneo4j.driver import Driver
+    from .stubs import StubDriver, completed_future
+
+    def make_driver(**kwargs):
+        driver = Driver(Config('bolt://localhost:7687', 'neo4j', 'test'), **kwargs)
+        stub = StubDriver()
+        driver._sync_driver = completed_future(stub)
+        return (driver, stub)
+
+
+@unittest.skipUnless(HAS_NEO4J, "Don't test aioneo4j unless neo4j is installed")
+class TestSessionPool(unittest.IsolatedAsyncioTestCase):
+    async def test_unpooled_by_default(self):
+        (driver, stub) = make_driver()
+        async with driver:
+            for _ in range(2):
+                async with driver.session(database="neo4j"):
+                    pass
+
+        self.assertIsNone(driver.session_pool)
+        self.assertEqual(len(stub.sessions), 2)
+
+    async def test_session_is_reused(self):
+        (driver, stub) = make_driver(session_pool_max_size=2)
+        async with driver:
+            async with driver.session(database="neo4j") as first:
+                async with first.begin_transaction() as tx:
+                    await tx.run("CREATE (n)")
+            async with driver.session(database="neo4j") as second:
+                async with second.begin_transaction() as tx:
+                    await tx.run("CREATE (n)")
+            stats = driver.session_pool.stats()
+
+        self.assertIs(first, second)
+        self.assertEqual(len(stub.sessions), 1)
+        self.assertEqual(stub.sessions[0].queries, ["CREATE (n)", "CREATE (n)"])
+        self.assertEqual((stats.hits, stats.misses, stats.creations, stats.waits), (1, 1, 1, 0))
+        self.assertEqual((stats.size, stats.idle), (1, 1))
+        self.assertTrue(stub.sessions[0].closed)
+
+    async def test_sessions_are_only_shared_between_matching_arguments(self):
+        (driver, stub) = make_driver(session_pool_max_size=2)
+        async with driver:
+            async with driver.session(database="neo4j") as first:
+                pass
+            async with driver.session(database="other") as second:
+                pass
+            async with driver.session(bookmarks=["unhashable"]) as third:
+                pass
+            async with driver.session(bookmarks=["unhashable"]) as fourth:
+                pass
+
+        self.assertIsNot(first, second)
+        self.assertIsNot(third, fourth)
+        self.assertEqual([s.kwargs for s in stub.sessions], [
+            {'database': 'neo4j'}, {'database': 'other'}, {'bookmarks': ['unhashable']}, {'bookmarks': ['unhashable']}
+        ])
+
+    async def test_session_is_reused_after_failed_transaction(self):
+        (driver, stub) = make_driver(session_pool_max_size=1)
+        async with driver:
+            with self.assertRaises(ValueError):
+                async with driver.session() as session:
+                    async with session.begin_transaction():
+                        raise ValueError()
+            async with driver.session() as session:
+                pass
+
+        self.assertEqual(len(stub.sessions), 1)
+
+    async def test_waits_when_full(self):
+        (driver, stub) = make_driver(session_pool_max_size=1)
+        order = []
+
+        async def __use(name, delay):
+            async with driver.session() as session:
+                order.append((name, session))
+                await asyncio.sleep(delay)
+
+        async with driver:
+            await asyncio.gather(__use("a", 0.02), __use("b", 0))
+            stats = driver.session_pool.stats()
+
+        self.assertEqual([name for (name, _) in order], ["a", "b"])
+        self.assertIs(order[0][1], order[1][1])
+        self.assertEqual((stats.hits, stats.misses, stats.waits), (1, 1, 1))
+
+    async def test_idle_session_for_other_arguments_is_closed_when_full(self):
+        (driver, stub) = make_driver(session_pool_max_size=1)
+        async with driver:
+            async with driver.session(database="neo4j"):
+                pass
+            async with driver.session(database="other"):
+                pass
+            stats = driver.session_pool.stats()
+
+        self.assertEqual(stats.size, 1)
+        self.assertEqual(len(stub.sessions), 2)
+        self.assertTrue(stub.sessions[0].closed)
+
+    async def test_idle_timeout(self):
+        (driver, stub) = make_driver(session_pool_max_size=3, session_pool_min_size=1, session_pool_idle_timeout=0.01)
+        async with driver:
+            async def __use():
+                async with driver.session():
+                    await asyncio.sleep(0)
+
+            await asyncio.gather(__use(), __use(), __use())
+            self.assertEqual(driver.session_pool.stats().idle, 3)
+            await asyncio.sleep(0.1)
+            stats = driver.session_pool.stats()
+
+        self.assertEqual((stats.size, stats.idle), (1, 1))
+        self.assertEqual(sum(1 for s in stub.sessions if s.closed), 3)
+
+    async def test_unhealthy_session_is_replaced(self):
+        def __check(session):
+            if session.queries:
+                raise ConnectionError()
+
+        (driver, stub) = make_driver(
+            session_pool_max_size=1,
+            session_pool_health_check=__check,
+            session_pool_health_check_after=0)
+        async with driver:
+            async with driver.session() as session:
+                async with session.begin_transaction() as tx:
+                    await tx.run("CREATE (n)")
+            async with driver.session():
+                pass
+            stats = driver.session_pool.stats()
+
+        self.assertEqual(len(stub.sessions), 2)
+        self.assertTrue(stub.sessions[0].closed)
+        self.assertEqual((stats.hits, stats.misses, stats.creations), (0, 2, 2))
+
+    async def test_slow_health_check_does_not_block_other_acquires(self):
+        def __check(session):
+            if session.kwargs.get('database') == "slow":
+                time.sleep(0.2)
+
+        (driver, stub) = make_driver(
+            session_pool_max_size=2,
+            session_pool_health_check=__check,
+            session_pool_health_check_after=0)
+        async with driver:
+            for database in ["slow", "fast"]:
+                async with driver.session(database=database):
+                    pass
+
+            async def __acquire(database):
+                async with driver.session(database=database):
+                    return time.monotonic()
+
+            start = time.monotonic()
+            (slow, fast) = await asyncio.gather(__acquire("slow"), __acquire("fast"))
+
+        self.assertGreaterEqual(slow - start, 0.2)
+        self.assertLess(fast - start, 0.1)
+        self.assertEqual(driver.session_pool.stats().hits, 2)
@@ -0,0 +1,236 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+import asyncio
+
+from .. import HAS_NEO4J
+
+if HAS_NEO4J:
+    from aiocypher.aioneo4j.session import Session
+    from .stubs import StubDriver, StubSummary, completed_future, make_node
+
+
+def _two_names(query, params):
+    return [{'name': 'example'}, {'name': '模範'}]
+
+
+@unittest.skipUnless(HAS_NEO4J, "Don't test aioneo4j unless neo4j is installed")
+class TestResult(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.driver = StubDriver(_two_names)
+        self.session = await Session(completed_future(self.driver)).__aenter__()
+
+    async def asyncTearDown(self):
+        await self.session.__aexit__(None, None, None)
+
+    @property
+    def queries(self):
+        return self.driver.sessions[0].queries
+
+    async def test_query_is_not_run_until_awaited(self):
+        async with self.session.begin_transaction() as tx:
+            tx.run("MATCH (n) RETURN n.name AS name")
+
+        self.assertEqual(self.queries, [])
+
+    async def test_await_then_single_runs_once(self):
+        async with self.session.begin_transaction() as tx:
+            result = tx.run("MATCH (n) RETURN n.name AS name")
+            await result
+            with self.assertWarns(UserWarning):
+                name = await result.single().value()
+
+        self.assertEqual(name, 'example')
+        self.assertEqual(len(self.queries), 1)
+
+    async def test_graph_then_data_runs_once(self):
+        async with self.session.begin_transaction() as tx:
+            result = tx.run("MATCH (n) RETURN n.name AS name")
+            nodes = await result.graph().nodes
+            data = await result.data()
+
+        self.assertEqual(nodes, set())
+        self.assertEqual(data, [{'name': 'example'}, {'name': '模範'}])
+        self.assertEqual(len(self.queries), 1)
+
+    async def test_everything_derived_from_one_run(self):
+        async with self.session.begin_transaction() as tx:
+            result = tx.run("MATCH (n) RETURN n.name AS name")
+            data = await result.data()
+            again = await result.data()
+            summary = await result.consume()
+            with self.assertWarns(UserWarning):
+                record = await result.single().data()
+
+        self.assertEqual(data, again)
+        self.assertEqual(record, {'name': 'example'})
+        self.assertIsInstance(summary, StubSummary)
+        self.assertEqual(len(self.queries), 1)
+
+    async def test_concurrent_access_runs_once(self):
+        async with self.session.begin_transaction() as tx:
+            result = tx.run("MATCH (n) RETURN n.name AS name")
+            (data, summary, _) = await asyncio.gather(result.data(), result.consume(), result)
+
+        self.assertEqual(len(data), 2)
+        self.assertEqual(summary.query, "MATCH (n) RETURN n.name AS name")
+        self.assertEqual(len(self.queries), 1)
+
+    async def test_concurrent_record_access_runs_once(self):
+        async with self.session.begin_transaction() as tx:
+            record = tx.run("MATCH (n) RETURN n.name AS name").single()
+            with self.assertWarns(UserWarning):
+                (data, value) = await asyncio.gather(record.data(), record.value())
+
+        self.assertEqual((data, value), ({'name': 'example'}, 'example'))
+        self.assertEqual(len(self.queries), 1)
+
+    async def test_single_with_no_records(self):
+        self.driver.responder = lambda query, params: []
+        async with Session(completed_future(self.driver)) as session:
+            async with session.begin_transaction() as tx:
+                value = await tx.run("MATCH (n) RETURN n").single().value()
+
+        self.assertIsNone(value)
+
+    async def test_graph_nodes(self):
+        def __nodes(query, params):
+            return [{'n': make_node(None, 1, ['TestNode'], name='example')}]
+
+        self.driver.responder = __nodes
+        async with Session(completed_future(self.driver)) as session:
+            async with session.begin_transaction() as tx:
+                graph = tx.run("MATCH (n) RETURN n").graph()
+                nodes = await graph.nodes
+                relationships = await graph.relationships
+
+        self.assertEqual([n['name'] for n in nodes], ['example'])
+        self.assertEqual(relationships, set())
+        self.assertEqual(len(self.driver.sessions[1].queries), 1)
+
+    async def test_failure_is_reported_to_every_caller_but_run_once(self):
+        def __fail(query, params):
+            raise ValueError(query)
+
+        self.driver.responder = __fail
+        async with Session(completed_future(self.driver)) as session:
+            async with session.begin_transaction() as tx:
+                result = tx.run("MATCH (n) RETURN n")
+                with self.assertRaises(ValueError):
+                    await result.data()
+                with self.assertRaises(ValueError):
+                    await result.single()
+
+        self.assertEqual(len(self.driver.sessions[1].queries), 1)
+
+
+def _count(query, params):
+    return [{'n': n} for n in range(params.get('count', 10))]
+
+
+@unittest.skipUnless(HAS_NEO4J, "Don't test aioneo4j unless neo4j is installed")
+class TestResultStream(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.driver = StubDriver(_count)
+        self.session = await Session(completed_future(self.driver)).__aenter__()
+
+    async def asyncTearDown(self):
+        await self.session.__aexit__(None, None, None)
+
+    async def test_async_for(self):
+        async with self.session.begin_transaction() as tx:
+            result = tx.run("UNWIND range(0, $count - 1) AS n RETURN n", count=2500)
+            values = [record['n'] async for record in result]
+            summary = await result.consume()
+
+        self.assertEqual(values, list(range(2500)))
+        self.assertEqual(summary.query, "UNWIND range(0, $count - 1) AS n RETURN n")
+        self.assertEqual(len(self.driver.sessions[0].queries), 1)
+
+    async def test_read_ahead_is_bounded(self):
+        async with self.session.begin_transaction() as tx:
+            stream = tx.run("UNWIND range(0, 99) AS n RETURN n", count=100).stream(batch_size=5, max_buffered_batches=2)
+            first = await stream.__anext__()
+            await asyncio.sleep(0.05)
+            pulled = self.driver.sessions[0].results[0].pulled
+            rest = [record['n'] async for record in stream]
+
+        self.assertEqual(first['n'], 0)
+        # One batch being consumed, two buffered, and one more read whilst waiting for space
+        self.assertLessEqual(pulled, 20)
+        self.assertEqual(rest, list(range(1, 100)))
+
+    async def test_abandoned_stream_frees_the_session(self):
+        async with self.session.begin_transaction() as tx:
+            stream = tx.run("UNWIND range(0, 99) AS n RETURN n", count=100).stream(batch_size=5, max_buffered_batches=1)
+            async for record in stream:
+                break
+            await stream.aclose()
+            data = await tx.run("RETURN 1 AS n", count=1).data()
+
+        self.assertEqual(data, [{'n': 0}])
+
+    async def test_abandoned_stream_does_not_read_the_remaining_records(self):
+        async with self.session.begin_transaction() as tx:
+            result = tx.run("UNWIND range(0, 99) AS n RETURN n", count=100)
+            stream = result.stream(batch_size=5, max_buffered_batches=1)
+            async for record in stream:
+                break
+            await stream.aclose()
+            with self.assertRaises(RuntimeError):
+                await result.graph()
+
+        self.assertLessEqual(self.driver.sessions[0].results[0].pulled, 15)
+
+    async def test_graph_of_finished_stream(self):
+        async with self.session.begin_transaction() as tx:
+            result = tx.run("UNWIND range(0, 9) AS n RETURN n", count=10)
+            async for record in result.stream(batch_size=5):
+                pass
+            graph = await result.graph()
+
+        self.assertEqual(len(graph.nodes), 0)
+        self.assertEqual(self.driver.sessions[0].results[0].pulled, 10)
+
+    async def test_records_are_not_retained_after_streaming(self):
+        async with self.session.begin_transaction() as tx:
+            result = tx.run("UNWIND range(0, 9) AS n RETURN n")
+            async for record in result:
+                pass
+            with self.assertRaises(RuntimeError):
+                await result.data()
+
+    async def test_stream_of_materialised_result(self):
+        async with self.session.begin_transaction() as tx:
+            result = tx.run("UNWIND range(0, 9) AS n RETURN n")
+            data = await result.data()
+            values = [record['n'] async for record in result]
+
+        self.assertEqual([d['n'] for d in data], values)
+        self.assertEqual(len(self.driver.sessions[0].queries), 1)
+
+    async def test_stream_failure(self):
+        def __fail(query, params):
+            raise ValueError(query)
+
+        self.driver.responder = __fail
+        async with Session(completed_future(self.driver)) as session:
+            async with session.begin_transaction() as tx:
+                with self.assertRaises(ValueError):
+                    async for record in tx.run("RETURN 1"):
+                        pass
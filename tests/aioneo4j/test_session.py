@@ -0,0 +1,169 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+import asyncio
+import time
+from queue import SimpleQueue
+
+from .. import HAS_NEO4J
+
+if HAS_NEO4J:
+    from aiocypher.aioneo4j.session import Session
+    from .stubs import StubDriver, completed_future
+    import neo4j
+
+
+class CountingQueue (SimpleQueue):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def put(self, item, *args, **kwargs):
+        if item is not None:
+            self.batches.append(len(item))
+        super().put(item, *args, **kwargs)
+
+
+@unittest.skipUnless(HAS_NEO4J, "Don't test aioneo4j unless neo4j is installed")
+class TestSession(unittest.IsolatedAsyncioTestCase):
+    async def test_execute_returns_value(self):
+        async with Session(completed_future(StubDriver()), database="neo4j") as session:
+            r = await session._execute(lambda s: s.kwargs['database'])
+
+        self.assertEqual(r, "neo4j")
+
+    async def test_execute_propagates_exception(self):
+        def __raise(s):
+            raise ValueError("Bad")
+
+        async with Session(completed_future(StubDriver())) as session:
+            with self.assertRaises(ValueError):
+                await session._execute(__raise)
+            self.assertEqual(await session._execute(lambda s: 1), 1)
+
+    async def test_execute_outside_context_raises(self):
+        session = Session(completed_future(StubDriver()))
+        with self.assertRaises(RuntimeError):
+            await session._execute(lambda s: None)
+
+    async def test_transaction_run(self):
+        driver = StubDriver(lambda query, params: [{'n': params['n']}])
+        async with Session(completed_future(driver)) as session:
+            async with session.begin_transaction() as tx:
+                data = await tx.run("RETURN $n AS n", n=1).data()
+
+        self.assertEqual(data, [{'n': 1}])
+        self.assertEqual(driver.sessions[0].queries, ["RETURN $n AS n"])
+        self.assertTrue(driver.sessions[0].transactions[0].closed)
+        self.assertTrue(driver.sessions[0].closed)
+
+    async def test_session_open_failure_is_propagated(self):
+        class BrokenDriver (StubDriver):
+            def session(self, **kwargs):
+                raise ConnectionError("No server")
+
+        session = Session(completed_future(BrokenDriver()))
+        await session.__aenter__()
+        with self.assertRaises(ConnectionError):
+            await session._execute(lambda s: None)
+        with self.assertRaises(ConnectionError):
+            await session.__aexit__(None, None, None)
+
+    async def test_cancelled_command_does_not_disturb_later_commands(self):
+        async with Session(completed_future(StubDriver())) as session:
+            slow = asyncio.create_task(session._execute(lambda s: time.sleep(0.05) or "slow"))
+            await asyncio.sleep(0.01)
+            slow.cancel()
+            self.assertEqual(await session._execute(lambda s: "fast"), "fast")
+
+    async def test_round_trips_are_not_paced_by_polling(self):
+        async with Session(completed_future(StubDriver())) as session:
+            start = time.perf_counter()
+            for _ in range(200):
+                await session._execute(lambda s: None)
+            elapsed = time.perf_counter() - start
+
+        # A 10ms polling interval would make this take at least a second
+        self.assertLess(elapsed, 0.5)
+
+    async def test_read_only_transaction_uses_a_read_session(self):
+        driver = StubDriver()
+        async with Session(completed_future(driver), database="neo4j") as session:
+            async with session.begin_transaction() as tx:
+                await tx.run("CREATE (n)")
+            async with session.begin_transaction(read_only=True) as tx:
+                await tx.run("MATCH (n) RETURN n")
+            self.assertFalse(driver.sessions[0].closed)
+
+        self.assertEqual(driver.sessions[0].queries, ["CREATE (n)"])
+        self.assertEqual(driver.sessions[1].queries, ["MATCH (n) RETURN n"])
+        self.assertEqual(driver.sessions[1].kwargs, {'database': "neo4j",
+                                                     'default_access_mode': neo4j.READ_ACCESS,
+                                                     'bookmarks': ["bookmark:1"]})
+        self.assertTrue(driver.sessions[1].closed)
+
+    async def test_read_only_transaction_in_a_read_session(self):
+        driver = StubDriver()
+        async with Session(completed_future(driver), default_access_mode=neo4j.READ_ACCESS) as session:
+            async with session.begin_transaction(read_only=True) as tx:
+                await tx.run("MATCH (n) RETURN n")
+
+        self.assertEqual(len(driver.sessions), 1)
+
+    async def test_unsupported_isolation_level(self):
+        async with Session(completed_future(StubDriver())) as session:
+            async with session.begin_transaction(isolation="read committed"):
+                pass
+            with self.assertRaises(ValueError):
+                session.begin_transaction(isolation="SERIALIZABLE")
+
+
+@unittest.skipUnless(HAS_NEO4J, "Don't test aioneo4j unless neo4j is installed")
+class TestPipelinedSession(unittest.IsolatedAsyncioTestCase):
+    async def test_commands_are_submitted_together(self):
+        driver = StubDriver(lambda query, params: [{'n': params['n']}])
+        session = Session(completed_future(driver), pipelined=True)
+        session._command_queue = CountingQueue()
+        async with session:
+            async with session.begin_transaction() as tx:
+                data = await asyncio.gather(*(tx.run("RETURN $n AS n", n=n).data() for n in range(3)))
+
+        self.assertEqual(data, [[{'n': n}] for n in range(3)])
+        self.assertEqual(driver.sessions[0].queries, ["RETURN $n AS n"] * 3)
+        self.assertEqual(session._command_queue.batches, [1, 3, 1])
+
+    async def test_errors_are_routed_to_their_own_commands(self):
+        def __raise(s):
+            raise ValueError("Bad")
+
+        async with Session(completed_future(StubDriver()), pipelined=True) as session:
+            results = await asyncio.gather(session._execute(lambda s: 1),
+                                           session._execute(__raise),
+                                           session._execute(lambda s: 3),
+                                           return_exceptions=True)
+
+        self.assertEqual(results[0], 1)
+        self.assertIsInstance(results[1], ValueError)
+        self.assertEqual(results[2], 3)
+
+    async def test_pipelined_is_not_passed_to_neo4j(self):
+        driver = StubDriver()
+        async with Session(completed_future(driver), pipelined=True, database="neo4j") as session:
+            await session._execute(lambda s: None)
+
+        self.assertEqual(driver.sessions[0].kwargs, {'database': "neo4j"})
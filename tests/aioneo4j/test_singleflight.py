@@ -0,0 +1,103 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+import asyncio
+import threading
+
+from .. import HAS_NEO4J
+
+if HAS_NEO4J:
+    from aiocypher import Config
+    from aiocypher.aioneo4j.driver import Driver
+    from .stubs import StubDriver, completed_future
+
+    def make_driver(responder):
+        driver = Driver(Config('bolt://localhost:7687', 'neo4j', 'test'))
+        stub = StubDriver(responder)
+        driver._sync_driver = completed_future(stub)
+        return (driver, stub)
+
+
+READ = "MATCH (n:TestNode {name: $name}) RETURN n.name AS name"
+
+
+@unittest.skipUnless(HAS_NEO4J, "Don't test aioneo4j unless neo4j is installed")
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.release = threading.Event()
+
+    def responder(self, query, params):
+        self.release.wait(timeout=5)
+        if params.get('name') == "bad":
+            raise ValueError(query)
+        return [{'name': params['name']}]
+
+    async def test_concurrent_identical_reads_share_one_execution(self):
+        (driver, stub) = make_driver(self.responder)
+        async with driver:
+            singleflight = driver.singleflight()
+            readers = [asyncio.ensure_future(singleflight.data(READ, name="a")) for _ in range(5)]
+            other = asyncio.ensure_future(singleflight.data(READ, name="b"))
+            await asyncio.sleep(0.05)
+            self.release.set()
+            results = await asyncio.gather(*readers)
+            await other
+
+        self.assertEqual(results, [[{'name': 'a'}]] * 5)
+        self.assertEqual(sorted(p['name'] for s in stub.sessions for p in s.parameters), ['a', 'b'])
+        self.assertEqual(singleflight.stats(), (2, 4, 0))
+        self.assertIs(driver.singleflight(), singleflight)
+        self.assertIsNot(driver.singleflight(database="other"), singleflight)
+
+    async def test_equal_parameters_of_different_types_are_not_shared(self):
+        (driver, stub) = make_driver(self.responder)
+        async with driver:
+            singleflight = driver.singleflight()
+            readers = [asyncio.ensure_future(singleflight.data(READ, name=name)) for name in (True, 1)]
+            await asyncio.sleep(0.05)
+            self.release.set()
+            results = await asyncio.gather(*readers)
+
+        self.assertEqual([type(rows[0]['name']) for rows in results], [bool, int])
+        self.assertEqual(singleflight.stats().executions, 2)
+
+    async def test_sequential_reads_are_not_shared(self):
+        self.release.set()
+        (driver, stub) = make_driver(self.responder)
+        async with driver:
+            for _ in range(2):
+                await driver.singleflight().data(READ, name="a")
+
+        self.assertEqual(driver.singleflight().stats().executions, 2)
+
+    async def test_errors_and_cancellation(self):
+        (driver, stub) = make_driver(self.responder)
+        async with driver:
+            singleflight = driver.singleflight()
+            first = asyncio.ensure_future(singleflight.data(READ, name="bad"))
+            second = asyncio.ensure_future(singleflight.data(READ, name="bad"))
+            readers = [asyncio.ensure_future(singleflight.data(READ, name="a")) for _ in range(2)]
+            await asyncio.sleep(0.05)
+            readers[0].cancel()
+            self.release.set()
+            results = await asyncio.gather(first, second, *readers, return_exceptions=True)
+
+        self.assertIsInstance(results[0], Exception)
+        self.assertIsInstance(results[1], Exception)
+        self.assertIsInstance(results[2], asyncio.CancelledError)
+        self.assertEqual(results[3], [{'name': 'a'}])
@@ -0,0 +1,75 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .. import HAS_NEO4J
+
+if HAS_NEO4J:
+    from aiocypher import Config, SessionLimitReached
+    from aiocypher.aioneo4j.driver import Driver
+    from .stubs import StubDriver, completed_future
+
+    def make_driver(**kwargs):
+        driver = Driver(Config('bolt://localhost:7687', 'neo4j', 'test'), **kwargs)
+        driver._sync_driver = completed_future(StubDriver())
+        return driver
+
+
+@unittest.skipUnless(HAS_NEO4J, "Don't test aioneo4j unless neo4j is installed")
+class TestIOThreads(unittest.IsolatedAsyncioTestCase):
+    async def test_sessions_do_not_use_default_executor(self):
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=1))
+
+        async with make_driver() as driver:
+            async with driver.session() as a:
+                async with driver.session() as b:
+                    names = await asyncio.gather(
+                        a._execute(lambda s: threading.current_thread().name),
+                        b._execute(lambda s: threading.current_thread().name))
+                    self.assertEqual(driver.io_threads.open_sessions, 2)
+
+        self.assertTrue(all(name.startswith("aioneo4j") for name in names))
+        self.assertNotEqual(names[0], names[1])
+        self.assertEqual(driver.io_threads.open_sessions, 0)
+
+    async def test_session_limit_with_timeout(self):
+        async with make_driver(max_sessions=1, session_acquire_timeout=0.01) as driver:
+            async with driver.session():
+                with self.assertRaises(SessionLimitReached):
+                    async with driver.session():
+                        pass
+            async with driver.session() as session:
+                self.assertEqual(await session._execute(lambda s: 1), 1)
+
+    async def test_session_limit_queues_without_timeout(self):
+        order = []
+
+        async def __use(driver, name):
+            async with driver.session() as session:
+                order.append(name)
+                await session._execute(lambda s: None)
+                await asyncio.sleep(0.01)
+                order.append(name)
+
+        async with make_driver(max_sessions=1) as driver:
+            await asyncio.wait_for(asyncio.gather(__use(driver, "a"), __use(driver, "b")), 1)
+
+        self.assertEqual(order, ["a", "a", "b", "b"])
@@ -0,0 +1,103 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import threading
+import unittest
+
+from .. import HAS_NEO4J
+
+if HAS_NEO4J:
+    from aiocypher import Config, InMemoryTracer
+    from aiocypher.aioneo4j.driver import Driver
+    from aiocypher.tracing import (
+        SESSION, SESSION_ACQUIRE, TRANSACTION, TRANSACTION_BEGIN, QUERY, FETCH, COMMIT, ROLLBACK,
+        SYSTEM, NAMESPACE, QUERY_TEXT, RETURNED_ROWS, READ_ONLY
+    )
+    from .stubs import StubDriver, completed_future
+
+
+READ = "MATCH (n:TestNode) WHERE n.name IN $names AND n.x = 'literal' RETURN n.name AS name"
+FINGERPRINT = "MATCH (n:TestNode) WHERE n.name IN $names AND n.x = ? RETURN n.name AS name"
+
+
+@unittest.skipUnless(HAS_NEO4J, "Don't test aioneo4j unless neo4j is installed")
+class TestTracing(unittest.IsolatedAsyncioTestCase):
+    def make_driver(self, tracer):
+        def __respond(query, params):
+            # Runs on the IO thread, so this checks that the current span is carried over to it
+            self.current_spans.append((threading.current_thread().name, tracer.current_span))
+            if "fail" in query:
+                raise RuntimeError("Query failed")
+            return [{'name': name} for name in params.get('names', [])]
+
+        self.current_spans = []
+        driver = Driver(Config('bolt://localhost:7687', 'neo4j', 'test'))
+        driver._sync_driver = completed_future(StubDriver(__respond))
+        return driver
+
+    async def test_spans_are_nested(self):
+        tracer = InMemoryTracer()
+        driver = self.make_driver(tracer)
+        self.assertIs(driver.enable_tracing(tracer), tracer)
+        self.assertIs(driver.tracer, tracer)
+        async with driver:
+            async with driver.session(database="graph") as session:
+                async with session.begin_transaction(read_only=True) as tx:
+                    await tx.run(READ, names=["a", "b"]).data()
+                    await tx.run(READ, names=["c"]).single().data()
+                    self.assertEqual(len([row async for row in tx.run(READ, names=["d", "e", "f"]).stream()]), 3)
+                    await tx.run("CREATE (n:TestNode)")
+                    await tx.run_batch("CREATE (n:TestNode {name: row.name})", [{'name': "a"}])
+
+        spans = {span.id: span for span in tracer.spans}
+        self.assertEqual(
+            sorted((span.name, spans[span.parent].name if span.parent else None) for span in tracer.spans),
+            sorted([
+                (SESSION, None), (SESSION_ACQUIRE, SESSION), (TRANSACTION, SESSION),
+                (TRANSACTION_BEGIN, TRANSACTION), (FETCH, TRANSACTION), (FETCH, TRANSACTION), (FETCH, TRANSACTION),
+                (QUERY, TRANSACTION), (QUERY, TRANSACTION), (COMMIT, TRANSACTION)]))
+
+        (session,) = [span for span in tracer.spans if span.name == SESSION]
+        self.assertEqual(session.attributes, {SYSTEM: "neo4j", NAMESPACE: "graph"})
+        (transaction,) = [span for span in tracer.spans if span.name == TRANSACTION]
+        self.assertEqual(transaction.attributes, {READ_ONLY: True})
+        self.assertEqual(
+            [span.attributes for span in tracer.spans if span.name == FETCH],
+            [{QUERY_TEXT: FINGERPRINT, RETURNED_ROWS: n} for n in (2, 1, 3)])
+        self.assertEqual(
+            [span.attributes for span in tracer.spans if span.name == QUERY],
+            [{QUERY_TEXT: "CREATE (n:TestNode)"}, {QUERY_TEXT: "CREATE (n:TestNode {name: row.name})"}])
+
+        queries = [span.id for span in tracer.spans if span.name in (FETCH, QUERY)]
+        self.assertTrue(all(thread.startswith("aioneo4j") for (thread, _) in self.current_spans))
+        self.assertEqual(sorted(span for (_, span) in self.current_spans), sorted(queries))
+
+    async def test_failed_transactions_are_rolled_back(self):
+        tracer = InMemoryTracer()
+        driver = self.make_driver(tracer)
+        driver.enable_tracing(tracer)
+        async with driver:
+            with self.assertRaises(RuntimeError):
+                async with driver.session() as session:
+                    async with session.begin_transaction() as tx:
+                        await tx.run("MATCH (n) WHERE fail RETURN n").data()
+
+        self.assertEqual([span.name for span in tracer.spans if span.error is not None],
+                         [FETCH, TRANSACTION, SESSION])
+        self.assertIn(ROLLBACK, [span.name for span in tracer.spans])
+        self.assertNotIn(COMMIT, [span.name for span in tracer.spans])
+        self.assertIsNone(tracer.current_span)
@@ -0,0 +1,92 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import gc
+import unittest
+
+from .. import HAS_NEO4J
+
+if HAS_NEO4J:
+    from aiocypher.aioneo4j.session import Session
+    from .stubs import StubDriver, completed_future
+
+
+@unittest.skipUnless(HAS_NEO4J, "Don't test aioneo4j unless neo4j is installed")
+class TestRunBatch(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.driver = StubDriver()
+        self.session = await Session(completed_future(self.driver)).__aenter__()
+
+    async def asyncTearDown(self):
+        await self.session.__aexit__(None, None, None)
+
+    async def test_rows_are_sent_in_chunks(self):
+        rows = ({'name': f"node{n}"} for n in range(2500))
+        async with self.session.begin_transaction() as tx:
+            count = await tx.run_batch("CREATE (n:TestNode {name: row.name, source: $source})", rows,
+                                       chunk_size=1000, source="test")
+
+        stub = self.driver.sessions[0]
+        self.assertEqual(count, 2500)
+        self.assertEqual(stub.queries,
+                         ["UNWIND $rows AS row\nCREATE (n:TestNode {name: row.name, source: $source})"] * 3)
+        self.assertEqual([len(p['rows']) for p in stub.parameters], [1000, 1000, 500])
+        self.assertEqual([p['source'] for p in stub.parameters], ["test"] * 3)
+        self.assertEqual([row['name'] for p in stub.parameters for row in p['rows']],
+                         [f"node{n}" for n in range(2500)])
+
+    async def test_no_rows(self):
+        async with self.session.begin_transaction() as tx:
+            count = await tx.run_batch("CREATE (n:TestNode {name: row.name})", [])
+
+        self.assertEqual(count, 0)
+        self.assertEqual(self.driver.sessions[0].queries, [])
+
+    async def test_failure_is_raised(self):
+        def __fail(query, params):
+            if len(params['rows']) < 2:
+                raise ValueError()
+            return []
+
+        driver = StubDriver(__fail)
+        async with Session(completed_future(driver)) as session:
+            with self.assertRaises(ValueError):
+                async with session.begin_transaction() as tx:
+                    await tx.run_batch("CREATE (n:TestNode {name: row.name})", [{'name': 'a'}] * 5, chunk_size=2)
+
+        self.assertEqual(len(driver.sessions[0].queries), 3)
+
+    async def test_chunk_queued_behind_a_failure_is_not_left_running(self):
+        def __fail(query, params):
+            first = params['rows'][0]['n']
+            if first >= 4:
+                raise ValueError(first)
+            return []
+
+        unhandled = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: unhandled.append(context))
+        driver = StubDriver(__fail)
+        async with Session(completed_future(driver)) as session:
+            with self.assertRaises(ValueError) as raised:
+                async with session.begin_transaction() as tx:
+                    await tx.run_batch("CREATE (n:TestNode {n: row.n})", [{'n': n} for n in range(10)], chunk_size=2)
+        gc.collect()
+        await asyncio.sleep(0)
+
+        self.assertEqual(raised.exception.args, (4,))
+        self.assertEqual(unhandled, [])
@@ -0,0 +1,163 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+import os
+
+from ..retry_on_exception import retry_on_exception
+from .. import HAS_PSYCOPG
+
+if HAS_PSYCOPG:
+    import psycopg
+
+    from aiocypher.asyncagensgraph.driver import Driver
+    from aiocypher import Config, QueryFailed
+
+    HOST = os.environ.get('AGENSGRAPH_HOST', 'localhost')
+    PORT = os.environ.get('AGENSGRAPH_PORT', 15432)
+    USER = 'neo4j'
+    PASSWORD = 'test'
+
+    DB = "testdb"
+
+    def make_driver(**kwargs):
+        config = Config(
+            address=f'postgresql+psycopg://{HOST}:{PORT}',
+            username=USER,
+            password=PASSWORD)
+        return Driver(config, **kwargs)
+
+    @retry_on_exception(exception=psycopg.OperationalError)
+    async def _check_db_connection():
+        async with await psycopg.AsyncConnection.connect(
+                f"host={HOST} user={USER} password={PASSWORD} port={PORT}"):
+            # Database is connected, tests can continue
+            pass
+
+    @unittest.skipUnless(HAS_PSYCOPG, "Don't test asyncagensgraph unless psycopg is installed")
+    class TestDriver(unittest.IsolatedAsyncioTestCase):
+        async def asyncSetUp(self):
+            async with await psycopg.AsyncConnection.connect(
+                    f"host={HOST} user={USER} password={PASSWORD} port={PORT}", autocommit=True) as conn:
+                await conn.execute(f"DROP GRAPH IF EXISTS {DB} CASCADE")
+                await conn.execute(f"CREATE GRAPH IF NOT EXISTS {DB}")
+
+        async def asyncTearDown(self):
+            async with await psycopg.AsyncConnection.connect(
+                    f"host={HOST} user={USER} password={PASSWORD} port={PORT}", autocommit=True) as conn:
+                await conn.execute(f"DROP GRAPH IF EXISTS {DB} CASCADE")
+
+        async def test_driver_session_transaction_run_result_manual_access_to_underlying_cursor(self):
+            async with make_driver() as UUT:
+                async with UUT.session(database=DB) as session:
+                    async with session.begin_transaction() as tx:
+                        await tx.run("CREATE (:v {name: 'AgensGraph'})")
+                        cur = await tx.run("MATCH (n) RETURN n")
+                        v = (await cur.fetchone())[0]
+            self.assertEqual(v, {'type': 'vertex', 'label': 'v', 'vid': '3.1', 'name': 'AgensGraph'})
+
+        async def test_driver_session_transaction_run_result_single_value(self):
+            async with make_driver() as UUT:
+                async with UUT.session(database=DB) as session:
+                    async with session.begin_transaction() as tx:
+                        await tx.run("CREATE (:v {name: $name})", name='AgensGraph')
+                        node = await tx.run("MATCH (n) RETURN n").single().value()
+            self.assertEqual('AgensGraph', node['name'])
+
+        async def test_driver_session_transaction_run_result_async_for(self):
+            async with make_driver() as UUT:
+                async with UUT.session(database=DB) as session:
+                    async with session.begin_transaction() as tx:
+                        await tx.run("CREATE (:v {name: 'AgensGraph'})")
+                        await tx.run("CREATE (:v {name: 'Cypher'})")
+                        rows = [row async for row in tx.run("MATCH (n) RETURN n").stream(batch_size=1)]
+            self.assertCountEqual([row[0]['name'] for row in rows], ['AgensGraph', 'Cypher'])
+
+        async def test_driver_session_transaction_run_batch(self):
+            async with make_driver() as UUT:
+                async with UUT.session(database=DB) as session:
+                    async with session.begin_transaction() as tx:
+                        count = await tx.run_batch("CREATE (:v {name: row.name})",
+                                                   ({'name': f"node{n}"} for n in range(5)),
+                                                   chunk_size=2)
+                        rows = await tx.run("MATCH (n:v) RETURN n").graph()
+            self.assertEqual(count, 5)
+            self.assertCountEqual([row[0]['name'] for row in rows], [f"node{n}" for n in range(5)])
+
+        async def test_driver_session_transaction_run_result_graph_relationships(self):
+            async with make_driver() as UUT:
+                async with UUT.session(database=DB) as session:
+                    async with session.begin_transaction() as tx:
+                        await tx.run("CREATE (:v {name: 'a'})-[:e {weight: 1}]->(:v {name: 'b'})")
+                        graph = tx.run("MATCH p = (:v)-[:e]->(:v) RETURN p").graph()
+                        relationships = await graph.relationships
+            self.assertEqual([r.type for r in relationships], ['e'])
+            self.assertEqual(list(relationships)[0]['weight'], 1)
+
+        async def test_driver_graph_path_is_set_once_per_connection(self):
+            async with make_driver() as UUT:
+                async with UUT.session(database=DB) as session:
+                    conn = await session
+                    for name in ['AgensGraph', 'Cypher']:
+                        async with session.begin_transaction() as tx:
+                            await tx.run(f"CREATE (:v {{name: '{name}'}})")
+                    self.assertEqual(UUT._state._graph_paths[conn], DB)
+                    self.assertIn(DB, UUT._state._graphs)
+                async with UUT.session(database=DB) as session:
+                    async with session.begin_transaction() as tx:
+                        names = [row[0]['name'] for row in await tx.run("MATCH (n:v) RETURN n").graph()]
+            self.assertCountEqual(names, ['AgensGraph', 'Cypher'])
+
+        async def test_driver_session_read_only_transaction(self):
+            async with make_driver() as UUT:
+                async with UUT.session(database=DB) as session:
+                    async with session.begin_transaction(isolation="REPEATABLE READ") as tx:
+                        await tx.run("CREATE (:v {name: 'AgensGraph'})")
+                    async with session.begin_transaction(read_only=True, isolation="READ COMMITTED") as tx:
+                        node = await tx.run("MATCH (n) RETURN n").single().value()
+                    with self.assertRaises(Exception):
+                        async with session.begin_transaction(read_only=True) as tx:
+                            await tx.run("CREATE (:v {name: 'Cypher'})")
+                    with self.assertRaises(ValueError):
+                        session.begin_transaction(isolation="SNAPSHOT")
+            self.assertEqual('AgensGraph', node['name'])
+
+        async def test_driver_session_failed_transaction_is_rolled_back(self):
+            async with make_driver() as UUT:
+                async with UUT.session(database=DB) as session:
+                    with self.assertRaises(QueryFailed):
+                        async with session.begin_transaction() as tx:
+                            await tx.run("CREATE (:v {name: 'AgensGraph'})")
+                            await tx.run("MATCH (n) RETURN n.name / 0").data()
+                    async with session.begin_transaction() as tx:
+                        data = await tx.run("MATCH (n:v) RETURN n").data()
+            self.assertEqual(data, [])
+
+        async def test_driver_session_transaction_run_result_data(self):
+            async with make_driver() as UUT:
+                async with UUT.session(database=DB) as session:
+                    async with session.begin_transaction() as tx:
+                        await tx.run("CREATE (:v {name: 'AgensGraph'})")
+                        data = await tx.run("MATCH (n:v) RETURN n, n.name AS name").data()
+            self.assertEqual(data, [{'n': {'name': 'AgensGraph'}, 'name': 'AgensGraph'}])
+
+        async def test_driver_pool_stats(self):
+            async with make_driver(minsize=1, maxsize=2) as UUT:
+                async with UUT.session(database=DB):
+                    stats = UUT.pool_stats()
+            self.assertGreaterEqual(stats.size, 1)
+            self.assertEqual(stats.acquire_latency.total, 1)
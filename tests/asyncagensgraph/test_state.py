@@ -0,0 +1,104 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import asyncio
+import unittest
+
+from .. import HAS_PSYCOPG
+
+if HAS_PSYCOPG:
+    from async_generator import asynccontextmanager
+    from async_exit_stack import AsyncExitStack
+    from psycopg_pool import PoolTimeout
+
+    from aiocypher import PoolAcquireTimeout, SessionLimitReached
+    from aiocypher.asyncagensgraph.state import DriverState
+
+
+class StubPool (object):
+    """Stands in for a psycopg_pool.AsyncConnectionPool which has a single connection"""
+    def __init__(self):
+        self.max_size = 1
+        self.timeout = 30.0
+        self._lock = asyncio.Lock()
+
+    def get_stats(self):
+        return {'pool_size': 1, 'pool_available': 0 if self._lock.locked() else 1}
+
+    @asynccontextmanager
+    async def connection(self, timeout=None):
+        try:
+            await asyncio.wait_for(self._lock.acquire(), timeout)
+        except asyncio.TimeoutError:
+            raise PoolTimeout() from None
+        try:
+            yield "connection"
+        finally:
+            self._lock.release()
+
+
+class StubConnection (object):
+    """Stands in for a psycopg.AsyncConnection, recording the statements executed on it"""
+    def __init__(self):
+        self.queries = []
+
+    async def execute(self, query):
+        self.queries.append(query if isinstance(query, str) else query.as_string(None))
+
+
+@unittest.skipUnless(HAS_PSYCOPG, "Don't test asyncagensgraph unless psycopg is installed")
+class TestUseGraph(unittest.IsolatedAsyncioTestCase):
+    async def test_graph_name_is_quoted_to_keep_its_case(self):
+        state = DriverState()
+        connection = StubConnection()
+        for _ in range(2):
+            await state.use_graph(connection, "MyGraph")
+
+        self.assertEqual(connection.queries, ['CREATE GRAPH IF NOT EXISTS "MyGraph"', 'SET graph_path = "MyGraph"'])
+
+
+@unittest.skipUnless(HAS_PSYCOPG, "Don't test asyncagensgraph unless psycopg is installed")
+class TestAcquire(unittest.IsolatedAsyncioTestCase):
+    async def test_only_sessions_finding_no_free_connection_are_waiters(self):
+        state = DriverState()
+        pool = StubPool()
+        async with AsyncExitStack() as first:
+            await state.acquire(pool, first)
+            self.assertEqual(state.waiters, 0)
+            async with AsyncExitStack() as second:
+                waiting = asyncio.ensure_future(state.acquire(pool, second))
+                await asyncio.sleep(0.01)
+                self.assertEqual(state.waiters, 1)
+                await first.aclose()
+                self.assertEqual(await waiting, "connection")
+
+        self.assertEqual(state.waiters, 0)
+        self.assertEqual(state.acquire_latency.snapshot().total, 2)
+
+    async def test_timeouts_are_counted_separately(self):
+        state = DriverState(acquire_timeout=0.01)
+        pool = StubPool()
+        async with AsyncExitStack() as first:
+            await state.acquire(pool, first)
+            with self.assertRaises(PoolAcquireTimeout) as raised:
+                async with AsyncExitStack() as second:
+                    await state.acquire(pool, second)
+
+        self.assertIsInstance(raised.exception, SessionLimitReached)
+        self.assertIn("1 pooled connections", str(raised.exception))
+        self.assertEqual((state.acquire_timeouts, state.waiters), (1, 0))
+        self.assertEqual(state.acquire_latency.snapshot().total, 1)
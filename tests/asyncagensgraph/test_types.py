@@ -0,0 +1,90 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+
+from .. import HAS_PSYCOPG
+
+if HAS_PSYCOPG:
+    import psycopg
+    from psycopg.adapt import AdaptersMap, Transformer
+    from psycopg.pq import Format
+
+    from aiocypher.asyncagensgraph.types import parse_vertex, parse_edge, parse_path, register_graph_types
+    from aiocypher.asyncagensgraph.driver import Driver
+    from aiocypher import Config, Driver as AbstractDriver
+
+
+@unittest.skipUnless(HAS_PSYCOPG, "Don't test asyncagensgraph unless psycopg is installed")
+class TestGraphTypes(unittest.TestCase):
+    def test_parse_vertex(self):
+        self.assertEqual(
+            parse_vertex('person[3.1]{"name": "Alice [the first]", "tags": [1, 2]}'),
+            {'type': 'vertex', 'label': 'person', 'vid': '3.1', 'name': 'Alice [the first]', 'tags': [1, 2]})
+
+    def test_parse_edge(self):
+        self.assertEqual(
+            parse_edge('knows[4.1][3.1,3.2]{"since": 2001}'),
+            {
+                'type': 'edge',
+                'label': 'knows',
+                'eid': '4.1',
+                'source_vid': '3.1',
+                'destination_vid': '3.2',
+                'since': 2001
+            })
+
+    def test_parse_path(self):
+        path = parse_path(
+            '[person[3.1]{"name": "a,]b\\"c"},knows[4.1][3.1,3.2]{"at": {"x": [1, 2]}},person[3.2]{}]')
+        self.assertEqual(path['type'], 'path')
+        self.assertEqual([v['vid'] for v in path['vertices']], ['3.1', '3.2'])
+        self.assertEqual(path['vertices'][0]['name'], 'a,]b"c')
+        self.assertEqual(path['edges'], [parse_edge('knows[4.1][3.1,3.2]{"at": {"x": [1, 2]}}')])
+
+    def test_registered_loaders(self):
+        adapters = AdaptersMap(psycopg.adapters)
+        register_graph_types(adapters)
+        transformer = Transformer(adapters)
+        self.assertEqual(
+            transformer.get_loader(7012, Format.TEXT).load(b'v[3.1]{"a": 1}'),
+            {'type': 'vertex', 'label': 'v', 'vid': '3.1', 'a': 1})
+        edges = transformer.get_loader(7021, Format.TEXT).load(b'{"e[4.1][3.1,3.2]{\\"a\\": 1}","e[4.2][3.1,3.2]{}"}')
+        self.assertEqual([edge['eid'] for edge in edges], ['4.1', '4.2'])
+        self.assertEqual(edges[0]['a'], 1)
+
+    def test_parse_malformed(self):
+        with self.assertRaises(ValueError):
+            parse_vertex('person{}')
+        with self.assertRaises(ValueError):
+            parse_edge('knows[4.1]{}')
+        with self.assertRaises(ValueError):
+            parse_path('person[3.1]{}')
+
+
+@unittest.skipUnless(HAS_PSYCOPG, "Don't test asyncagensgraph unless psycopg is installed")
+class TestDriverSelection(unittest.TestCase):
+    def test_psycopg_scheme_selects_driver(self):
+        config = Config(address='postgresql+psycopg://localhost:5432/mydb?maxsize=3', username='u', password='p')
+        driver = AbstractDriver(config)
+        self.assertIsInstance(driver, Driver)
+        self.assertEqual(driver.pool_settings.maxsize, 3)
+        self.assertEqual(driver.pool_settings.dbname, 'mydb')
+
+    def test_postgresql_scheme_does_not_select_driver(self):
+        config = Config(address='postgresql://localhost:5432', username='u', password='p')
+        self.assertNotIsInstance(AbstractDriver(config), Driver)
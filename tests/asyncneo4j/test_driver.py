@@ -0,0 +1,121 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+import os
+
+from .. import HAS_ASYNC_NEO4J
+
+if HAS_ASYNC_NEO4J:
+    import aiocypher
+    from aiocypher import Config
+    from aiocypher.asyncneo4j.driver import Driver
+
+    HOST = os.environ.get('NEO4J_HOST', 'localhost')
+    PORT = os.environ.get('NEO4J_PORT', 17687)
+    USER = 'neo4j'
+    PASSWORD = 'test'
+
+    DB = "neo4j"
+
+    def make_driver():
+        config = Config(
+            address=f'bolt+async://{HOST}:{PORT}',
+            username=USER,
+            password=PASSWORD)
+        return Driver(config)
+
+
+@unittest.skipUnless(HAS_ASYNC_NEO4J, "Don't test asyncneo4j unless neo4j 5 or later is installed")
+class TestAddressSelection(unittest.TestCase):
+    def test_async_suffix_selects_asyncneo4j(self):
+        for address in ('bolt+async://localhost:7687', 'neo4j+async://localhost', 'neo4j+s+async://example.com'):
+            with self.subTest(address=address):
+                self.assertIsInstance(aiocypher.Driver(Config(address, USER, PASSWORD)), Driver)
+
+    def test_plain_scheme_selects_aioneo4j(self):
+        for address in ('bolt://localhost:7687', 'neo4j+s://example.com'):
+            with self.subTest(address=address):
+                self.assertIsInstance(aiocypher.Driver(Config(address, USER, PASSWORD)), aiocypher.aioneo4j.Driver)
+
+    def test_async_suffix_is_removed_from_address(self):
+        driver = aiocypher.Driver(Config('neo4j+s+async://example.com:7687', USER, PASSWORD))
+        self.assertEqual(driver.async_driver.encrypted, True)
+
+
+@unittest.skipUnless(HAS_ASYNC_NEO4J, "Don't test asyncneo4j unless neo4j 5 or later is installed")
+class TestDriver(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        async with make_driver() as driver:
+            async with driver.session(database=DB) as session:
+                async with session.begin_transaction() as tx:
+                    await tx.run("MATCH (n)\nDETACH DELETE n")
+
+    async def test_basic_query(self):
+        async with make_driver() as driver:
+            async with driver.session(database=DB) as session:
+                async with session.begin_transaction() as tx:
+                    await tx.run("CREATE(n:TestNode{name:'example'})")
+
+                async with session.begin_transaction() as tx:
+                    name = await tx.run("MATCH(n:TestNode) RETURN n.name").single().value()
+
+        self.assertEqual("example", name)
+
+    async def test_result_data(self):
+        async with make_driver() as driver:
+            async with driver.session(database=DB) as session:
+                async with session.begin_transaction() as tx:
+                    await tx.run("CREATE(n:TestNode{name:'example', potato:'desirée'})")
+
+                async with session.begin_transaction() as tx:
+                    data = await tx.run("MATCH(n:TestNode) RETURN n").data()
+
+        self.assertEqual(data, [{'n': {'name': 'example', 'potato': 'desirée'}}])
+
+    async def test_graph_nodes_and_relationships(self):
+        async with make_driver() as driver:
+            async with driver.session(database=DB) as session:
+                async with session.begin_transaction() as tx:
+                    await tx.run("""\
+CREATE (a:TestNode{name:'example'})-[:Translation {lang:'ja'}]->(b:TestNode{name:'模範'})""")
+
+                async with session.begin_transaction() as tx:
+                    graph = tx.run("MATCH (a:TestNode)-[r:Translation]-(b:TestNode) RETURN a,r,b").graph()
+                    nodes = await graph.nodes
+                    rels = await graph.relationships
+
+        self.assertCountEqual([n['name'] for n in nodes], ['example', '模範'])
+        self.assertEqual(len(rels), 1)
+        rel = next(iter(rels))
+        self.assertEqual(rel.type, 'Translation')
+        self.assertEqual(rel.start_node['name'], 'example')
+        self.assertEqual(rel.end_node['name'], '模範')
+
+    async def test_read_only_transaction_sees_earlier_writes(self):
+        async with make_driver() as driver:
+            async with driver.session(database=DB) as session:
+                async with session.begin_transaction() as tx:
+                    await tx.run("CREATE(n:TestNode{name:'example'})")
+
+                async with session.begin_transaction(read_only=True) as tx:
+                    name = await tx.run("MATCH(n:TestNode) RETURN n.name").single().value()
+
+                with self.assertRaises(ValueError):
+                    session.begin_transaction(isolation="SERIALIZABLE")
+
+        self.assertEqual("example", name)
@@ -0,0 +1,77 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+
+from .. import HAS_ASYNC_NEO4J
+
+if HAS_ASYNC_NEO4J:
+    import neo4j
+    from aiocypher.asyncneo4j.result import Result
+
+
+class StubAsyncResult (object):
+    """Stands in for a neo4j.AsyncResult. Like the real one, graph() pulls every remaining record into a buffer."""
+    def __init__(self, count: int):
+        self._records = [neo4j.Record({'n': n}) for n in range(count)]
+        self._buffered = 0
+        self.pulled = 0
+
+    async def fetch(self, n: int):
+        batch = self._records[:n]
+        del self._records[:n]
+        self.pulled += max(0, len(batch) - self._buffered)
+        self._buffered = max(0, self._buffered - len(batch))
+        return batch
+
+    async def graph(self):
+        self.pulled += len(self._records) - self._buffered
+        self._buffered = len(self._records)
+        return neo4j.graph.Graph()
+
+    async def consume(self):
+        self._records = []
+        return None
+
+
+@unittest.skipUnless(HAS_ASYNC_NEO4J, "Don't test asyncneo4j unless neo4j 5 is installed")
+class TestResultStream(unittest.IsolatedAsyncioTestCase):
+    def result(self, count):
+        stub = StubAsyncResult(count)
+
+        async def __run():
+            return stub
+        return (stub, Result(__run()))
+
+    async def test_abandoned_stream_does_not_read_the_remaining_records(self):
+        (stub, result) = self.result(100)
+        stream = result.stream(batch_size=5)
+        async for record in stream:
+            break
+        await stream.aclose()
+
+        self.assertEqual(stub.pulled, 5)
+        with self.assertRaises(RuntimeError):
+            await result.graph()
+
+    async def test_graph_of_finished_stream(self):
+        (stub, result) = self.result(10)
+        values = [record['n'] async for record in result.stream(batch_size=5)]
+
+        self.assertEqual(values, list(range(10)))
+        self.assertEqual(stub.pulled, 10)
+        self.assertIsInstance(await result.graph(), neo4j.graph.Graph)
@@ -0,0 +1,111 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+from unittest import mock
+
+from aiocypher.cache import QueryCache
+
+
+class TestQueryCache(unittest.TestCase):
+    def put(self, cache, query, value, **params):
+        cache.put(cache.key(query, params), cache.tags(query), value, cache.clock)
+
+    def get(self, cache, query, **params):
+        return cache.get(cache.key(query, params))
+
+    def test_hit_and_miss(self):
+        cache = QueryCache()
+        self.assertEqual(self.get(cache, "MATCH (n:A) RETURN n", x=1), (False, None))
+        self.put(cache, "MATCH (n:A) RETURN n", [{'n': 1}], x=1)
+        self.assertEqual(self.get(cache, "MATCH  (n:A)\n RETURN n", x=1), (True, [{'n': 1}]))
+        self.assertEqual(self.get(cache, "MATCH (n:A) RETURN n", x=2), (False, None))
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (1, 2, 1))
+
+    def test_scope_is_part_of_the_key(self):
+        cache = QueryCache()
+        self.assertNotEqual(cache.key("MATCH (n) RETURN n", {}, {'database': 'a'}),
+                            cache.key("MATCH (n) RETURN n", {}, {'database': 'b'}))
+        self.assertEqual(cache.key("RETURN $x", {'x': [1, {'a': 2}]}), cache.key("RETURN $x", {'x': [1, {'a': 2}]}))
+
+    def test_equal_values_of_different_types_are_different_keys(self):
+        cache = QueryCache()
+        self.put(cache, "RETURN $x", 'bool', x=True)
+        self.assertEqual(self.get(cache, "RETURN $x", x=1), (False, None))
+        self.assertEqual(self.get(cache, "RETURN $x", x=1.0), (False, None))
+        self.assertEqual(self.get(cache, "RETURN $x", x=[True]), (False, None))
+        self.assertEqual(self.get(cache, "RETURN $x", x=True), (True, 'bool'))
+
+    def test_least_recently_used_is_evicted(self):
+        cache = QueryCache(max_entries=2)
+        for n in range(2):
+            self.put(cache, "RETURN $n", n, n=n)
+        self.get(cache, "RETURN $n", n=0)
+        self.put(cache, "RETURN $n", 2, n=2)
+        self.assertEqual(self.get(cache, "RETURN $n", n=0), (True, 0))
+        self.assertEqual(self.get(cache, "RETURN $n", n=1), (False, None))
+        self.assertEqual(cache.stats().evictions, 1)
+
+    def test_size_is_bounded(self):
+        cache = QueryCache(max_bytes=2000)
+        self.put(cache, "RETURN 1", "x" * 1500)
+        self.put(cache, "RETURN 2", "y" * 1500)
+        self.put(cache, "RETURN 3", "z" * 5000)
+        stats = cache.stats()
+        self.assertEqual((stats.entries, stats.evictions), (1, 1))
+        self.assertLessEqual(stats.size, 2000)
+        self.assertEqual(self.get(cache, "RETURN 2"), (True, "y" * 1500))
+
+    def test_entries_expire(self):
+        cache = QueryCache(ttl=10)
+        with mock.patch('time.monotonic', return_value=100.0):
+            self.put(cache, "RETURN 1", 1)
+        with mock.patch('time.monotonic', return_value=105.0):
+            self.assertEqual(self.get(cache, "RETURN 1"), (True, 1))
+        with mock.patch('time.monotonic', return_value=111.0):
+            self.assertEqual(self.get(cache, "RETURN 1"), (False, None))
+        self.assertEqual(cache.stats().expirations, 1)
+
+    def test_invalidation_by_tag(self):
+        cache = QueryCache()
+        self.put(cache, "MATCH (n:A) RETURN n", 'a')
+        self.put(cache, "MATCH (n:B) RETURN n", 'b')
+        self.put(cache, "MATCH (n) RETURN n", 'all')
+        cache.invalidate({'A'})
+        self.assertEqual(self.get(cache, "MATCH (n:A) RETURN n"), (False, None))
+        self.assertEqual(self.get(cache, "MATCH (n:B) RETURN n"), (True, 'b'))
+        self.assertEqual(self.get(cache, "MATCH (n) RETURN n"), (False, None))
+        self.assertEqual(cache.stats().invalidations, 2)
+        cache.invalidate_all()
+        self.assertEqual(cache.stats().entries, 0)
+
+    def test_result_read_before_an_invalidation_is_not_stored(self):
+        cache = QueryCache()
+        query = "MATCH (n:A) RETURN n"
+        since = cache.clock
+        cache.invalidate({'A'})
+        cache.put(cache.key(query, {}), cache.tags(query), 'stale', since)
+        self.assertEqual(self.get(cache, query), (False, None))
+
+        since = cache.clock
+        cache.invalidate({'B'})
+        cache.put(cache.key(query, {}), cache.tags(query), 'fresh', since)
+        self.assertEqual(self.get(cache, query), (True, 'fresh'))
+
+    def test_unhashable_parameters_are_not_cached(self):
+        self.assertIsNone(QueryCache().key("RETURN $x", {'x': bytearray(b'x')}))
@@ -0,0 +1,68 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+
+from aiocypher.internal.cypher import (
+    parameter_names, substitute_parameters, normalise_query, query_labels, is_write_query, query_fingerprint,
+    pattern_map_parameters)
+
+
+class TestParameters(unittest.TestCase):
+    QUERY = ("MATCH (n {id: $id, s: '$a', t: \"x\\\"$b\"}) // $c\n"
+             "/* $d */ SET n.v = $$e, n.w = $w RETURN n.`$f`")
+
+    def test_parameter_names(self):
+        self.assertEqual(parameter_names(self.QUERY), {"id", "w"})
+
+    def test_substitute_parameters(self):
+        self.assertEqual(
+            substitute_parameters(self.QUERY, lambda name: f"row.{name}" if name == "id" else None),
+            ("MATCH (n {id: row.id, s: '$a', t: \"x\\\"$b\"}) // $c\n"
+             "/* $d */ SET n.v = $$e, n.w = $w RETURN n.`$f`"))
+
+
+class TestQueryAnalysis(unittest.TestCase):
+    QUERY = ("MATCH (n:Person {name: 'a  :Fake'})-[r:KNOWS|:LIKES]->(m:`My Label`) // CREATE\n"
+             "  WHERE n.x = $y   /* DELETE */ RETURN n.set, $create")
+
+    def test_normalise_query(self):
+        self.assertEqual(
+            normalise_query(self.QUERY),
+            "MATCH (n:Person {name: 'a  :Fake'})-[r:KNOWS|:LIKES]->(m:`My Label`) WHERE n.x = $y RETURN n.set, $create")
+
+    def test_query_labels(self):
+        self.assertEqual(query_labels(self.QUERY), {"Person", "KNOWS", "LIKES", "My Label"})
+
+    def test_is_write_query(self):
+        self.assertFalse(is_write_query(self.QUERY))
+        self.assertFalse(is_write_query("MATCH (n) WHERE n.name = 'SET' RETURN n"))
+        for query in ["CREATE (n)", "MATCH (n) SET n.x = 1", "merge (n:A)", "MATCH (n) DETACH DELETE n",
+                      "CALL db.labels()"]:
+            self.assertTrue(is_write_query(query), query)
+
+    def test_query_fingerprint(self):
+        self.assertEqual(
+            query_fingerprint(
+                "MATCH (n:Label2 {name: 'x', age: 42})\n WHERE n.v > 1.5 AND n.`a 1` = $p1 RETURN n LIMIT 10"),
+            "MATCH (n:Label2 {name: ?, age: ?}) WHERE n.v > ? AND n.`a 1` = $p1 RETURN n LIMIT ?")
+
+    def test_pattern_map_parameters(self):
+        self.assertEqual(pattern_map_parameters("CREATE (n:Person:`A b` $props)-[:KNOWS $rel]->(m)"), {"props", "rel"})
+        for query in ["CREATE (n:Person {name: $name})", "MATCH (n) WHERE (n.x IN $list) RETURN size($list)",
+                      "CREATE (n {s: '(n $x)'})"]:
+            self.assertEqual(pattern_map_parameters(query), frozenset(), query)
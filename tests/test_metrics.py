@@ -0,0 +1,60 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+
+from aiocypher.metrics import InMemoryMetrics, FETCH, ROWS, OPEN_SESSIONS
+
+
+class TestInMemoryMetrics(unittest.TestCase):
+    def test_metrics_are_kept_per_query(self):
+        metrics = InMemoryMetrics(buckets=[0.1, 1.0])
+        metrics.observe(FETCH, 0.05, "a")
+        metrics.observe(FETCH, 0.5, "a")
+        metrics.observe(FETCH, 5.0, "b")
+        metrics.increment(ROWS, 3, "a")
+        metrics.increment(ROWS, 2, "a")
+        metrics.adjust_gauge(OPEN_SESSIONS, 2)
+        metrics.adjust_gauge(OPEN_SESSIONS, -1)
+
+        self.assertEqual(metrics.histogram(FETCH, "a").counts, (1, 1, 0))
+        self.assertEqual(metrics.histogram(FETCH, "b").counts, (0, 0, 1))
+        self.assertEqual(metrics.histogram(FETCH, "c").total, 0)
+        self.assertEqual(metrics.counter(ROWS, "a"), 5)
+        self.assertEqual(metrics.counter(ROWS, "b"), 0)
+        self.assertEqual(metrics.gauge(OPEN_SESSIONS), 1)
+
+    def test_render(self):
+        metrics = InMemoryMetrics(buckets=[0.1, 1.0])
+        metrics.observe(FETCH, 0.05, 'MATCH (n {name: ?}) WHERE n.x = "\\\\" RETURN n')
+        metrics.observe(FETCH, 0.5, 'MATCH (n {name: ?}) WHERE n.x = "\\\\" RETURN n')
+        metrics.increment(ROWS, 2, "MATCH (n) RETURN n")
+        metrics.set_gauge(OPEN_SESSIONS, 3)
+
+        label = 'query="MATCH (n {name: ?}) WHERE n.x = \\"\\\\\\\\\\" RETURN n"'
+        self.assertEqual(metrics.render(), "".join(line + "\n" for line in [
+            '# TYPE aiocypher_fetch_seconds histogram',
+            'aiocypher_fetch_seconds_bucket{' + label + ',le="0.1"} 1',
+            'aiocypher_fetch_seconds_bucket{' + label + ',le="1"} 2',
+            'aiocypher_fetch_seconds_bucket{' + label + ',le="+Inf"} 2',
+            'aiocypher_fetch_seconds_sum{' + label + '} 0.55',
+            'aiocypher_fetch_seconds_count{' + label + '} 2',
+            '# TYPE aiocypher_rows_total counter',
+            'aiocypher_rows_total{query="MATCH (n) RETURN n"} 2',
+            '# TYPE aiocypher_open_sessions gauge',
+            'aiocypher_open_sessions 3',
+        ]))
@@ -0,0 +1,44 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+
+from aiocypher.internal.stats import Histogram
+
+
+class TestHistogram(unittest.TestCase):
+    def test_observations_are_counted_into_buckets(self):
+        histogram = Histogram(buckets=[1.0, 2.0, 5.0])
+        for value in [0.5, 1.0, 1.5, 3.0, 10.0]:
+            histogram.observe(value)
+        snapshot = histogram.snapshot()
+
+        self.assertEqual(snapshot.buckets, (1.0, 2.0, 5.0))
+        self.assertEqual(snapshot.counts, (2, 1, 1, 1))
+        self.assertEqual(snapshot.total, 5)
+        self.assertEqual(snapshot.sum, 16.0)
+
+    def test_quantile(self):
+        histogram = Histogram(buckets=[1.0, 2.0, 5.0])
+        self.assertEqual(histogram.snapshot().quantile(0.5), 0.0)
+        for value in [0.5, 0.5, 1.5, 3.0, 10.0]:
+            histogram.observe(value)
+        snapshot = histogram.snapshot()
+
+        self.assertEqual(snapshot.quantile(0.4), 1.0)
+        self.assertEqual(snapshot.quantile(0.6), 2.0)
+        self.assertEqual(snapshot.quantile(1.0), float('inf'))
@@ -0,0 +1,45 @@
+#
+#
+# Copyright 2020-21 British Broadcasting Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import unittest
+
+from aiocypher.tracing import InMemoryTracer
+
+
+class TestInMemoryTracer(unittest.TestCase):
+    def test_spans_are_nested(self):
+        tracer = InMemoryTracer()
+        with tracer.start_as_current_span("outer", attributes={'a': 1}) as outer:
+            outer.set_attribute('b', 2)
+            with tracer.start_as_current_span("inner"):
+                inner = tracer.current_span
+        self.assertIsNone(tracer.current_span)
+
+        ((name, id, parent, attributes, start, end, error), outer_span) = tracer.spans
+        self.assertEqual((name, id, parent, attributes, error), ("inner", inner, outer_span.id, {}, None))
+        self.assertEqual((outer_span.name, outer_span.parent, outer_span.attributes), ("outer", None, {'a': 1, 'b': 2}))
+        self.assertLessEqual(outer_span.start, start)
+        self.assertLessEqual(end, outer_span.end)
+
+    def test_errors_are_recorded(self):
+        tracer = InMemoryTracer()
+        error = RuntimeError()
+        with self.assertRaises(RuntimeError):
+            with tracer.start_as_current_span("span"):
+                raise error
+
+        self.assertIs(tracer.spans[0].error, error)